@@ -0,0 +1,67 @@
+from typing import Any, Awaitable, Callable, Iterable
+
+import asyncio
+import threading
+
+
+class BoundedScheduler:
+    """
+    Runs an async worker over every item of a (possibly paginated) iterable with a limited number of workers in flight.
+    Items are listed on a separate thread while workers run, so the first page is processed while the next one loads,
+    and listing pauses whenever every worker is busy so only a handful of items are held in memory at a time.
+    """
+
+    def __init__(self, max_in_flight: int) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+
+
+    async def run(self, items: Iterable, worker: Callable[[int, Any], Awaitable[None]]) -> None:
+        """
+        Awaits worker(order, item) for every item, order being the item's position in the iterable
+        """
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.max_in_flight)
+        finished = object()
+        stopped = threading.Event()
+        errors = []
+
+        def put(entry) -> None:
+            # Blocks the listing thread until a worker frees up a spot in the queue
+            asyncio.run_coroutine_threadsafe(queue.put(entry), loop).result()
+
+        def produce() -> None:
+            try:
+                for order, item in enumerate(items):
+                    if stopped.is_set():
+                        break
+
+                    put((order, item))
+            finally:
+                for _ in range(self.max_in_flight):
+                    put(finished)
+
+        async def consume() -> None:
+            while True:
+                entry = await queue.get()
+                if entry is finished:
+                    return
+
+                # Once a worker fails, the rest of the queue is only drained so the listing thread isn't left blocked
+                if stopped.is_set():
+                    continue
+
+                try:
+                    await worker(*entry)
+                except Exception as exception:
+                    errors.append(exception)
+                    stopped.set()
+
+        # Every worker is waited on before raising, so nothing is still running once this returns
+        producer_result, *_ = await asyncio.gather(asyncio.to_thread(produce), *[consume() for _ in range(self.max_in_flight)],
+                                                   return_exceptions=True)
+
+        if isinstance(producer_result, BaseException):
+            raise producer_result
+        if len(errors) > 0:
+            raise errors[0]
@@ -0,0 +1,48 @@
+from github import GitCommit
+from typing import Callable, Iterable
+
+import threading
+
+
+class CommitAccumulator:
+    """
+    Collects the commits found by concurrent workers so they can be saved from a single thread once every worker is done.
+    Commits are saved in the order they were listed rather than the order workers finished in,
+    so the results are the same no matter how many threads run.
+    """
+
+    def __init__(self, on_add: Callable[[GitCommit.GitCommit, list[str], tuple[str] | None, str | None], None] = None) -> None:
+        self.lock = threading.Lock()
+        self.entries = [] # (order, commit, item_numbers, pr_urls, pr_url)
+
+        # Called on the worker's thread with every commit as it's found, before any of them are saved
+        self.on_add = on_add
+
+
+    def add(self, order: tuple, commit: GitCommit.GitCommit, item_numbers: list[str],
+            pr_urls: Iterable[str] = None, pr_url: str = None) -> None:
+        """
+        Queues a commit to be saved, order being its position in the listing it came from
+        """
+
+        # Collected on the worker's thread, pr_urls can be a generator that still has to call out to GitHub
+        if pr_urls is not None:
+            pr_urls = tuple(pr_urls)
+
+        with self.lock:
+            self.entries.append((order, commit, item_numbers, pr_urls, pr_url))
+
+        if self.on_add is not None:
+            self.on_add(commit, item_numbers, pr_urls, pr_url)
+
+
+    def drain(self) -> list[tuple[tuple, GitCommit.GitCommit, list[str], tuple[str] | None, str | None]]:
+        """
+        Removes and returns every queued commit in listing order
+        """
+
+        with self.lock:
+            entries = self.entries
+            self.entries = []
+
+        return sorted(entries, key=lambda entry: entry[0])
@@ -0,0 +1,385 @@
+from CommitRecord import CommitRecord
+from datetime import datetime
+from PullRequestRecord import PullRequestRecord
+from SyncState import SyncState
+
+import json
+import sqlite3
+import threading
+
+
+class CommitCache:
+    """
+    Stores pull requests and commits per repository and branch in a local SQLite database.
+    Merged pull requests and commits never change, so anything stored here never has to be fetched from GitHub again.
+    """
+
+    def __init__(self, filename: str) -> None:
+        # Commits are saved from multiple threads when UseConcurrentCommitFetching is on
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+
+        with self.lock, self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS sync_states (
+                    repository TEXT NOT NULL,
+                    branch TEXT NOT NULL,
+                    last_pull_request_updated_at TEXT,
+                    last_pull_request_number INTEGER,
+                    pull_request_history_since TEXT,
+                    last_commit_sha TEXT,
+                    commit_history_since TEXT,
+                    PRIMARY KEY (repository, branch)
+                );
+
+                CREATE TABLE IF NOT EXISTS pull_requests (
+                    repository TEXT NOT NULL,
+                    branch TEXT NOT NULL,
+                    number INTEGER NOT NULL,
+                    head_ref TEXT NOT NULL,
+                    merged INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    merged_at TEXT,
+                    html_url TEXT NOT NULL,
+                    commits_cached INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (repository, branch, number)
+                );
+
+                CREATE TABLE IF NOT EXISTS pull_request_commits (
+                    repository TEXT NOT NULL,
+                    branch TEXT NOT NULL,
+                    pull_request_number INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    sha TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    author_name TEXT,
+                    author_email TEXT,
+                    date TEXT NOT NULL,
+                    html_url TEXT,
+                    parent_count INTEGER NOT NULL,
+                    PRIMARY KEY (repository, branch, pull_request_number, position)
+                );
+
+                CREATE TABLE IF NOT EXISTS branch_commits (
+                    repository TEXT NOT NULL,
+                    branch TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    sha TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    author_name TEXT,
+                    author_email TEXT,
+                    date TEXT NOT NULL,
+                    html_url TEXT,
+                    parent_count INTEGER NOT NULL,
+                    pull_request_urls TEXT,
+                    PRIMARY KEY (repository, branch, position)
+                );
+
+                CREATE INDEX IF NOT EXISTS branch_commits_sha ON branch_commits (repository, branch, sha);
+
+                CREATE TABLE IF NOT EXISTS http_responses (
+                    request_key TEXT NOT NULL PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    headers TEXT NOT NULL,
+                    body TEXT NOT NULL
+                );
+            """)
+
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+    def get_sync_state(self, repository: str, branch: str) -> SyncState:
+        """
+        Returns how far the repository's branch has been synced, or an empty SyncState if it never has been
+        """
+
+        with self.lock:
+            row = self.connection.execute(
+                """
+                SELECT last_pull_request_updated_at, last_pull_request_number, pull_request_history_since,
+                       last_commit_sha, commit_history_since
+                FROM sync_states WHERE repository = ? AND branch = ?
+                """,
+                (repository, branch)
+            ).fetchone()
+
+        if row is None:
+            return SyncState()
+
+        (last_pull_request_updated_at, last_pull_request_number, pull_request_history_since, 
+         last_commit_sha, commit_history_since) = row
+        return SyncState(
+            last_pull_request_updated_at = parse_optional_datetime(last_pull_request_updated_at),
+            last_pull_request_number = last_pull_request_number,
+            pull_request_history_since = parse_optional_datetime(pull_request_history_since),
+            last_commit_sha = last_commit_sha,
+            commit_history_since = parse_optional_datetime(commit_history_since)
+        )
+
+
+    def save_sync_state(self, repository: str, branch: str, sync_state: SyncState) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO sync_states (repository, branch, last_pull_request_updated_at, last_pull_request_number,
+                                                    pull_request_history_since, last_commit_sha, commit_history_since)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    repository, branch, format_optional_datetime(sync_state.last_pull_request_updated_at),
+                    sync_state.last_pull_request_number, format_optional_datetime(sync_state.pull_request_history_since),
+                    sync_state.last_commit_sha,
+                    format_optional_datetime(sync_state.commit_history_since)
+                )
+            )
+
+
+    def save_pull_request(self, repository: str, branch: str, pull_request: PullRequestRecord) -> None:
+        """
+        Stores (or updates) a pull request, keeping any commits already stored for it unless its merged state changed
+        """
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                INSERT INTO pull_requests (repository, branch, number, head_ref, merged, created_at, updated_at, merged_at, html_url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (repository, branch, number) DO UPDATE SET
+                    head_ref = excluded.head_ref,
+                    commits_cached = CASE WHEN merged = excluded.merged THEN commits_cached ELSE 0 END,
+                    merged = excluded.merged,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    merged_at = excluded.merged_at,
+                    html_url = excluded.html_url
+                """,
+                (
+                    repository, branch, pull_request.number, pull_request.head_ref, int(pull_request.merged),
+                    pull_request.created_at.isoformat(), pull_request.updated_at.isoformat(),
+                    format_optional_datetime(pull_request.merged_at), pull_request.html_url
+                )
+            )
+
+
+    def get_pull_requests(self, repository: str, branch: str) -> list[PullRequestRecord]:
+        """
+        Returns every pull request stored for the repository and branch, newest first
+        """
+
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT number, head_ref, merged, created_at, updated_at, merged_at, html_url FROM pull_requests
+                WHERE repository = ? AND branch = ? ORDER BY number DESC
+                """,
+                (repository, branch)
+            ).fetchall()
+
+        return [
+            PullRequestRecord(
+                number = number,
+                head_ref = head_ref,
+                merged = bool(merged),
+                created_at = datetime.fromisoformat(created_at),
+                updated_at = datetime.fromisoformat(updated_at),
+                merged_at = parse_optional_datetime(merged_at),
+                html_url = html_url
+            )
+            for number, head_ref, merged, created_at, updated_at, merged_at, html_url in rows
+        ]
+
+
+    def save_pull_request_commits(self, repository: str, branch: str,
+                                  pull_request_number: int, commits: list[CommitRecord]) -> None:
+        """
+        Stores the full list of commits for a pull request
+        """
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM pull_request_commits WHERE repository = ? AND branch = ? AND pull_request_number = ?",
+                (repository, branch, pull_request_number)
+            )
+            self.connection.executemany(
+                """
+                INSERT INTO pull_request_commits (repository, branch, pull_request_number, position, sha, message,
+                                                  author_name, author_email, date, html_url, parent_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (repository, branch, pull_request_number, position) + commit_record_to_row(commit)
+                    for position, commit in enumerate(commits)
+                ]
+            )
+            self.connection.execute(
+                "UPDATE pull_requests SET commits_cached = 1 WHERE repository = ? AND branch = ? AND number = ?",
+                (repository, branch, pull_request_number)
+            )
+
+
+    def get_pull_request_commits(self, repository: str, branch: str, pull_request_number: int) -> list[CommitRecord] | None:
+        """
+        Returns the stored commits of a pull request, or None if they have not been stored yet
+        """
+
+        with self.lock:
+            commits_cached = self.connection.execute(
+                "SELECT commits_cached FROM pull_requests WHERE repository = ? AND branch = ? AND number = ?",
+                (repository, branch, pull_request_number)
+            ).fetchone()
+
+            if commits_cached is None or not commits_cached[0]:
+                return None
+
+            rows = self.connection.execute(
+                """
+                SELECT sha, message, author_name, author_email, date, html_url, parent_count FROM pull_request_commits
+                WHERE repository = ? AND branch = ? AND pull_request_number = ? ORDER BY position
+                """,
+                (repository, branch, pull_request_number)
+            ).fetchall()
+
+        return [row_to_commit_record(row) for row in rows]
+
+
+    def save_branch_commits(self, repository: str, branch: str, commits: list[CommitRecord], replace: bool = False) -> None:
+        """
+        Stores commits from the branch's history (newest first) on top of the ones already stored.
+        If replace is True, the stored history is dropped first.
+        """
+
+        with self.lock, self.connection:
+            if replace:
+                self.connection.execute(
+                    "DELETE FROM branch_commits WHERE repository = ? AND branch = ?",
+                    (repository, branch)
+                )
+
+            newest_position = self.connection.execute(
+                "SELECT MAX(position) FROM branch_commits WHERE repository = ? AND branch = ?",
+                (repository, branch)
+            ).fetchone()[0] or 0
+
+            self.connection.executemany(
+                """
+                INSERT INTO branch_commits (repository, branch, position, sha, message,
+                                            author_name, author_email, date, html_url, parent_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    # The newest commit gets the highest position
+                    (repository, branch, newest_position + len(commits) - index) + commit_record_to_row(commit)
+                    for index, commit in enumerate(commits)
+                ]
+            )
+
+
+    def get_branch_commits(self, repository: str, branch: str, since: datetime = None) -> list[CommitRecord]:
+        """
+        Returns the stored history of the branch, newest first
+        """
+
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT sha, message, author_name, author_email, date, html_url, parent_count FROM branch_commits
+                WHERE repository = ? AND branch = ? ORDER BY position DESC
+                """,
+                (repository, branch)
+            ).fetchall()
+
+        commits = [row_to_commit_record(row) for row in rows]
+
+        if since is not None:
+            commits = [commit for commit in commits if commit.date >= since]
+
+        return commits
+
+
+    def save_branch_commit_pull_request_urls(self, repository: str, branch: str, sha: str, pull_request_urls: list[str]) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE branch_commits SET pull_request_urls = ? WHERE repository = ? AND branch = ? AND sha = ?",
+                (json.dumps(pull_request_urls), repository, branch, sha)
+            )
+
+
+    def get_branch_commit_pull_request_urls(self, repository: str, branch: str, sha: str) -> list[str] | None:
+        """
+        Returns the urls of the pull requests a branch commit is part of, or None if they have not been stored yet
+        """
+
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT pull_request_urls FROM branch_commits WHERE repository = ? AND branch = ? AND sha = ?",
+                (repository, branch, sha)
+            ).fetchone()
+
+        if row is None or row[0] is None:
+            return None
+
+        return json.loads(row[0])
+
+
+    def save_http_response(self, request_key: str, etag: str | None, last_modified: str | None, 
+                           headers: dict[str, str], body: str) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO http_responses (request_key, etag, last_modified, headers, body)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (request_key, etag, last_modified, json.dumps(headers), body)
+            )
+
+
+    def get_http_response(self, request_key: str) -> tuple[str | None, str | None, dict[str, str], str] | None:
+        """
+        Returns the stored (etag, last_modified, headers, body) of the last response to a request, or None if there is none
+        """
+
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, last_modified, headers, body FROM http_responses WHERE request_key = ?",
+                (request_key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        etag, last_modified, headers, body = row
+        return etag, last_modified, json.loads(headers), body
+
+
+def commit_record_to_row(commit: CommitRecord) -> tuple:
+    return (
+        commit.sha, commit.message, commit.author_name, commit.author_email,
+        commit.date.isoformat(), commit.html_url, commit.parent_count
+    )
+
+
+def row_to_commit_record(row: tuple) -> CommitRecord:
+    sha, message, author_name, author_email, date, html_url, parent_count = row
+
+    return CommitRecord(
+        sha = sha,
+        message = message,
+        author_name = author_name,
+        author_email = author_email,
+        date = datetime.fromisoformat(date),
+        html_url = html_url,
+        parent_count = parent_count
+    )
+
+
+def format_optional_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def parse_optional_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
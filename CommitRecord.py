@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from datetime import datetime
+from github import Commit
+
+
+@dataclass
+class CommitAuthor(object):
+    """Stores the author details of a CommitRecord."""
+
+    name: str
+    email: str
+    date: datetime
+
+
+@dataclass
+class CommitRecord(object):
+    """Stores the raw commit data we cache, shaped like a GitCommit so it can be saved the same way."""
+
+    sha: str
+    message: str
+    author_name: str
+    author_email: str
+    date: datetime
+    html_url: str
+    parent_count: int
+
+
+    @property
+    def author(self) -> CommitAuthor:
+        return CommitAuthor(self.author_name, self.author_email, self.date)
+
+
+    @property
+    def parents(self) -> list[None]:
+        # Only the number of parents is stored
+        return [None] * self.parent_count
+
+
+    @staticmethod
+    def from_commit(commit_object: Commit.Commit) -> "CommitRecord":
+        """
+        Builds a record from a listed commit, only using fields that are part of the list payload
+        """
+
+        git_commit = commit_object.commit
+
+        return CommitRecord(
+            sha = commit_object.sha,
+            message = git_commit.message,
+            author_name = git_commit.author.name,
+            author_email = git_commit.author.email,
+            date = git_commit.author.date,
+            html_url = commit_object.html_url,
+            parent_count = len(commit_object.parents)
+        )
@@ -0,0 +1,92 @@
+from CommitCache import CommitCache
+from github.Requester import HTTPSRequestsConnectionClass, RequestsResponse
+from requests.structures import CaseInsensitiveDict
+
+
+class ConditionalRequestCache:
+    """
+    Makes GitHub GET requests listing pull requests conditional on the ETag (or Last-Modified date)
+    of the last response for the same url, stored in the CommitCache.
+    GitHub answers with an empty 304 if nothing changed, which doesn't count against the rate limit,
+    and the stored response is used instead.
+    """
+
+    def __init__(self, commit_cache: CommitCache) -> None:
+        self.commit_cache = commit_cache
+
+
+    def create_connection_class(self, connection_class: type[HTTPSRequestsConnectionClass] = HTTPSRequestsConnectionClass
+                                ) -> type[HTTPSRequestsConnectionClass]:
+        """
+        Returns a PyGithub connection class that makes requests conditional before sending them through connection_class
+        """
+
+        return type("ConditionalHTTPSRequestsConnection", (ConditionalHTTPSRequestsConnection, connection_class),
+                    { "conditional_request_cache": self })
+
+
+def is_pull_request_listing_url(url: str) -> bool:
+    """
+    Returns whether the url lists a repository's pull requests (Ex: /repos/user/repo/pulls?state=closed&page=2).
+    Those urls are asked for again the same on every run, so they're the only responses worth storing.
+    Commit listings carry the run's since date and head sha, so they'd never be asked for again,
+    and a pull request's commits are already stored by the CommitCache
+    """
+
+    return url.split('?')[0].rstrip('/').endswith("/pulls")
+
+
+class CachedResponse:
+    """Mimics PyGithub's RequestsResponse for a response stored in the ConditionalRequestCache."""
+
+    def __init__(self, headers: dict[str, str], body: str) -> None:
+        self.status = 200
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+
+
+    def getheaders(self):
+        return self.headers.items()
+
+
+    def read(self) -> str:
+        return self.body
+
+
+class ConditionalHTTPSRequestsConnection(HTTPSRequestsConnectionClass):
+    """PyGithub's HTTPS connection, making GET requests conditional through a ConditionalRequestCache."""
+
+    conditional_request_cache: ConditionalRequestCache = None
+
+    def getresponse(self) -> RequestsResponse | CachedResponse:
+        if self.verb != "GET" or self.stream or not is_pull_request_listing_url(self.url):
+            return super().getresponse()
+
+        commit_cache = self.conditional_request_cache.commit_cache
+
+        # The same url can return different representations depending on what's accepted
+        request_key = f"{self.url} {self.headers.get('Accept', '')}"
+        cached_response = commit_cache.get_http_response(request_key)
+
+        if cached_response is not None:
+            etag, last_modified, headers, body = cached_response
+
+            conditional_headers = dict()
+            if etag is not None:
+                conditional_headers["If-None-Match"] = etag
+            if last_modified is not None:
+                conditional_headers["If-Modified-Since"] = last_modified
+
+            self.headers = { **self.headers, **conditional_headers }
+
+        response = super().getresponse()
+
+        if response.status == 304 and cached_response is not None:
+            # The fresh headers carry the current rate limit, the stored ones carry everything else (Ex: pagination links)
+            return CachedResponse({ **headers, **response.headers }, body)
+
+        if response.status == 200 and ("etag" in response.headers or "last-modified" in response.headers):
+            commit_cache.save_http_response(request_key, response.headers.get("etag"), response.headers.get("last-modified"),
+                                            dict(response.headers), response.read())
+
+        return response
@@ -0,0 +1,13 @@
+from CommitInfo import CommitInfo
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass
+class ExcelColumn(object):
+    """Stores how a commit detail is laid out in a column of the Excel file."""
+
+    header: str
+    width: float
+    get_value: Callable[[CommitInfo], str]
+    centered: bool = False
@@ -1,15 +1,39 @@
 import xlsxwriter.format
 import xlsxwriter.worksheet
+from BoundedScheduler import BoundedScheduler
+from CommitAccumulator import CommitAccumulator
+from CommitCache import CommitCache
 from CommitDetailVisibility import CommitDetailVisibility
 from CommitInfo import CommitInfo
+from CommitRecord import CommitRecord
+from ConditionalRequestCache import ConditionalRequestCache
 from datetime import datetime, timezone
+from ExcelColumn import ExcelColumn
 from dateutil.relativedelta import relativedelta
 from github import Github, Auth, GitCommit, GithubException, BadCredentialsException, Branch, Repository, PullRequest, Commit
+from github.Requester import Requester, HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass
+from GraphQLFetcher import GraphQLFetcher
+from ItemNumberIndex import ItemNumberIndex
+from ItemNumberMatcher import ItemNumberMatcher, extract_item_numbers
+from LazyCompletionCounter import LazyCompletionCounter
+from LocalGitRepository import LocalGitRepository
+from PullRequestRecord import PullRequestRecord
+from RateLimitThrottle import RateLimitThrottle
+from TextOutputWriter import TextOutputWriter
+from TokenPool import TokenPool
+
+from typing import Callable, Iterable, Iterator
+from urllib3.util.retry import Retry
+from xlsxwriter.utility import xl_col_to_name
 
 import asyncio
+import bisect
+import itertools
 import json
 import os
+import queue
 import re
+import threading
 import xlsxwriter
 
 
@@ -19,18 +43,33 @@ class GitTheCommits:
     """
     short_commit_hash_length = 10
 
+    # Rows are written to the file as they're finished instead of the whole sheet being kept in memory,
+    # so they must be written top to bottom. Strings are written as they are, like write_string would
+    excel_workbook_options = { "constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False }
+
+    # GitHub rejects search queries longer than 256 characters or with more than five AND/OR/NOT operators
+    max_search_query_length = 256
+    max_search_query_terms = 6
+
+    default_max_concurrent_requests = 8
+
     settings_are_set: bool
-    github_token: str
+    github_token: str | list[str]
     repository_name: str
     target_branch_name: str
     item_numbers: list[str]
     strip_characters_from_item_numbers: bool
+    item_number_patterns: list[re.Pattern]
+    invalid_item_number_pattern: str | None # Why a pattern in ItemNumberPatterns couldn't be compiled
     commit_detail_visibilty: CommitDetailVisibility
     group_commits_by_item: bool
     item_cherry_pick: bool
     order_commits_by_date_descend: bool
     use_commit_history: bool
     use_pull_requests: bool
+    use_pull_request_search: bool
+    use_graphql: bool
+    local_repository_path: str
     output_to_terminal: bool
     output_to_txt: bool
     output_to_excel: bool
@@ -40,13 +79,25 @@ class GitTheCommits:
     cherry_pick_command: str
     search_date_limit: datetime
     use_concurrent_commit_fetching: bool
+    max_concurrent_requests: int
     seconds_between_github_requests: int
+    use_adaptive_throttling: bool
+    cache_filename: str
+    report_lazy_completions: bool
 
     commit_list: list[CommitInfo]
     item_commit_dictionary: dict[int, list[int]] # item_number : commit_index
+    commit_sha_dictionary: dict[str, int] # sha : commit_index
 
+    github: Github
     github_repository: Repository.Repository
     github_target_branch: Branch.Branch
+    commit_cache: CommitCache
+    rate_limit_throttle: RateLimitThrottle
+    token_pool: TokenPool
+    item_number_index: ItemNumberIndex
+    item_number_index_key: tuple[str, str, bool, tuple[re.Pattern]] # (repository_name, target_branch_name, strip_characters_from_item_numbers, item_number_patterns)
+    lazy_completion_count: int
 
 
     def __init__(self, print_version = True) -> None:
@@ -59,6 +110,8 @@ class GitTheCommits:
         self.repository_name = None
         self.target_branch_name = None
         self.strip_characters_from_item_numbers = None
+        self.item_number_patterns = []
+        self.invalid_item_number_pattern = None
         self.item_numbers = None
         self.commit_detail_visibilty = CommitDetailVisibility()
         self.group_commits_by_item = None
@@ -66,6 +119,9 @@ class GitTheCommits:
         self.order_commits_by_date_descend = None
         self.use_commit_history = None
         self.use_pull_requests = None
+        self.use_pull_request_search = None
+        self.use_graphql = None
+        self.local_repository_path = None
         self.output_to_terminal = None
         self.output_to_txt = None
         self.output_to_excel = None
@@ -75,13 +131,47 @@ class GitTheCommits:
         self.cherry_pick_command = None
         self.search_date_limit = None
         self.use_concurrent_commit_fetching = None
+        self.max_concurrent_requests = None
         self.seconds_between_github_requests = None
+        self.use_adaptive_throttling = None
+        self.cache_filename = None
+        self.report_lazy_completions = None
         
+        # Commits are saved from multiple threads when UseConcurrentCommitFetching is on
+        self.commit_lock = threading.Lock()
         self.commit_list = []
         self.item_commit_dictionary = dict()
 
+        # When set, every commit is also put on this queue as soon as it's found, so it can be shown before the fetch finishes (Ex: by the GUI)
+        self.commit_queue: queue.Queue[CommitInfo] = None
+
+        self.github = None
         self.github_repository = None
         self.github_target_branch = None
+        self.commit_cache = None
+        self.rate_limit_throttle = None
+        self.token_pool = None
+        self.item_number_index = None
+        self.item_number_index_key = None
+        self.lazy_completion_count = 0
+
+
+    @property
+    def commit_list(self) -> list[CommitInfo]:
+        return self._commit_list
+
+
+    @commit_list.setter
+    def commit_list(self, commit_list: list[CommitInfo]) -> None:
+        """
+        Replaces the saved commits and re-indexes them by sha
+        """
+
+        self._commit_list = commit_list
+        self.commit_sha_dictionary = dict()
+
+        for index, commit_info in enumerate(commit_list):
+            self.commit_sha_dictionary.setdefault(commit_info.sha, index)
 
 
     def group_relevant_commit_info(self, git_commit: GitCommit.GitCommit, item_number, 
@@ -105,7 +195,8 @@ class GitTheCommits:
     def save_commit_info(self, commit: GitCommit.GitCommit, item_number: str, 
                          pr_urls: tuple = None, pr_url: str = None) -> None:
         """
-        Adds commit to the commit_list and groups the index of that commit to the provided item_number in the item_commit_dictionary
+        Adds commit to the commit_list and groups the index of that commit to the provided item_number in the item_commit_dictionary.
+        A commit that was already saved is only grouped to the item_number as well, so it's stored once no matter how many items it belongs to
         """
 
         def get_pull_request_number(url: str) -> int | None:
@@ -124,21 +215,34 @@ class GitTheCommits:
 
         commit_sha = commit.sha[:self.short_commit_hash_length] if self.use_short_commit_hash else commit.sha
 
-        if not commit_sha in [commit.sha for commit in self.commit_list]:
+        commit_info = None
+        if not commit_sha in self.commit_sha_dictionary:
+            # Grouped outside the lock, pr_urls can be a generator that still has to call out to GitHub
             commit_info = self.group_relevant_commit_info(commit, item_number, pr_urls, pr_url)
 
-            if not self.ignore_merge_commits or not commit_info.is_merge:
-                self.commit_list.append(commit_info)
-                
-                if item_number in self.item_commit_dictionary:
-                    self.item_commit_dictionary[item_number].append(len(self.commit_list) - 1)
-                else:
-                    self.item_commit_dictionary[item_number] = [len(self.commit_list) - 1]
-        else:
-            filtered_commit = list(filter(lambda c: c.sha == commit_sha, self.commit_list))
-            
-            if len(filtered_commit) == 1:
-                saved_commit = filtered_commit[0]
+        with self.commit_lock:
+            saved_commit_index = self.commit_sha_dictionary.get(commit_sha)
+
+            if saved_commit_index is None:
+                if not self.ignore_merge_commits or not commit_info.is_merge:
+                    self.commit_list.append(commit_info)
+                    self.commit_sha_dictionary[commit_sha] = len(self.commit_list) - 1
+                    
+                    if item_number in self.item_commit_dictionary:
+                        self.item_commit_dictionary[item_number].append(len(self.commit_list) - 1)
+                    else:
+                        self.item_commit_dictionary[item_number] = [len(self.commit_list) - 1]
+            else:
+                saved_commit = self.commit_list[saved_commit_index]
+
+                # Indexes stay in the order commits were saved, so the item's list can be searched for the commit
+                item_commit_indexes = self.item_commit_dictionary.setdefault(item_number, [])
+                insert_position = bisect.bisect_left(item_commit_indexes, saved_commit_index)
+                if insert_position == len(item_commit_indexes) or item_commit_indexes[insert_position] != saved_commit_index:
+                    item_commit_indexes.insert(insert_position, saved_commit_index)
+
+                    if item_number not in saved_commit.item_number.split(", "):
+                        saved_commit.item_number += f", {item_number}"
 
                 # store first pull request that commit appears in
                 current_pr_number = get_pull_request_number(saved_commit.pr_url)
@@ -147,34 +251,50 @@ class GitTheCommits:
                     saved_commit.pr_url = pr_url
 
 
+    def stringify_commit(self, commit: CommitInfo) -> str:
+        """
+        Format a commit into a human-readable string
+        """
+
+        lines = [""]
+        if self.commit_detail_visibilty.message: 
+            lines.append(f"- {commit.message}")
+        if self.commit_detail_visibilty.item_number: 
+            lines.append(f"Item{' Number' if self.strip_characters_from_item_numbers else ''}: {commit.item_number}")
+        if self.commit_detail_visibilty.author: 
+            lines.append(f"Author: {commit.author}")
+        if self.commit_detail_visibilty.date: 
+            lines.append(f"Date: {commit.date}")
+        if self.commit_detail_visibilty.commit_url: 
+            lines.append(f"Commit URL: {commit.commit_url}")
+        if self.commit_detail_visibilty.pull_request_url: 
+            lines.append(f"Pull Request URL: {commit.pr_url}")
+        if self.commit_detail_visibilty.sha: 
+            lines.append(f"SHA: {commit.sha}")
+        if self.commit_detail_visibilty.is_merge_commit: 
+            lines.append(f"Is Merge Commit: {commit.is_merge}")
+        if self.commit_detail_visibilty.cherry_pick_command: 
+            lines.append(f"Cherry-Pick Command: {self.cherry_pick_command} {commit.sha}")
+        lines.append("")
+
+        return "\n".join(lines)
+
+
     def stringify_commits(self, commit_list: list[CommitInfo]) -> str:
         """
-        Format the commit into a human-readable string
+        Format the commits into a human-readable string
         """
         
-        output = ""
+        return "".join(self.stringify_commit(commit) for commit in commit_list)
+
+
+    def write_stringified_commits(self, text_output_writer: TextOutputWriter, commit_list: list[CommitInfo]) -> None:
+        """
+        Formats the commits one at a time, writing each one out before formatting the next
+        """
+
         for commit in commit_list:
-            if self.commit_detail_visibilty.message: 
-                output += f"\n- {commit.message}"
-            if self.commit_detail_visibilty.item_number: 
-                output += f"\nItem{' Number' if self.strip_characters_from_item_numbers else ''}: {commit.item_number}"
-            if self.commit_detail_visibilty.author: 
-                output += f"\nAuthor: {commit.author}"
-            if self.commit_detail_visibilty.date: 
-                output += f"\nDate: {commit.date}"
-            if self.commit_detail_visibilty.commit_url: 
-                output += f"\nCommit URL: {commit.commit_url}"
-            if self.commit_detail_visibilty.pull_request_url: 
-                output += f"\nPull Request URL: {commit.pr_url}"
-            if self.commit_detail_visibilty.sha: 
-                output += f"\nSHA: {commit.sha}"
-            if self.commit_detail_visibilty.is_merge_commit: 
-                output += f"\nIs Merge Commit: {commit.is_merge}"
-            if self.commit_detail_visibilty.cherry_pick_command: 
-                output += f"\nCherry-Pick Command: {self.cherry_pick_command} {commit.sha}"
-            output += "\n"
-            
-        return output
+            text_output_writer.write(self.stringify_commit(commit))
 
 
     def strip_non_digit_characters_from_list_of_strings(self, input: list) -> list[str]:
@@ -185,6 +305,23 @@ class GitTheCommits:
         return [re.sub("\D", '', str(number)) for number in input]
 
 
+    def normalize_item_numbers(self, item_numbers: list) -> list[str]:
+        """
+        Converts entered item numbers into the form they're matched in: what the item number patterns extract from them,
+        only their digits with StripCharactersFromItemNumbers on, or otherwise as they are
+        """
+
+        if len(self.item_number_patterns) > 0:
+            # An item number the patterns don't recognize is kept as entered
+            return [next(iter(extract_item_numbers(self.item_number_patterns, str(item_number))), str(item_number).strip())
+                    for item_number in item_numbers]
+
+        if self.strip_characters_from_item_numbers:
+            return self.strip_non_digit_characters_from_list_of_strings(item_numbers)
+
+        return [str(item_number) for item_number in item_numbers]
+
+
     def manually_enter_item_numbers(self) -> list[str]:
         """
         Prompt the user to manually enter item numbers
@@ -194,9 +331,7 @@ class GitTheCommits:
         enter_numbers_manually_input = input("Would you like to enter those item numbers now? (Y/N) ").lower()
         if len(enter_numbers_manually_input) > 0 and enter_numbers_manually_input[0] == 'y':
             item_numbers_input = input("Please enter your item numbers separated by commas. Press ENTER when done:\n")
-            item_numbers = item_numbers_input.split(',')
-            if self.strip_characters_from_item_numbers:
-                item_numbers = self.strip_non_digit_characters_from_list_of_strings(item_numbers)
+            item_numbers = self.normalize_item_numbers(item_numbers_input.split(','))
             print("Item numbers I'll search for:")
             print(", ".join([f"{item_number}" for item_number in item_numbers]) + "\n")
         else:
@@ -250,6 +385,7 @@ class GitTheCommits:
         # GitHub Access Token: https://github.com/settings/tokens
         # Required Access: repo - Full control of private repositories 
         # (There's unfortuntately no read-only for private repositories)
+        # A list of tokens spreads the requests across all of them, multiplying the rate limit
         self.github_token = new_settings["GitHubToken"]
         self.repository_name = new_settings["TargetRepository"]
         self.target_branch_name = new_settings["TargetBranch"]
@@ -257,12 +393,22 @@ class GitTheCommits:
         # If true, removes all non-digit characters from the item numbers
         self.strip_characters_from_item_numbers = new_settings["StripCharactersFromItemNumbers"]
 
-        if self.strip_characters_from_item_numbers:
-            # Convert ItemNumbers into a string containing only numbers (1234 or "ITEM-1234" becomes "1234")
-            self.item_numbers = self.strip_non_digit_characters_from_list_of_strings(new_settings["ItemNumbers"])
-        else:
-            # Ensure all item numbers are strings
-            self.item_numbers = [str(item_number) for item_number in new_settings["ItemNumbers"]]
+        # Regexes that find item numbers in branch names and commit messages (Ex: "(?:PROJ|OPS)-(\\d+)"), their first capture group
+        # being the item number. If set, item numbers must be found whole instead of StripCharactersFromItemNumbers' matching
+        item_number_patterns = new_settings.get("ItemNumberPatterns") or []
+        if isinstance(item_number_patterns, str):
+            item_number_patterns = [item_number_patterns]
+        self.item_number_patterns = []
+        self.invalid_item_number_pattern = None
+        for item_number_pattern in item_number_patterns:
+            try:
+                self.item_number_patterns.append(re.compile(item_number_pattern))
+            except re.error as exception:
+                # Reported by validate_settings, so the settings can be fixed instead of crashing
+                self.invalid_item_number_pattern = f"ItemNumberPatterns has an invalid regex '{item_number_pattern}' ({exception})."
+
+        # Convert ItemNumbers into the form they're matched in (1234 or "ITEM-1234" becomes "1234" when stripping characters)
+        self.item_numbers = self.normalize_item_numbers(new_settings["ItemNumbers"])
 
         # A dictionary of what details should be included in the output
         commitDetailsToShow = new_settings["CommitDetailsToShow"]
@@ -293,6 +439,18 @@ class GitTheCommits:
         # Collect commits using the pull requests to the Develop branch ***this is the recommended method***
         self.use_pull_requests = new_settings["UsePullRequests"]
 
+        # Collect commits using GitHub's search to find the merged pull requests whose head branch starts with an item number
+        # (Takes the place of UsePullRequests, only the matching pull requests are fetched)
+        self.use_pull_request_search = new_settings.get("UsePullRequestSearch", False)
+
+        # Fetch pull requests and commits through GitHub's GraphQL API instead of the REST API.
+        # Pull requests come with their commits (and commits with their pull requests), saving a request for each one
+        self.use_graphql = new_settings.get("UseGraphQL", False)
+
+        # Path to a local clone of the repository. If set, UseCommitHistory reads the TargetBranch's history with git log,
+        # and UsePullRequests reads merged pull requests from the TargetBranch's merge commits, instead of asking GitHub for them (Disabled if null)
+        self.local_repository_path = new_settings.get("LocalRepositoryPath")
+
         # Choose how you'd like to see the results:
         self.output_to_terminal = new_settings["OutputToTerminal"]
         self.output_to_txt = new_settings["OutputToTxtFile"]
@@ -327,9 +485,24 @@ class GitTheCommits:
         # Speeds up the process but could cause rate-limiting related issues
         self.use_concurrent_commit_fetching = new_settings["UseConcurrentCommitFetching"]
 
+        # The most pull requests or commits processed at once when UseConcurrentCommitFetching is on (Default is 8)
+        self.max_concurrent_requests = new_settings.get("MaxConcurrentRequests")
+
         # The number of seconds to wait between each GitHub request (Default is 1 second)
         self.seconds_between_github_requests = new_settings["SecondsBetweenGithubRequests"]
 
+        # Paces requests using GitHub's rate limit headers instead of SecondsBetweenGithubRequests.
+        # Runs at full speed while plenty of the rate limit is left and slows down as it runs low
+        self.use_adaptive_throttling = new_settings.get("UseAdaptiveThrottling", False)
+
+        # Stores pull requests and their commits in a local SQLite file so repeat runs only fetch what's new
+        # (Disabled if null)
+        self.cache_filename = new_settings.get("CacheFilename")
+
+        # Prints how many extra requests PyGithub made to fill in lazily loaded attributes while fetching commits
+        # (Debugging aid for spotting API usage regressions)
+        self.report_lazy_completions = new_settings.get("ReportLazyCompletions", False)
+
         self.settings_are_set = True
 
 
@@ -348,49 +521,92 @@ class GitTheCommits:
             except json.decoder.JSONDecodeError as exception:
                 return f"Your {filename} file has a syntax error on line {exception.lineno}. Please fix it and try again."
 
+        settings_error = self.validate_settings()
+        if settings_error:
+            return f"{settings_error} Please fix your {filename} file and try again."
+
 
-    def write_commit_details_to_worksheet(self, commit_list: list[CommitInfo], worksheet: xlsxwriter.worksheet.Worksheet, 
-                                          row: int, data_format: xlsxwriter.format.Format, 
-                                          centered_data_format: xlsxwriter.format.Format) -> None:
+    def validate_settings(self) -> str | None:
         """
-        Writes the details of each commit to the worksheet and returns the number of rows added
+        Returns why the settings can't be used together, if they can't
         """
 
-        rows_added = 0
-        for commit in commit_list:
-            data_column_number = 0
-            if self.commit_detail_visibilty.message: 
-                worksheet.write_string(row, data_column_number, commit.message, data_format)
-                data_column_number += 1
-            if self.commit_detail_visibilty.item_number:
-                worksheet.write_string(row, data_column_number, commit.item_number, centered_data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.author:
-                worksheet.write_string(row, data_column_number, commit.author, data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.date:
-                worksheet.write_string(row, data_column_number, commit.date.strftime("%m/%d/%Y, %H:%M:%S"), centered_data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.commit_url:
-                worksheet.write_string(row, data_column_number, commit.commit_url, data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.pull_request_url:
-                worksheet.write_string(row, data_column_number, commit.pr_url, data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.sha:
-                worksheet.write_string(row, data_column_number, commit.sha, centered_data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.is_merge_commit:
-                worksheet.write_string(row, data_column_number, str(commit.is_merge), centered_data_format) 
-                data_column_number += 1
-            if self.commit_detail_visibilty.cherry_pick_command:
-                worksheet.write_string(row, data_column_number, f"{self.cherry_pick_command} {commit.sha}", data_format) 
-                data_column_number += 1
-                
-            row += 1
-            rows_added += 1
+        if self.invalid_item_number_pattern:
+            return self.invalid_item_number_pattern
+
+        # The cache is synced through the REST API, so UseGraphQL would silently do nothing
+        if self.use_graphql and self.cache_filename:
+            return "UseGraphQL can't be used while CacheFilename is set. Set UseGraphQL to false or CacheFilename to null."
+
+        # Searched pull requests aren't stored, so the cache would silently go unused for pull requests
+        if self.use_pull_request_search and self.cache_filename:
+            return ("UsePullRequestSearch can't be used while CacheFilename is set. "
+                    "Set UsePullRequestSearch to false or CacheFilename to null.")
+
+        return None
+
+
+    def get_excel_columns(self) -> list[ExcelColumn]:
+        """
+        Returns the columns of the Excel file for the visible commit details, in order
+        """
+
+        cherry_pick_command = self.cherry_pick_command
+        columns = [
+            (self.commit_detail_visibilty.message, 
+             ExcelColumn("Commit Message", 100, lambda commit: commit.message)),
+            (self.commit_detail_visibilty.item_number, 
+             ExcelColumn(f"Item{' Number' if self.strip_characters_from_item_numbers else ''}", 15, 
+                         lambda commit: commit.item_number, centered=True)),
+            (self.commit_detail_visibilty.author, 
+             ExcelColumn("Author", 45, lambda commit: commit.author)),
+            (self.commit_detail_visibilty.date, 
+             ExcelColumn("Date", 20, lambda commit: commit.date.strftime("%m/%d/%Y, %H:%M:%S"), centered=True)),
+            (self.commit_detail_visibilty.commit_url, 
+             ExcelColumn("Commit Url", 101, lambda commit: commit.commit_url)),
+            (self.commit_detail_visibilty.pull_request_url, 
+             ExcelColumn("Pull Request Url(s)", 61, lambda commit: commit.pr_url)),
+            (self.commit_detail_visibilty.sha, 
+             ExcelColumn("Sha", 10 if self.use_short_commit_hash else 42, lambda commit: commit.sha, centered=True)),
+            (self.commit_detail_visibilty.is_merge_commit, 
+             ExcelColumn("Is Merge Commit", 16, lambda commit: str(commit.is_merge), centered=True)),
+            (self.commit_detail_visibilty.cherry_pick_command, 
+             ExcelColumn("Cherry-Pick Command", 80, lambda commit: f"{cherry_pick_command} {commit.sha}"))
+        ]
+
+        return [column for is_visible, column in columns if is_visible]
+
+
+    def get_excel_column_runs(self, columns: list[ExcelColumn], data_format: xlsxwriter.format.Format, 
+                              centered_data_format: xlsxwriter.format.Format
+                              ) -> list[tuple[int, xlsxwriter.format.Format, list[Callable[[CommitInfo], str]]]]:
+        """
+        Groups the columns into runs sharing a format, since write_row takes one format. 
+        Returns each run's first column number, format and value accessors
+        """
+
+        column_runs = []
+        column_number = 0
+        for format, run_columns in itertools.groupby(columns, key=lambda column: centered_data_format if column.centered else data_format):
+            value_accessors = [column.get_value for column in run_columns]
+            column_runs.append((column_number, format, value_accessors))
+            column_number += len(value_accessors)
+
+        return column_runs
+
+
+    def write_commit_details_to_worksheet(self, commit_list: list[CommitInfo], worksheet: xlsxwriter.worksheet.Worksheet, row: int, 
+                                          column_runs: list[tuple[int, xlsxwriter.format.Format, list[Callable[[CommitInfo], str]]]]
+                                          ) -> int:
+        """
+        Writes the details of each commit to the worksheet, one row at a time, and returns the number of rows added
+        """
+
+        for row_offset, commit in enumerate(commit_list):
+            for column_number, format, value_accessors in column_runs:
+                worksheet.write_row(row + row_offset, column_number, [get_value(commit) for get_value in value_accessors], format)
         
-        return rows_added
+        return len(commit_list)
 
 
     def write_column_spanning_string_to_worksheet(self, worksheet: xlsxwriter.worksheet.Worksheet, row: int, 
@@ -418,7 +634,7 @@ class GitTheCommits:
                 else:
                     break
 
-        with xlsxwriter.Workbook(f"output.xlsx") as workbook:
+        with xlsxwriter.Workbook(f"output.xlsx", self.excel_workbook_options) as workbook:
             worksheet = workbook.add_worksheet()
 
             header_format = workbook.add_format(
@@ -437,68 +653,16 @@ class GitTheCommits:
                 {"bg_color": "white", "align": "center", "border": 1, "border_color": "#d0d0d0"}
             )
 
-            letter_dictionary = {
-                1: 'A',
-                2: 'B',
-                3: 'C',
-                4: 'D',
-                5: 'E',
-                6: 'F',
-                7: 'G',
-                8: 'H',
-                9: 'I'
-            }
-
             # Header Rows
-            header_column_number = 1
-            if self.commit_detail_visibilty.message: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 100)
-                worksheet.write_string(f'{letter}1', "Commit Message", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.item_number: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 15)
-                worksheet.write_string(f'{letter}1', f"Item{' Number' if self.strip_characters_from_item_numbers else ''}", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.author: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 45)
-                worksheet.write_string(f'{letter}1', "Author", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.date: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 20)
-                worksheet.write_string(f'{letter}1', "Date", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.commit_url: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 101)
-                worksheet.write_string(f'{letter}1', "Commit Url", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.pull_request_url: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 61)
-                worksheet.write_string(f'{letter}1', "Pull Request Url(s)", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.sha: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 10 if self.use_short_commit_hash else 42)
-                worksheet.write_string(f'{letter}1', "Sha", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.is_merge_commit: 
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 16)
-                worksheet.write_string(f'{letter}1', "Is Merge Commit", header_format)
-                header_column_number += 1
-            if self.commit_detail_visibilty.cherry_pick_command:
-                letter = letter_dictionary[header_column_number]
-                worksheet.set_column(f"{letter}:{letter}", 80)
-                worksheet.write_string(f'{letter}1', "Cherry-Pick Command", header_format)
-                header_column_number += 1
+            columns = self.get_excel_columns()
+            for column_number, column in enumerate(columns):
+                worksheet.set_column(column_number, column_number, column.width)
+
+            worksheet.write_row(0, 0, [column.header for column in columns], header_format)
 
             # THE DATA
-            last_column_letter = letter_dictionary[max(header_column_number - 1, 1)]
+            column_runs = self.get_excel_column_runs(columns, data_format, centered_data_format)
+            last_column_letter = xl_col_to_name(max(len(columns) - 1, 0))
             row = 1
             if self.group_commits_by_item:
                 sorted_item_numbers = self.sort_item_numbers_by_commit_dates()
@@ -522,8 +686,7 @@ class GitTheCommits:
                                                                    item_commits_string, subheader_format)
                     row += 1
 
-                    rows_added = self.write_commit_details_to_worksheet(item_commit_list, worksheet, row, 
-                                                                        data_format, centered_data_format)
+                    rows_added = self.write_commit_details_to_worksheet(item_commit_list, worksheet, row, column_runs)
                     row += rows_added
                     
                     # Cherry Pick Command
@@ -541,13 +704,12 @@ class GitTheCommits:
             else:
                 if len(self.commit_list) == 0:
                     no_commits_string = "No commits found"
-                    self.write_column_spanning_string_to_worksheet(worksheet, 1, letter_dictionary[max(header_column_number - 1, 1)], 
+                    self.write_column_spanning_string_to_worksheet(worksheet, 1, last_column_letter, 
                                                                 no_commits_string, data_warning_format)
                     return
 
                 sorted_commit_list = sorted(self.commit_list, key=lambda x: x.date, reverse=self.order_commits_by_date_descend or 0)
-                rows_added = self.write_commit_details_to_worksheet(sorted_commit_list, worksheet, row, 
-                                                                    data_format, centered_data_format)
+                rows_added = self.write_commit_details_to_worksheet(sorted_commit_list, worksheet, row, column_runs)
                 row += rows_added
 
             if self.all_commits_cherry_pick_command:
@@ -562,85 +724,518 @@ class GitTheCommits:
                 row += 1
 
 
+    def sync_pull_request_cache(self) -> dict[int, PullRequest.PullRequest]:
+        """
+        Stores every closed pull request updated since the last sync and returns the newly fetched pull requests
+        """
+
+        sync_state = self.commit_cache.get_sync_state(self.repository_name, self.target_branch_name)
+        high_water_mark = sync_state.last_pull_request_updated_at
+
+        # Anything older than what was synced last time (or pull requests that were never synced) needs a full sync
+        needs_full_sync = high_water_mark is None or (
+            sync_state.pull_request_history_since is not None and 
+            (self.search_date_limit is None or self.search_date_limit < sync_state.pull_request_history_since)
+        )
+
+        fetched_pull_requests = dict()
+        pull_requests = self.github_repository.get_pulls(state="closed", base=self.target_branch_name,
+                                                         sort="updated", direction="desc")
+        for pull in pull_requests:
+            # Pull requests are listed by most recently updated, so everything past this point is already cached
+            if not needs_full_sync and pull.updated_at < high_water_mark:
+                break
+
+            # A pull request can't be created after it was last updated, so everything past this point is too old
+            if self.search_date_limit != None and pull.updated_at < self.search_date_limit:
+                # Pull requests between the high-water mark and the search limit were skipped
+                needs_full_sync = True
+                break
+
+            pull_request = PullRequestRecord.from_pull_request(pull)
+            self.commit_cache.save_pull_request(self.repository_name, self.target_branch_name, pull_request)
+            fetched_pull_requests[pull.number] = pull
+
+            if self.is_item_number_index_current():
+                self.item_number_index.add_pull_request(pull_request)
+
+            if sync_state.last_pull_request_updated_at is None or pull.updated_at > sync_state.last_pull_request_updated_at:
+                sync_state.last_pull_request_updated_at = pull.updated_at
+                sync_state.last_pull_request_number = pull.number
+
+        if needs_full_sync:
+            sync_state.pull_request_history_since = self.search_date_limit
+
+        self.commit_cache.save_sync_state(self.repository_name, self.target_branch_name, sync_state)
+
+        return fetched_pull_requests
+
+
+    def sync_commit_history_cache(self) -> dict[str, Commit.Commit]:
+        """
+        Stores every commit added to the target branch since the last sync and returns the newly fetched commits
+        """
+
+        sync_state = self.commit_cache.get_sync_state(self.repository_name, self.target_branch_name)
+        head_sha = self.github_target_branch.commit.sha
+
+        # Anything older than what was synced last time (or a history that was never synced) needs a full sync
+        needs_full_sync = sync_state.last_commit_sha is None or (
+            sync_state.commit_history_since is not None and 
+            (self.search_date_limit is None or self.search_date_limit < sync_state.commit_history_since)
+        )
+
+        if not needs_full_sync and head_sha == sync_state.last_commit_sha:
+            return dict()
+
+        github_commits = None
+        if not needs_full_sync:
+            github_commits = self.get_commits_since_last_sync(sync_state.last_commit_sha, head_sha)
+
+            # The last synced commit is no longer part of the branch (Ex: force push), so the stored history is stale
+            needs_full_sync = github_commits is None
+
+        if needs_full_sync:
+            if self.search_date_limit != None:
+                github_commits = self.github_repository.get_commits(sha=head_sha, since=self.search_date_limit)
+            else:
+                github_commits = self.github_repository.get_commits(sha=head_sha)
+
+            sync_state.commit_history_since = self.search_date_limit
+
+        fetched_commits = dict()
+        new_commits = []
+        for commit_object in github_commits:
+            fetched_commits[commit_object.sha] = commit_object
+            new_commits.append(CommitRecord.from_commit(commit_object))
+
+        self.commit_cache.save_branch_commits(self.repository_name, self.target_branch_name, new_commits, replace=needs_full_sync)
+
+        if self.is_item_number_index_current():
+            if needs_full_sync:
+                self.item_number_index.clear_commits()
+            self.item_number_index.add_commits(new_commits)
+
+        sync_state.last_commit_sha = head_sha
+        self.commit_cache.save_sync_state(self.repository_name, self.target_branch_name, sync_state)
+
+        return fetched_commits
+
+
+    def get_commits_since_last_sync(self, last_commit_sha: str, head_sha: str) -> list[Commit.Commit] | None:
+        """
+        Lists the commits reachable from the branch's head but not from the last synced commit, newest first.
+        Unlike walking the history until the last synced commit, this also finds older commits brought in by a merge.
+        Returns None if they can't all be listed, meaning the history has to be synced in full
+        """
+
+        try:
+            comparison = self.github_repository.compare(last_commit_sha, head_sha)
+
+            # The last synced commit is gone (Ex: force push) if the head doesn't build on it
+            if comparison.status not in ("ahead", "identical"):
+                return None
+
+            commit_objects = list(comparison.commits)
+        except GithubException:
+            # The last synced commit no longer exists
+            return None
+
+        # A comparison lists at most 10000 commits
+        if len(commit_objects) < comparison.ahead_by:
+            return None
+
+        # Comparisons list the oldest commit first
+        return commit_objects[::-1]
+
+
+    def get_closed_pull_requests(self) -> Iterator[PullRequest.PullRequest]:
+        """
+        Lists the closed pull requests to the target branch newest first, stopping at the search date limit
+        """
+
+        pull_requests = self.github_repository.get_pulls(state="closed", base=self.target_branch_name,
+                                                         sort="created", direction="desc")
+        for pull in pull_requests:
+            # Pull requests are listed newest first, so no further pages need to be fetched
+            if self.search_date_limit != None and pull.created_at < self.search_date_limit:
+                return
+
+            yield pull
+
+
+    def open_commit_cache(self) -> CommitCache | None:
+        """
+        Opens the CommitCache if caching is enabled and it isn't open yet
+        """
+
+        if self.cache_filename and self.commit_cache is None:
+            self.commit_cache = CommitCache(self.cache_filename)
+
+        return self.commit_cache
+
+
+    def build_pull_request_search_queries(self) -> list[str]:
+        """
+        Combines the item numbers into as few pull request search queries as GitHub's query limits allow
+        """
+
+        qualifiers = f"repo:{self.repository_name} is:pr is:merged base:{self.target_branch_name}"
+        if self.search_date_limit != None:
+            qualifiers += f" created:>={self.search_date_limit.date().isoformat()}"
+
+        queries = []
+        terms = []
+        for item_number in dict.fromkeys(self.item_numbers):
+            if len(item_number) == 0:
+                continue
+
+            combined_terms = terms + [f"head:{item_number}"]
+            query = f"{qualifiers} {' OR '.join(combined_terms)}"
+
+            if len(terms) > 0 and (len(combined_terms) > self.max_search_query_terms or len(query) > self.max_search_query_length):
+                queries.append(f"{qualifiers} {' OR '.join(terms)}")
+                combined_terms = [f"head:{item_number}"]
+
+            terms = combined_terms
+
+        if len(terms) > 0:
+            queries.append(f"{qualifiers} {' OR '.join(terms)}")
+
+        return queries
+
+
+    def search_merged_pull_requests(self) -> Iterator[PullRequest.PullRequest]:
+        """
+        Searches for the merged pull requests to the target branch from a branch starting with one of the item numbers
+        """
+
+        found_pull_request_numbers = set()
+        for query in self.build_pull_request_search_queries():
+            for issue in self.github.search_issues(query):
+                if issue.number in found_pull_request_numbers:
+                    continue
+
+                found_pull_request_numbers.add(issue.number)
+
+                # Search results are issues, which don't have the head branch or commits
+                yield self.github_repository.get_pull(issue.number)
+
+
+    def get_commit_pull_request_urls_from_cache(self, commit: CommitRecord, commit_object: Commit.Commit = None) -> list[str]:
+        """
+        Returns the cached urls of the pull requests a commit is part of, fetching and caching them first if needed
+        """
+
+        pull_request_urls = self.commit_cache.get_branch_commit_pull_request_urls(self.repository_name, self.target_branch_name,
+                                                                                  commit.sha)
+
+        if pull_request_urls is None:
+            if commit_object is None:
+                commit_object = self.github_repository.get_commit(commit.sha)
+
+            pull_request_urls = [pull.html_url for pull in commit_object.get_pulls()]
+            self.commit_cache.save_branch_commit_pull_request_urls(self.repository_name, self.target_branch_name,
+                                                                   commit.sha, pull_request_urls)
+
+        return pull_request_urls
+
+
+    def is_item_number_index_current(self) -> bool:
+        """
+        Checks if the item number index was built for the current repository, branch, and item number settings
+        """
+
+        index_key = (self.repository_name, self.target_branch_name, self.strip_characters_from_item_numbers, tuple(self.item_number_patterns))
+        return self.item_number_index is not None and self.item_number_index_key == index_key
+
+
+    def get_item_number_index(self) -> ItemNumberIndex:
+        """
+        Returns the index of all cached pull requests and commits, building it from the cache if needed
+        """
+
+        if not self.is_item_number_index_current():
+            item_number_index = ItemNumberIndex(self.strip_characters_from_item_numbers, self.item_number_patterns)
+
+            for pull_request in self.commit_cache.get_pull_requests(self.repository_name, self.target_branch_name):
+                item_number_index.add_pull_request(pull_request)
+            item_number_index.add_commits(self.commit_cache.get_branch_commits(self.repository_name, self.target_branch_name))
+
+            self.item_number_index = item_number_index
+            self.item_number_index_key = (self.repository_name, self.target_branch_name, self.strip_characters_from_item_numbers,
+                                          tuple(self.item_number_patterns))
+
+        return self.item_number_index
+
+
+    def find_cached_pull_requests_with_item_numbers(self) -> list[tuple[PullRequestRecord, list[str]]]:
+        """
+        Looks up each item number in the index and returns the matching pull requests (newest first) with their item numbers
+        """
+
+        item_number_index = self.get_item_number_index()
+
+        matched_pull_requests = dict() # number : (PullRequestRecord, item_numbers)
+        for item_number in self.item_numbers:
+            for pull_request in item_number_index.get_pull_requests(item_number):
+                matched_pull_requests.setdefault(pull_request.number, (pull_request, []))[1].append(item_number)
+
+        return sorted(matched_pull_requests.values(), key=lambda match: match[0].number, reverse=True)
+
+
+    def find_cached_commits_with_item_numbers(self, item_number_matcher: ItemNumberMatcher) -> list[tuple[CommitRecord, list[str]]]:
+        """
+        Looks up each item number in the index and returns the matching branch commits (newest first) with their item numbers
+        """
+
+        item_number_index = self.get_item_number_index()
+
+        matched_commits = dict() # sha : (CommitRecord, item_numbers)
+        if item_number_index.uses_tokens():
+            for item_number in self.item_numbers:
+                for commit in item_number_index.get_commits(item_number):
+                    matched_commits.setdefault(commit.sha, (commit, []))[1].append(item_number)
+        else:
+            # Item numbers can appear anywhere in the message, so each message is scanned once for all of them
+            for commit in item_number_index.commits.values():
+                # Empty item numbers are never looked up in the index
+                matched_item_numbers = [item_number for item_number in item_number_matcher.match_commit_message(commit.message)
+                                        if len(item_number) > 0]
+                if len(matched_item_numbers) > 0:
+                    matched_commits[commit.sha] = (commit, matched_item_numbers)
+
+        return sorted(matched_commits.values(), key=lambda match: item_number_index.commit_positions[match[0].sha], reverse=True)
+
+
+    def get_pull_request_commits_from_cache(self, pull_request: PullRequestRecord,
+                                            pull: PullRequest.PullRequest = None) -> list[CommitRecord]:
+        """
+        Returns the cached commits of a pull request, fetching and caching them first if needed
+        """
+
+        commits = self.commit_cache.get_pull_request_commits(self.repository_name, self.target_branch_name, pull_request.number)
+
+        if commits is None:
+            if pull is None:
+                pull = self.github_repository.get_pull(pull_request.number)
+
+            commits = [CommitRecord.from_commit(commit_object) for commit_object in pull.get_commits()]
+            self.commit_cache.save_pull_request_commits(self.repository_name, self.target_branch_name,
+                                                        pull_request.number, commits)
+
+        return commits
+
+
     async def fetch_commits(self) -> None:
         """
         Uses the class' GitHub properties to fetch all commits according to all relevant settings
         """
 
-        async def process_pull_requests_async(pull: PullRequest.PullRequest) -> None:
-            def process_pull_requests(pull: PullRequest.PullRequest):
+        published_commit_shas = set()
+
+        def publish_found_commit(commit: GitCommit.GitCommit, item_numbers: list[str], 
+                                 pr_urls: tuple[str] | None, pr_url: str | None) -> None:
+            # Puts each commit on the commit_queue once, the first time it's found
+            commit_info = self.group_relevant_commit_info(commit, ", ".join(item_numbers), pr_urls, pr_url)
+            if self.ignore_merge_commits and commit_info.is_merge:
+                return
+
+            with self.commit_lock:
+                if commit_info.sha in published_commit_shas:
+                    return
+                published_commit_shas.add(commit_info.sha)
+
+            self.commit_queue.put(commit_info)
+
+        # Workers only queue the commits they find, they're saved in listing order once every worker is done
+        commit_accumulator = CommitAccumulator(publish_found_commit if self.commit_queue is not None else None)
+
+        # Pages are listed while the first pull requests or commits are processed, with a limited number in flight
+        scheduler = BoundedScheduler(self.max_concurrent_requests or self.default_max_concurrent_requests)
+
+        async def process_pull_requests_async(order: int, pull: PullRequest.PullRequest) -> None:
+            def process_pull_requests(order: int, pull: PullRequest.PullRequest):
                 if self.search_date_limit != None and pull.created_at < self.search_date_limit:
                     return
 
-                if pull.merged:
-                    # To explain the '|' characters: When we search for 'ITEM-123' in 'ITEM-12345', we get a match
-                    # To prevent that, we add '|' on the end so we end up searching for 'ITEM-123|' in 'ITEM-12345|'
-                    pull_head_branch = pull.head.ref + '|'
-                    
-                    if self.strip_characters_from_item_numbers:
-                        pull_head_branch = [branch_name + '|' for branch_name in re.sub("\D+", '-', pull_head_branch).strip('-').split('-')]
+                # Only fields from the list payload are read until the pull request is known to be relevant.
+                # pull.merged isn't part of it, so reading it would cost a request per pull request.
+                # When we search for 'ITEM-123' in 'ITEM-12345', we get a match,
+                # so the item number has to end the branch name (or be one of its numbers with StripCharactersFromItemNumbers)
+                matched_item_numbers = item_number_matcher.match_branch_name(pull.head.ref)
+                if len(matched_item_numbers) > 0 and pull.merged_at is not None:
+                    if self.output_to_terminal:
+                        print('.', end='', flush=True)
 
-                    matched_item_numbers = [item_number for item_number in self.item_numbers if(item_number + '|' in pull_head_branch)]
-                    if len(matched_item_numbers) > 0:
-                        item_number = matched_item_numbers[0]
-                        
-                        if self.output_to_terminal:
-                            print('.', end='', flush=True)
+                    for commit_order, commit_object in enumerate(pull.get_commits()):
+                        commit_accumulator.add((1, order, commit_order), commit_object.commit, matched_item_numbers, pr_url=pull.html_url)
 
-                        for commit_object in pull.get_commits():
-                            self.save_commit_info(commit_object.commit, item_number, pr_url=pull.html_url)
+            return await asyncio.to_thread(process_pull_requests, order, pull)
 
-            return await asyncio.to_thread(process_pull_requests, pull)
 
-        
-        async def process_commits_async(commit_object: Commit.Commit) -> None:
-            def process_commits(commit_object: Commit.Commit):
-                commit = commit_object.commit
+        async def process_cached_pull_requests_async(order: int, pull_request: PullRequestRecord, matched_item_numbers: list[str]) -> None:
+            def process_cached_pull_requests(order: int, pull_request: PullRequestRecord, matched_item_numbers: list[str]):
+                if self.search_date_limit != None and pull_request.created_at < self.search_date_limit:
+                    return
+
+                if pull_request.merged:
+                    if self.output_to_terminal:
+                        print('.', end='', flush=True)
 
-                commit_message = commit.message
-                if self.strip_characters_from_item_numbers:
-                    commit_message = re.sub("\D+", '-', commit_message).strip('-').split('-')
+                    commits = self.get_pull_request_commits_from_cache(pull_request,
+                                                                       fetched_pull_requests.get(pull_request.number))
+                    for commit_order, commit in enumerate(commits):
+                        commit_accumulator.add((1, order, commit_order), commit, matched_item_numbers, pr_url=pull_request.html_url)
 
-                matched_item_numbers = [item_number for item_number in self.item_numbers if(item_number in commit_message)]
-                if len(matched_item_numbers) > 0:
-                    item_number = matched_item_numbers[0]
+            return await asyncio.to_thread(process_cached_pull_requests, order, pull_request, matched_item_numbers)
+
+
+        async def process_commits_async(order: int, commit_object: Commit.Commit) -> None:
+            def process_commits(order: int, commit_object: Commit.Commit):
+                commit = commit_object.commit
 
+                matched_item_numbers = item_number_matcher.match_commit_message(commit.message)
+                if len(matched_item_numbers) > 0:
                     if self.output_to_terminal:
                         print('.', end='', flush=True)
 
                     pr_urls = (pull.html_url for pull in commit_object.get_pulls())
-                    self.save_commit_info(commit, item_number, pr_urls=pr_urls)
+                    commit_accumulator.add((0, order), commit, matched_item_numbers, pr_urls=pr_urls)
             
-            return await asyncio.to_thread(process_commits, commit_object)
+            return await asyncio.to_thread(process_commits, order, commit_object)
+
+
+        async def process_cached_commits_async(order: int, commit: CommitRecord, matched_item_numbers: list[str]) -> None:
+            def process_cached_commits(order: int, commit: CommitRecord, matched_item_numbers: list[str]):
+                if self.search_date_limit != None and commit.date < self.search_date_limit:
+                    return
+
+                if self.output_to_terminal:
+                    print('.', end='', flush=True)
+
+                pr_urls = self.get_commit_pull_request_urls_from_cache(commit, fetched_commits.get(commit.sha))
+                commit_accumulator.add((0, order), commit, matched_item_numbers, pr_urls=pr_urls)
+
+            return await asyncio.to_thread(process_cached_commits, order, commit, matched_item_numbers)
+
+
+        def process_merged_pull_requests(pull_requests: Iterable[tuple[PullRequestRecord, Callable[[], list[CommitRecord]]]]) -> None:
+            # Merged pull requests listed along with a way to get their commits, only used once the head ref matches
+            for order, (pull_request, get_commits) in enumerate(pull_requests):
+                matched_item_numbers = item_number_matcher.match_branch_name(pull_request.head_ref)
+                if len(matched_item_numbers) > 0:
+                    if self.output_to_terminal:
+                        print('.', end='', flush=True)
+
+                    for commit_order, commit in enumerate(get_commits()):
+                        commit_accumulator.add((1, order, commit_order), commit, matched_item_numbers, pr_url=pull_request.html_url)
 
         
         if len(self.item_numbers) == 0:
             self.item_numbers = self.manually_enter_item_numbers()
-        
+
+        # Built once for the whole fetch, then every branch name and commit message is matched against it
+        item_number_matcher = ItemNumberMatcher(self.item_numbers, self.strip_characters_from_item_numbers, self.item_number_patterns)
+
+        self.open_commit_cache()
+
         if self.output_to_terminal:
             print("Fetching commits", end='', flush=True)
-        if self.use_commit_history:
-            github_commits = None
-            if self.search_date_limit != None:
-                github_commits = self.github_repository.get_commits(sha=self.github_target_branch.commit.sha, 
-                                                                    since=self.search_date_limit) 
-            else:
-                github_commits =  self.github_repository.get_commits(sha=self.github_target_branch.commit.sha)
+        with LazyCompletionCounter() as lazy_completion_counter:
+            if self.use_commit_history and self.local_repository_path:
+                local_repository = LocalGitRepository(self.local_repository_path, self.repository_name)
 
-            if self.use_concurrent_commit_fetching:
-                await asyncio.gather(*[process_commits_async(commit_object) for commit_object in github_commits])
-            else:
-                for commit_object in github_commits:
-                    await process_commits_async(commit_object)
+                branch_commits = local_repository.get_branch_commits(self.target_branch_name, self.search_date_limit)
+                for order, commit in enumerate(branch_commits):
+                    matched_item_numbers = item_number_matcher.match_commit_message(commit.message)
+                    if len(matched_item_numbers) > 0:
+                        if self.output_to_terminal:
+                            print('.', end='', flush=True)
 
-        if self.use_pull_requests:
-            pull_requests = self.github_repository.get_pulls(state="closed", base=self.target_branch_name)
+                        # Pull requests aren't part of the git history
+                        commit_accumulator.add((0, order), commit, matched_item_numbers)
 
-            if self.use_concurrent_commit_fetching:
-                await asyncio.gather(*[process_pull_requests_async(pull) for pull in pull_requests])
-            else:
-                for pull in pull_requests:
-                    await process_pull_requests_async(pull)
+            elif self.use_commit_history and self.commit_cache is not None:
+                fetched_commits = self.sync_commit_history_cache()
+                matched_commits = self.find_cached_commits_with_item_numbers(item_number_matcher)
+
+                if self.use_concurrent_commit_fetching:
+                    await scheduler.run(matched_commits, lambda order, match: process_cached_commits_async(order, *match))
+                else:
+                    for order, (commit, matched_item_numbers) in enumerate(matched_commits):
+                        await process_cached_commits_async(order, commit, matched_item_numbers)
+
+            elif self.use_commit_history and self.use_graphql:
+                graphql_fetcher = GraphQLFetcher(self.github.requester, self.repository_name)
+
+                branch_commits = graphql_fetcher.get_branch_commits(self.target_branch_name, self.search_date_limit)
+                for order, (commit, pr_urls) in enumerate(branch_commits):
+                    matched_item_numbers = item_number_matcher.match_commit_message(commit.message)
+                    if len(matched_item_numbers) > 0:
+                        if self.output_to_terminal:
+                            print('.', end='', flush=True)
+
+                        commit_accumulator.add((0, order), commit, matched_item_numbers, pr_urls=pr_urls)
+
+            elif self.use_commit_history:
+                github_commits = None
+                if self.search_date_limit != None:
+                    github_commits = self.github_repository.get_commits(sha=self.github_target_branch.commit.sha, 
+                                                                        since=self.search_date_limit) 
+                else:
+                    github_commits =  self.github_repository.get_commits(sha=self.github_target_branch.commit.sha)
+
+                if self.use_concurrent_commit_fetching:
+                    await scheduler.run(github_commits, process_commits_async)
+                else:
+                    for order, commit_object in enumerate(github_commits):
+                        await process_commits_async(order, commit_object)
+
+            if self.use_pull_requests and self.local_repository_path:
+                local_repository = LocalGitRepository(self.local_repository_path, self.repository_name)
+                process_merged_pull_requests(local_repository.get_merged_pull_requests(self.target_branch_name, self.search_date_limit))
+
+            elif self.use_pull_request_search:
+                pull_requests = self.search_merged_pull_requests()
+
+                if self.use_concurrent_commit_fetching:
+                    await scheduler.run(pull_requests, process_pull_requests_async)
+                else:
+                    for order, pull in enumerate(pull_requests):
+                        await process_pull_requests_async(order, pull)
+
+            elif self.use_pull_requests and self.commit_cache is not None:
+                fetched_pull_requests = self.sync_pull_request_cache()
+                matched_pull_requests = self.find_cached_pull_requests_with_item_numbers()
+
+                if self.use_concurrent_commit_fetching:
+                    await scheduler.run(matched_pull_requests, lambda order, match: process_cached_pull_requests_async(order, *match))
+                else:
+                    for order, (pull_request, matched_item_numbers) in enumerate(matched_pull_requests):
+                        await process_cached_pull_requests_async(order, pull_request, matched_item_numbers)
+
+            elif self.use_pull_requests and self.use_graphql:
+                graphql_fetcher = GraphQLFetcher(self.github.requester, self.repository_name)
+                process_merged_pull_requests(graphql_fetcher.get_merged_pull_requests(self.target_branch_name, self.search_date_limit))
+
+            elif self.use_pull_requests:
+                pull_requests = self.get_closed_pull_requests()
+
+                if self.use_concurrent_commit_fetching:
+                    await scheduler.run(pull_requests, process_pull_requests_async)
+                else:
+                    for order, pull in enumerate(pull_requests):
+                        await process_pull_requests_async(order, pull)
+
+            for _, commit, item_numbers, pr_urls, pr_url in commit_accumulator.drain():
+                # A commit is listed under every item number it was found for
+                for item_number in item_numbers:
+                    self.save_commit_info(commit, item_number, pr_urls=pr_urls, pr_url=pr_url)
+
+        self.lazy_completion_count = lazy_completion_counter.count
+        if self.report_lazy_completions and self.output_to_terminal:
+            print(f"\nPyGithub made {self.lazy_completion_count} lazy completion request{'' if self.lazy_completion_count == 1 else 's'}", end='', flush=True)
 
 
     def output_commits(self) -> list[CommitInfo]:
@@ -650,28 +1245,32 @@ class GitTheCommits:
 
         if self.output_to_excel:
             self.generate_excel_file()
-        
-        if len(self.commit_list) == 0:
-            output = "No commits found"
 
-            if self.output_to_terminal:
-                print("\n" + output)
-            if self.output_to_txt:
-                with open("output.txt", 'w') as file:
-                    file.write(output)
+        total_commits = []
+
+        # Written as it's produced so the whole output is never held in memory
+        with TextOutputWriter(self.output_to_terminal, "output.txt" if self.output_to_txt else None) as text_output_writer:
+            if len(self.commit_list) == 0:
+                text_output_writer.write_section("No commits found")
+            else:
+                total_commits = self.write_commits(text_output_writer)
 
-            if self.output_to_terminal:
-                input("Press Enter to exit...")
-            return []
+        if self.output_to_terminal:
+            # Do not immediately close program
+            input("Press Enter to exit...")
+
+        return total_commits
+
+
+    def write_commits(self, text_output_writer: TextOutputWriter) -> list[CommitInfo]:
+        """
+        Writes all commits stored in the class to the text output and returns them in the order they were written
+        """
 
         total_commits = []
-        total_output = ""
-        output = f"Found {len(self.commit_list)} related commit{'' if len(self.commit_list) == 1 else 's'}"
+        returned_commit_ids = set()
 
-        if self.output_to_terminal:
-            print("\n" + output)
-        if self.output_to_txt:
-            total_output += output
+        text_output_writer.write_section(f"Found {len(self.commit_list)} related commit{'' if len(self.commit_list) == 1 else 's'}")
 
         if self.group_commits_by_item:
             sorted_item_numbers = self.sort_item_numbers_by_commit_dates()
@@ -679,65 +1278,40 @@ class GitTheCommits:
             for item_number in sorted_item_numbers:
                 # No commits found
                 if not item_number in self.item_commit_dictionary:
-                    output = f"\nNo commits found for '{item_number}'\n\n---"
-
-                    if self.output_to_terminal:
-                        print(output)
-                    if self.output_to_txt:
-                        total_output += "\n" + output
+                    text_output_writer.write_section(f"\nNo commits found for '{item_number}'\n\n---")
                     continue
 
                 item_commit_list = [self.commit_list[index] for index in self.item_commit_dictionary[item_number]]
                 sorted_commit_list = sorted(item_commit_list, key=lambda x: x.date, reverse=self.order_commits_by_date_descend)
-                total_commits.extend(sorted_commit_list)
+
+                # Commits that belong to more than one item are only returned once
+                total_commits.extend(commit for commit in sorted_commit_list if id(commit) not in returned_commit_ids)
+                returned_commit_ids.update(id(commit) for commit in sorted_commit_list)
 
                 # Commit info
-                if self.output_to_terminal or self.output_to_txt:
-                    output = f"\nCommit{'' if len(item_commit_list) == 1 else 's'} for {item_number} ({len(item_commit_list)}):"
-                    output += self.stringify_commits(sorted_commit_list)
+                if text_output_writer.is_enabled:
+                    text_output_writer.write_section(f"\nCommit{'' if len(item_commit_list) == 1 else 's'} for {item_number} ({len(item_commit_list)}):")
+                    self.write_stringified_commits(text_output_writer, sorted_commit_list)
 
                     # Cherry Pick Command
                     if self.item_cherry_pick:
-                        output += "\n" + self.generate_cherry_pick_command(item_commit_list)
+                        text_output_writer.write("\n" + self.generate_cherry_pick_command(item_commit_list))
 
-                    output += "\n---"
-
-                    if self.output_to_terminal:
-                        print(output)
-                    if self.output_to_txt:
-                        total_output += "\n" + output
+                    text_output_writer.write("\n---")
             
-            if self.all_commits_cherry_pick_command and (self.output_to_terminal or self.output_to_txt):
+            if self.all_commits_cherry_pick_command and text_output_writer.is_enabled:
                 # git cherry-pick command should stay in date-specific order, despite GroupCommitsByItem setting
-                output = "\n" + self.generate_cherry_pick_command(self.commit_list)
-
-                if self.output_to_terminal:
-                    print(output)
-                if self.output_to_txt:
-                    total_output += "\n" + output
+                text_output_writer.write_section("\n" + self.generate_cherry_pick_command(self.commit_list))
         else:
             sorted_commit_list = sorted(self.commit_list, key=lambda x: x.date, reverse=self.order_commits_by_date_descend)
             total_commits.extend(sorted_commit_list)
 
-            if self.output_to_terminal or self.output_to_txt:
-                output = f"Here are all commits for your items in {'descending' if self.order_commits_by_date_descend else 'acsending'} order:\n"
-                output += self.stringify_commits(sorted_commit_list)
+            if text_output_writer.is_enabled:
+                text_output_writer.write_section(f"Here are all commits for your items in {'descending' if self.order_commits_by_date_descend else 'acsending'} order:\n")
+                self.write_stringified_commits(text_output_writer, sorted_commit_list)
                 
                 if self.all_commits_cherry_pick_command:
-                    output += "\n" + self.generate_cherry_pick_command(self.commit_list)
-
-                if self.output_to_terminal:
-                    print(output)
-                if self.output_to_txt:
-                    total_output += "\n" + output
-
-        if self.output_to_txt:
-            with open("output.txt", 'w') as file:
-                file.write(total_output)
-        
-        if self.output_to_terminal:
-            # Do not immediately close program
-            input("Press Enter to exit...")
+                    text_output_writer.write("\n" + self.generate_cherry_pick_command(self.commit_list))
 
         return total_commits
 
@@ -747,8 +1321,42 @@ class GitTheCommits:
         Connects to GitHub and pulls down the repository and target branch
         """
 
-        auth = Auth.Token(self.github_token)
-        github = Github(auth=auth, seconds_between_requests=self.seconds_between_github_requests)
+        github_tokens = self.github_token if isinstance(self.github_token, list) else [self.github_token]
+        auth = Auth.Token(github_tokens[0])
+
+        connection_class = None
+        github_arguments = { "seconds_between_requests": self.seconds_between_github_requests }
+
+        if len(github_tokens) > 1:
+            self.token_pool = TokenPool(github_tokens)
+            connection_class = self.token_pool.create_connection_class()
+
+            # Rate limited requests are failed over to another token by the pool instead of being retried with the same one
+            github_arguments = { 
+                "seconds_between_requests": 0, 
+                "retry": Retry(total=10, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+            }
+        elif self.use_adaptive_throttling:
+            self.rate_limit_throttle = RateLimitThrottle()
+            connection_class = self.rate_limit_throttle.create_connection_class()
+            github_arguments = { "seconds_between_requests": 0 }
+
+        # Listings that haven't changed since the last run are answered from the cache without using up the rate limit
+        if self.open_commit_cache() is not None:
+            connection_class = ConditionalRequestCache(self.commit_cache).create_connection_class(
+                connection_class if connection_class is not None else HTTPSRequestsConnectionClass
+            )
+
+        if connection_class is not None:
+            # The connection class is picked up when the client is created, so it's only swapped in for that
+            Requester.injectConnectionClasses(HTTPRequestsConnectionClass, connection_class)
+            try:
+                github = Github(auth=auth, **github_arguments)
+            finally:
+                Requester.resetConnectionClasses()
+        else:
+            github = Github(auth=auth, **github_arguments)
+        self.github = github
 
         try:
             self.github_repository = github.get_repo(self.repository_name)
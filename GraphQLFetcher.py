@@ -0,0 +1,182 @@
+from CommitRecord import CommitRecord
+from datetime import datetime, timezone
+from github.Requester import Requester
+from PullRequestRecord import PullRequestRecord
+from typing import Callable, Iterator
+
+
+COMMIT_FIELDS = """
+    oid
+    message
+    url
+    author { name email date }
+    parents { totalCount }
+"""
+
+PULL_REQUESTS_QUERY = """
+query ($owner: String!, $name: String!, $base: String!, $after: String) {
+    repository(owner: $owner, name: $name) {
+        pullRequests(baseRefName: $base, states: [MERGED], first: 100, after: $after,
+                     orderBy: { field: CREATED_AT, direction: DESC }) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+                number
+                headRefName
+                merged
+                createdAt
+                updatedAt
+                mergedAt
+                url
+                commits(first: 100) {
+                    pageInfo { hasNextPage endCursor }
+                    nodes { commit { %s } }
+                }
+            }
+        }
+    }
+}
+""" % COMMIT_FIELDS
+
+PULL_REQUEST_COMMITS_QUERY = """
+query ($owner: String!, $name: String!, $number: Int!, $after: String) {
+    repository(owner: $owner, name: $name) {
+        pullRequest(number: $number) {
+            commits(first: 100, after: $after) {
+                pageInfo { hasNextPage endCursor }
+                nodes { commit { %s } }
+            }
+        }
+    }
+}
+""" % COMMIT_FIELDS
+
+BRANCH_HISTORY_QUERY = """
+query ($owner: String!, $name: String!, $branch: String!, $since: GitTimestamp, $after: String) {
+    repository(owner: $owner, name: $name) {
+        ref(qualifiedName: $branch) {
+            target {
+                ... on Commit {
+                    history(first: 100, after: $after, since: $since) {
+                        pageInfo { hasNextPage endCursor }
+                        nodes {
+                            %s
+                            associatedPullRequests(first: 100) { nodes { url } }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+""" % COMMIT_FIELDS
+
+
+class GraphQLFetcher:
+    """
+    Fetches pull requests and commits through GitHub's GraphQL API.
+    Pull requests come with their commits and commits come with their pull requests, 100 at a time,
+    so there is no follow-up request per pull request or commit like with the REST API.
+    """
+
+    def __init__(self, requester: Requester, repository_name: str) -> None:
+        self.requester = requester
+        self.owner, self.name = repository_name.split('/', 1)
+
+
+    def query(self, query: str, variables: dict) -> dict:
+        _, response = self.requester.graphql_query(query, { "owner": self.owner, "name": self.name, **variables })
+        return response["data"]["repository"]
+
+
+    def get_merged_pull_requests(self, base: str, since: datetime = None
+                                 ) -> Iterator[tuple[PullRequestRecord, Callable[[], list[CommitRecord]]]]:
+        """
+        Lists the merged pull requests to the base branch, newest first, stopping at the since date.
+        Each comes with a function returning its commits
+        """
+
+        after = None
+        while True:
+            pull_requests = self.query(PULL_REQUESTS_QUERY, { "base": base, "after": after })["pullRequests"]
+
+            for node in pull_requests["nodes"]:
+                pull_request = PullRequestRecord(
+                    number = node["number"],
+                    head_ref = node["headRefName"],
+                    merged = node["merged"],
+                    created_at = parse_timestamp(node["createdAt"]),
+                    updated_at = parse_timestamp(node["updatedAt"]),
+                    merged_at = parse_timestamp(node["mergedAt"]) if node["mergedAt"] is not None else None,
+                    html_url = node["url"]
+                )
+
+                # Pull requests are listed newest first, so no further pages need to be fetched
+                if since != None and pull_request.created_at < since:
+                    return
+
+                # Commits past the first page are only fetched for the pull requests that are wanted
+                yield pull_request, lambda number=pull_request.number, commits=node["commits"]: self.get_pull_request_commits(number, commits)
+
+            if not pull_requests["pageInfo"]["hasNextPage"]:
+                return
+
+            after = pull_requests["pageInfo"]["endCursor"]
+
+
+    def get_pull_request_commits(self, number: int, commits: dict) -> list[CommitRecord]:
+        """
+        Returns every commit of a pull request, fetching any commits past the first page that came with it
+        """
+
+        commit_records = [commit_node_to_record(node["commit"]) for node in commits["nodes"]]
+
+        while commits["pageInfo"]["hasNextPage"]:
+            commits = self.query(
+                PULL_REQUEST_COMMITS_QUERY, { "number": number, "after": commits["pageInfo"]["endCursor"] }
+            )["pullRequest"]["commits"]
+            commit_records.extend(commit_node_to_record(node["commit"]) for node in commits["nodes"])
+
+        return commit_records
+
+
+    def get_branch_commits(self, branch: str, since: datetime = None) -> Iterator[tuple[CommitRecord, list[str]]]:
+        """
+        Lists the branch's history, newest first, with the urls of the pull requests each commit is part of
+        """
+
+        after = None
+        while True:
+            ref = self.query(BRANCH_HISTORY_QUERY, {
+                "branch": branch,
+                "since": since.isoformat() if since != None else None,
+                "after": after
+            })["ref"]
+
+            if ref is None:
+                return
+
+            history = ref["target"]["history"]
+            for node in history["nodes"]:
+                yield commit_node_to_record(node), [pull_request["url"] for pull_request in node["associatedPullRequests"]["nodes"]]
+
+            if not history["pageInfo"]["hasNextPage"]:
+                return
+
+            after = history["pageInfo"]["endCursor"]
+
+
+def parse_timestamp(value: str) -> datetime:
+    # GraphQL keeps the committer's offset, the REST API always returns UTC
+    return datetime.fromisoformat(value).astimezone(timezone.utc)
+
+
+def commit_node_to_record(node: dict) -> CommitRecord:
+    return CommitRecord(
+        sha = node["oid"],
+        message = node["message"],
+        author_name = node["author"]["name"],
+        author_email = node["author"]["email"],
+        date = parse_timestamp(node["author"]["date"]),
+        html_url = node["url"],
+        parent_count = node["parents"]["totalCount"]
+    )
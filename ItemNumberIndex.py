@@ -0,0 +1,123 @@
+from CommitRecord import CommitRecord
+from ItemNumberMatcher import get_item_number_tokens
+from PullRequestRecord import PullRequestRecord
+
+import re
+
+
+class ItemNumberIndex:
+    """
+    Maps item numbers to the cached pull requests and commits they appear in.
+    Every branch name and commit message is tokenized once, so looking up an item number doesn't rescan the repository.
+    """
+
+    def __init__(self, strip_characters_from_item_numbers: bool, item_number_patterns: list[re.Pattern] = None) -> None:
+        self.strip_characters_from_item_numbers = strip_characters_from_item_numbers
+        self.item_number_patterns = list(item_number_patterns or [])
+
+        self.pull_requests = dict() # number : PullRequestRecord
+        self.pull_request_tokens = dict() # token : set of pull request numbers
+        self.pull_request_suffixes = dict() # suffix length : {suffix : set of pull request numbers}
+
+        self.commits = dict() # sha : CommitRecord
+        self.commit_positions = dict() # sha : position in the branch history (higher is newer)
+        self.commit_tokens = dict() # token : set of commit shas
+
+
+    def uses_tokens(self) -> bool:
+        return len(self.item_number_patterns) > 0 or self.strip_characters_from_item_numbers
+
+
+    def tokenize(self, text: str) -> set[str]:
+        return get_item_number_tokens(self.item_number_patterns, text)
+
+
+    def add_pull_request(self, pull_request: PullRequestRecord) -> None:
+        """
+        Indexes a pull request by its head branch name, replacing any previously indexed version of it
+        """
+
+        self.remove_pull_request(pull_request.number)
+        self.pull_requests[pull_request.number] = pull_request
+
+        if self.uses_tokens():
+            for token in self.tokenize(pull_request.head_ref):
+                self.pull_request_tokens.setdefault(token, set()).add(pull_request.number)
+        else:
+            # Without stripping, 'ITEM-123|' must be found in 'head-ref|', meaning the item number ends the branch name
+            for suffix_length, suffixes in self.pull_request_suffixes.items():
+                suffixes.setdefault(pull_request.head_ref[-suffix_length:], set()).add(pull_request.number)
+
+
+    def remove_pull_request(self, number: int) -> None:
+        pull_request = self.pull_requests.pop(number, None)
+        if pull_request is None:
+            return
+
+        if self.uses_tokens():
+            for token in self.tokenize(pull_request.head_ref):
+                self.pull_request_tokens[token].discard(number)
+        else:
+            for suffix_length, suffixes in self.pull_request_suffixes.items():
+                suffixes[pull_request.head_ref[-suffix_length:]].discard(number)
+
+
+    def get_pull_requests(self, item_number: str) -> list[PullRequestRecord]:
+        """
+        Returns every indexed pull request whose head branch name contains the item number, newest first
+        """
+
+        if len(item_number) == 0:
+            return []
+
+        if self.uses_tokens():
+            numbers = self.pull_request_tokens.get(item_number, set())
+        else:
+            suffix_length = len(item_number)
+
+            # Suffixes are only indexed for the item number lengths that have been asked for
+            if suffix_length not in self.pull_request_suffixes:
+                suffixes = dict()
+                for pull_request in self.pull_requests.values():
+                    suffixes.setdefault(pull_request.head_ref[-suffix_length:], set()).add(pull_request.number)
+                self.pull_request_suffixes[suffix_length] = suffixes
+
+            numbers = self.pull_request_suffixes[suffix_length].get(item_number, set())
+
+        return [self.pull_requests[number] for number in sorted(numbers, reverse=True)]
+
+
+    def add_commits(self, commits: list[CommitRecord]) -> None:
+        """
+        Indexes branch commits (newest first) by their messages on top of the ones already indexed
+        """
+
+        newest_position = max(self.commit_positions.values(), default=0)
+
+        for index, commit in enumerate(commits):
+            self.commits[commit.sha] = commit
+            self.commit_positions[commit.sha] = newest_position + len(commits) - index
+
+            if self.uses_tokens():
+                for token in self.tokenize(commit.message):
+                    self.commit_tokens.setdefault(token, set()).add(commit.sha)
+
+
+    def clear_commits(self) -> None:
+        self.commits = dict()
+        self.commit_positions = dict()
+        self.commit_tokens = dict()
+
+
+    def get_commits(self, item_number: str) -> list[CommitRecord]:
+        """
+        Returns every indexed commit whose message has the item number as a token, newest first.
+        Without tokens, the item number can appear anywhere in the message, so messages are scanned with an ItemNumberMatcher instead
+        """
+
+        if len(item_number) == 0:
+            return []
+
+        shas = self.commit_tokens.get(item_number, set())
+
+        return [self.commits[sha] for sha in sorted(shas, key=lambda sha: self.commit_positions[sha], reverse=True)]
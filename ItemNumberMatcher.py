@@ -0,0 +1,146 @@
+from typing import Iterable
+
+import re
+
+
+def extract_item_numbers(item_number_patterns: list[re.Pattern], text: str) -> list[str]:
+    """
+    Returns every item number the patterns find in the text, in the order they're found.
+    A pattern's first capture group that matched is the item number (Ex: '(?:PROJ|OPS)-(\\d+)' finds '123' in 'PROJ-123'),
+    or its whole match if it has none
+    """
+
+    item_numbers = []
+    for item_number_pattern in item_number_patterns:
+        for match in item_number_pattern.finditer(text):
+            item_numbers.append(next((group for group in match.groups() if group is not None), match.group(0)))
+
+    return item_numbers
+
+
+def get_item_number_tokens(item_number_patterns: list[re.Pattern], text: str) -> set[str]:
+    """
+    Splits text into the item number tokens used with item number patterns or StripCharactersFromItemNumbers on
+    """
+
+    if len(item_number_patterns) > 0:
+        return set(extract_item_numbers(item_number_patterns, text))
+
+    # Same as re.sub("\D+", '-', text).strip('-').split('-'), which leaves one empty token when there are no digits
+    return set(re.findall(r"\d+", text)) or {""}
+
+
+class ItemNumberMatcher:
+    """
+    Finds which item numbers appear in a branch name or commit message by scanning the text once,
+    instead of searching it again for every item number. Built once for a list of item numbers and reused for every text.
+    Matches are returned in the order of the item numbers, the same as checking them one by one.
+    With item number patterns, an item number matches if the patterns extract it from the text.
+    """
+
+    def __init__(self, item_numbers: list[str], strip_characters_from_item_numbers: bool,
+                 item_number_patterns: list[re.Pattern] = None) -> None:
+        self.item_numbers = list(item_numbers)
+        self.strip_characters_from_item_numbers = strip_characters_from_item_numbers
+        self.item_number_patterns = list(item_number_patterns or [])
+
+        # An empty item number is found in any text
+        self.empty_positions = [position for position, item_number in enumerate(self.item_numbers) if len(item_number) == 0]
+
+        self.token_positions = dict() # token : positions of the item numbers equal to it
+        self.suffix_positions = dict() # length : {suffix : positions of the item numbers equal to it}
+        self.prefix_positions = dict() # item number : positions of the item numbers it starts with
+
+        for position, item_number in enumerate(self.item_numbers):
+            self.token_positions.setdefault(item_number, []).append(position)
+            self.suffix_positions.setdefault(len(item_number), dict()).setdefault(item_number, []).append(position)
+
+        # Item numbers found at the same spot in a text all start the longest one found there
+        distinct_item_numbers = [item_number for item_number in self.token_positions if len(item_number) > 0]
+        for item_number in distinct_item_numbers:
+            self.prefix_positions[item_number] = [position for prefix in distinct_item_numbers if item_number.startswith(prefix)
+                                                  for position in self.token_positions[prefix]]
+
+        # Tries every spot in the text, each time matching the longest item number that starts there
+        self.item_number_pattern = None
+        if len(distinct_item_numbers) > 0:
+            self.item_number_pattern = re.compile(f"(?=({self.build_trie_pattern(distinct_item_numbers)}))")
+
+
+    @staticmethod
+    def build_trie_pattern(item_numbers: list[str]) -> str:
+        """
+        Builds a regex matching any of the item numbers, sharing their common prefixes so the regex engine
+        only walks each spot in the text once instead of once for each item number
+        """
+
+        trie = dict()
+        for item_number in item_numbers:
+            node = trie
+            for character in item_number:
+                node = node.setdefault(character, dict())
+            node[""] = None
+
+        def to_pattern(node: dict) -> str:
+            alternatives = [re.escape(character) + to_pattern(child) for character, child in node.items() if character != ""]
+            if len(alternatives) == 0:
+                return ""
+
+            pattern = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+
+            # Optional and greedy, so the longest item number is matched when one starts another
+            return f"(?:{pattern})?" if "" in node else pattern
+
+        return to_pattern(trie)
+
+
+    def uses_tokens(self) -> bool:
+        return len(self.item_number_patterns) > 0 or self.strip_characters_from_item_numbers
+
+
+    def get_tokens(self, text: str) -> set[str]:
+        return get_item_number_tokens(self.item_number_patterns, text)
+
+
+    def to_item_numbers(self, positions: Iterable[int]) -> list[str]:
+        return [self.item_numbers[position] for position in sorted(positions)]
+
+
+    def match_branch_name(self, branch_name: str) -> list[str]:
+        """
+        Returns all item numbers found in a pull request's head branch name
+        """
+
+        if self.uses_tokens():
+            return self.to_item_numbers(position for token in self.get_tokens(branch_name)
+                                        for position in self.token_positions.get(token, []))
+
+        # Without stripping, 'ITEM-123|' must be found in 'head-ref|', meaning the item number ends the branch name
+        # (unless the branch name has a '|' of its own, which is rare enough to check the slow way)
+        if '|' in branch_name:
+            return [item_number for item_number in self.item_numbers if item_number + '|' in branch_name + '|']
+
+        positions = list(self.empty_positions)
+        for length, suffixes in self.suffix_positions.items():
+            if length > 0:
+                positions.extend(suffixes.get(branch_name[-length:], []))
+
+        return self.to_item_numbers(positions)
+
+
+    def match_commit_message(self, commit_message: str) -> list[str]:
+        """
+        Returns all item numbers found in a commit message
+        """
+
+        if self.uses_tokens():
+            return self.to_item_numbers(position for token in self.get_tokens(commit_message)
+                                        for position in self.token_positions.get(token, []))
+
+        # Without stripping, the item number can appear anywhere in the message
+        positions = set(self.empty_positions)
+        if self.item_number_pattern is not None:
+            for item_number in set(self.item_number_pattern.findall(commit_message)):
+                positions.update(self.prefix_positions[item_number])
+
+        return self.to_item_numbers(positions)
@@ -0,0 +1,36 @@
+from github.GithubObject import CompletableGithubObject
+
+import threading
+
+
+class LazyCompletionCounter:
+    """
+    Counts how many times PyGithub completes a lazily loaded object while the counter is active.
+    Each completion is an extra GET request, so a rising count means an attribute outside the list payload is being read.
+    """
+
+    def __init__(self) -> None:
+        # Completions can happen from multiple threads when UseConcurrentCommitFetching is on
+        self.lock = threading.Lock()
+        self.count = 0
+        self.original_complete = None
+
+
+    def __enter__(self) -> "LazyCompletionCounter":
+        original_complete = CompletableGithubObject._complete
+        counter = self
+
+        def counting_complete(github_object: CompletableGithubObject, *args, **kwargs) -> None:
+            with counter.lock:
+                counter.count += 1
+
+            return original_complete(github_object, *args, **kwargs)
+
+        self.original_complete = original_complete
+        CompletableGithubObject._complete = counting_complete
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback) -> None:
+        CompletableGithubObject._complete = self.original_complete
+        self.original_complete = None
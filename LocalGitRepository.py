@@ -0,0 +1,133 @@
+from CommitRecord import CommitRecord
+from datetime import datetime, timezone
+from PullRequestRecord import PullRequestRecord
+from typing import Callable, Iterator
+
+import re
+import subprocess
+
+
+# Separates the fields of a commit and the commits themselves in the git log output,
+# neither can appear in a commit message
+FIELD_SEPARATOR = '\x1f'
+COMMIT_SEPARATOR = '\x1e'
+
+LOG_FORMAT = FIELD_SEPARATOR.join(["%H", "%an", "%ae", "%aI", "%P", "%B"]) + COMMIT_SEPARATOR
+
+# The message GitHub gives the merge commit of a pull request. Ex: "Merge pull request #12 from user/ITEM-1234-fix"
+PULL_REQUEST_MERGE_MESSAGE = re.compile(r"^Merge pull request #(\d+) from [^/\s]+/(\S+)")
+
+
+class LocalGitRepository:
+    """
+    Reads a branch's history and pull requests from a local clone of the repository with git log, without calling out to GitHub.
+    """
+
+    def __init__(self, path: str, repository_name: str) -> None:
+        self.path = path
+        self.repository_name = repository_name
+
+
+    def run_git(self, *arguments: str) -> subprocess.CompletedProcess:
+        return subprocess.run(["git", "-C", self.path, *arguments], capture_output=True, text=True)
+
+
+    def resolve_branch(self, branch: str) -> str:
+        """
+        Returns the ref to read the branch from, preferring the remote-tracking branch since it matches GitHub
+        """
+
+        for ref in [f"refs/remotes/origin/{branch}", f"refs/heads/{branch}"]:
+            if self.run_git("rev-parse", "--verify", "--quiet", ref).returncode == 0:
+                return ref
+
+        raise Exception(f"Could not find the branch '{branch}' in the local repository at '{self.path}'")
+
+
+    def get_branch_commits(self, branch: str, since: datetime = None) -> Iterator[CommitRecord]:
+        """
+        Lists the branch's history, newest first, reading git log's output as it's written
+        """
+
+        arguments = [self.resolve_branch(branch)]
+        if since != None:
+            arguments.append(f"--since={since.isoformat()}")
+
+        return self.log(*arguments)
+
+
+    def get_merged_pull_requests(self, branch: str, since: datetime = None
+                                 ) -> Iterator[tuple[PullRequestRecord, Callable[[], list[CommitRecord]]]]:
+        """
+        Lists the pull requests merged into the branch, newest first, by walking its first-parent history.
+        Each comes with a function reading its commits, so git log only runs for the pull requests that are wanted.
+        Only pull requests merged with a merge commit can be found (squashed and rebased ones leave no trace of their branch).
+        """
+
+        arguments = ["--first-parent", "--merges", self.resolve_branch(branch)]
+        if since != None:
+            arguments.append(f"--since={since.isoformat()}")
+
+        for merge_commit in self.log(*arguments):
+            match = PULL_REQUEST_MERGE_MESSAGE.match(merge_commit.message)
+            if match is None:
+                continue
+
+            number = int(match.group(1))
+            pull_request = PullRequestRecord(
+                number = number,
+                head_ref = match.group(2),
+                merged = True,
+                # The merge is the only date the history has
+                created_at = merge_commit.date,
+                updated_at = merge_commit.date,
+                merged_at = merge_commit.date,
+                html_url = f"https://github.com/{self.repository_name}/pull/{number}"
+            )
+
+            yield pull_request, lambda merge_sha=merge_commit.sha: self.get_merged_commits(merge_sha)
+
+
+    def get_merged_commits(self, merge_sha: str) -> list[CommitRecord]:
+        """
+        Returns everything the merged branch brought in that wasn't on the target branch yet, oldest first like the REST API
+        """
+
+        return list(self.log("--reverse", f"{merge_sha}^1..{merge_sha}^2"))
+
+
+    def log(self, *arguments: str) -> Iterator[CommitRecord]:
+        """
+        Runs git log with the arguments, reading its output as it's written
+        """
+
+        arguments = ["git", "-C", self.path, "log", *arguments, f"--format={LOG_FORMAT}"]
+
+        with subprocess.Popen(arguments, stdout=subprocess.PIPE, text=True, encoding="utf-8", errors="replace") as process:
+            pending_output = ""
+
+            for chunk in iter(lambda: process.stdout.read(65536), ""):
+                pending_output += chunk
+                *entries, pending_output = pending_output.split(COMMIT_SEPARATOR)
+
+                for entry in entries:
+                    yield self.parse_log_entry(entry)
+
+        if process.returncode != 0:
+            raise Exception(f"git log {' '.join(arguments[4:-1])} failed in the local repository at '{self.path}'")
+
+
+    def parse_log_entry(self, entry: str) -> CommitRecord:
+        # Each entry after the first starts with the newline git log puts between commits
+        sha, author_name, author_email, date, parents, message = entry.lstrip('\n').split(FIELD_SEPARATOR, 5)
+
+        return CommitRecord(
+            sha = sha,
+            # Matches the REST API, which leaves off the message's trailing newline
+            message = message.rstrip('\n'),
+            author_name = author_name,
+            author_email = author_email,
+            date = datetime.fromisoformat(date).astimezone(timezone.utc),
+            html_url = f"https://github.com/{self.repository_name}/commit/{sha}",
+            parent_count = len(parents.split())
+        )
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import datetime
+from github import PullRequest
+
+
+@dataclass
+class PullRequestRecord(object):
+    """Stores the pull request data we cache."""
+
+    number: int
+    head_ref: str
+    merged: bool
+    created_at: datetime
+    updated_at: datetime
+    merged_at: datetime | None
+    html_url: str
+
+
+    @staticmethod
+    def from_pull_request(pull: PullRequest.PullRequest) -> "PullRequestRecord":
+        """
+        Builds a record from a listed pull request, only using fields that are part of the list payload
+        """
+
+        return PullRequestRecord(
+            number = pull.number,
+            head_ref = pull.head.ref,
+            merged = pull.merged_at is not None,
+            created_at = pull.created_at,
+            updated_at = pull.updated_at,
+            merged_at = pull.merged_at,
+            html_url = pull.html_url
+        )
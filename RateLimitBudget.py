@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RateLimitBudget(object):
+    """Stores what's left of one of GitHub's rate limits (Ex: core, search or graphql)."""
+
+    limit: int = None
+    remaining: int = None
+    reset_at: float = None
+
+    # When the next request counted against this rate limit can go out
+    next_request_at: float = 0
@@ -0,0 +1,129 @@
+from github.Requester import HTTPSRequestsConnectionClass, RequestsResponse
+from RateLimitBudget import RateLimitBudget
+from typing import Callable, Mapping
+
+import threading
+import time
+
+
+class RateLimitThrottle:
+    """
+    Spaces out GitHub requests based on the rate limit headers of previous responses.
+    Requests go out as fast as they're made while plenty of the budget is left, then get spread out more and more
+    as it runs low so the budget lasts until it resets. GitHub has a separate budget per resource (Ex: search requests
+    have their own 30 per minute), each tracked on its own. Secondary rate limits (Retry-After) pause every request.
+    """
+
+    # Requests aren't spaced out until less than this share of the rate limit is left
+    low_budget_ratio = 0.2
+
+    def __init__(self, clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep) -> None:
+        # Requests are made from multiple threads when UseConcurrentCommitFetching is on
+        self.lock = threading.Lock()
+        self.clock = clock
+        self.sleep = sleep
+
+        self.budgets = dict() # resource : RateLimitBudget
+        self.retry_at = 0
+
+
+    def get_budget(self, resource: str = "core") -> RateLimitBudget:
+        return self.budgets.setdefault(resource, RateLimitBudget())
+
+
+    def update(self, headers: Mapping[str, str], resource: str = "core") -> None:
+        """
+        Reads the rate limit headers of a response to a request made against the resource
+        """
+
+        headers = {key.lower(): value for key, value in headers.items()}
+
+        with self.lock:
+            if "x-ratelimit-remaining" in headers and "x-ratelimit-reset" in headers:
+                # GitHub says which rate limit the response was counted against
+                budget = self.get_budget(headers.get("x-ratelimit-resource", resource))
+                budget.remaining = int(headers["x-ratelimit-remaining"])
+                budget.reset_at = float(headers["x-ratelimit-reset"])
+
+                if "x-ratelimit-limit" in headers:
+                    budget.limit = int(headers["x-ratelimit-limit"])
+
+            if "retry-after" in headers:
+                self.retry_at = max(self.retry_at, self.clock() + float(headers["retry-after"]))
+
+
+    def get_seconds_between_requests(self, now: float, resource: str = "core") -> float:
+        """
+        Returns how long to wait between requests against the resource so its remaining budget lasts until it resets
+        """
+
+        budget = self.get_budget(resource)
+        if budget.remaining is None or budget.limit is None or budget.remaining >= budget.limit * self.low_budget_ratio:
+            return 0
+
+        seconds_until_reset = max(budget.reset_at - now, 0)
+
+        # Grows from no wait at all when the budget first runs low, to spreading the requests evenly once it's nearly gone
+        low_budget_weight = 1 - budget.remaining / (budget.limit * self.low_budget_ratio)
+        return low_budget_weight * seconds_until_reset / max(budget.remaining, 1)
+
+
+    def wait(self, resource: str = "core") -> None:
+        """
+        Blocks until the next request against the resource can be made without going over its rate limit
+        """
+
+        with self.lock:
+            budget = self.get_budget(resource)
+            now = self.clock()
+            request_at = max(now, budget.next_request_at, self.retry_at)
+
+            if budget.remaining is not None:
+                if budget.remaining <= 0 and budget.reset_at > now:
+                    request_at = max(request_at, budget.reset_at)
+
+                # Counted now so requests that are already in flight aren't given the same budget
+                budget.remaining -= 1
+
+            budget.next_request_at = request_at + self.get_seconds_between_requests(request_at, resource)
+
+        if request_at > now:
+            self.sleep(request_at - now)
+
+
+    def create_connection_class(self) -> type[HTTPSRequestsConnectionClass]:
+        """
+        Returns a PyGithub connection class that waits on this throttle before every request
+        """
+
+        return type("ThrottledHTTPSRequestsConnection", (ThrottledHTTPSRequestsConnection,), { "throttle": self })
+
+
+def get_rate_limit_resource(url: str) -> str:
+    """
+    Returns which of GitHub's rate limits a request to the url counts against
+    """
+
+    # GitHub Enterprise serves the API under /api/v3 and GraphQL under /api/graphql
+    path = url.split('?')[0].removeprefix("/api/v3")
+    if path in ("/graphql", "/api/graphql"):
+        return "graphql"
+    if path.startswith("/search/"):
+        return "search"
+
+    return "core"
+
+
+class ThrottledHTTPSRequestsConnection(HTTPSRequestsConnectionClass):
+    """PyGithub's HTTPS connection, throttled by a RateLimitThrottle."""
+
+    throttle: RateLimitThrottle = None
+
+    def getresponse(self) -> RequestsResponse:
+        # PyGithub's request() only stores the request, it's sent here
+        resource = get_rate_limit_resource(self.url)
+        self.throttle.wait(resource)
+
+        response = super().getresponse()
+        self.throttle.update(response.headers, resource)
+        return response
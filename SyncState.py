@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class SyncState(object):
+    """Stores how far a repository's branch has been synced into the CommitCache."""
+
+    # Most recent updated_at (and its pull request number) seen when listing pull requests
+    last_pull_request_updated_at: datetime = None
+    last_pull_request_number: int = None
+
+    # How far back pull requests were synced (None means every pull request)
+    pull_request_history_since: datetime = None
+
+    # The branch's head commit when its commit history was last synced
+    last_commit_sha: str = None
+
+    # How far back the commit history was synced (None means the entire history)
+    commit_history_since: datetime = None
@@ -0,0 +1,62 @@
+from typing import TextIO
+
+
+class TextOutputWriter:
+    """
+    Writes the text output to the terminal and the text file as it's produced, instead of building it all up first,
+    so memory use doesn't grow with the number of commits. Both get the same text, split into sections:
+    the text file separates them with a newline, the terminal prints each one on its own like print() would.
+    """
+
+    def __init__(self, output_to_terminal: bool, txt_filename: str = None) -> None:
+        self.output_to_terminal = output_to_terminal
+        self.txt_filename = txt_filename
+        self.txt_file: TextIO = None
+        self.section_count = 0
+
+
+    def __enter__(self) -> "TextOutputWriter":
+        if self.txt_filename is not None:
+            self.txt_file = open(self.txt_filename, 'w')
+
+        return self
+
+
+    def __exit__(self, *exception_info) -> None:
+        # Ends the last section the way print() would
+        if self.output_to_terminal and self.section_count > 0:
+            print()
+
+        if self.txt_file is not None:
+            self.txt_file.close()
+            self.txt_file = None
+
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.output_to_terminal or self.txt_filename is not None
+
+
+    def start_section(self) -> None:
+        """
+        Starts a new section, separated from the previous one
+        """
+
+        if self.output_to_terminal:
+            print('\n', end='')
+        if self.txt_file is not None and self.section_count > 0:
+            self.txt_file.write('\n')
+
+        self.section_count += 1
+
+
+    def write(self, text: str) -> None:
+        if self.output_to_terminal:
+            print(text, end='')
+        if self.txt_file is not None:
+            self.txt_file.write(text)
+
+
+    def write_section(self, text: str) -> None:
+        self.start_section()
+        self.write(text)
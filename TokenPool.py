@@ -0,0 +1,113 @@
+from github.Requester import HTTPSRequestsConnectionClass, RequestsResponse
+from RateLimitThrottle import RateLimitThrottle, get_rate_limit_resource
+from typing import Callable
+
+import threading
+import time
+
+
+class TokenPool:
+    """
+    Spreads GitHub requests across several access tokens, each with its own rate limit.
+    Every request is sent with the token that has the most of its budget left, and a request that gets rate limited
+    is retried with another token, so the combined hourly limit of every token can be used.
+    Once every token has been rate limited, the one available soonest waits and they're all tried again.
+    """
+
+    # How many times every token is tried before a request that keeps getting rate limited is given up on
+    max_rate_limited_rounds = 10
+
+    def __init__(self, tokens: list[str], clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self.lock = threading.Lock()
+        self.clock = clock
+        self.throttles = { token: RateLimitThrottle(clock, sleep) for token in dict.fromkeys(tokens) }
+
+
+    def get_available_at(self, token: str, resource: str = "core") -> float:
+        """
+        Returns when the token can be used again for the resource without going over its rate limit (0 if it can be used now)
+        """
+
+        throttle = self.throttles[token]
+        budget = throttle.get_budget(resource)
+        available_at = throttle.retry_at
+
+        if budget.remaining is not None and budget.remaining <= 0:
+            available_at = max(available_at, budget.reset_at)
+
+        return available_at
+
+
+    def choose_token(self, excluded_tokens: set[str] = frozenset(), resource: str = "core") -> str | None:
+        """
+        Returns the token with the most of the resource's budget left, or the one available soonest if they are all used up
+        """
+
+        now = self.clock()
+        tokens = [token for token in self.throttles if token not in excluded_tokens]
+
+        if len(tokens) == 0:
+            return None
+
+        with self.lock:
+            available_tokens = [token for token in tokens if self.get_available_at(token, resource) <= now]
+
+            if len(available_tokens) == 0:
+                return min(tokens, key=lambda token: self.get_available_at(token, resource))
+
+            # Tokens that haven't been used yet are tried first so their budget is known
+            remaining = { token: self.throttles[token].get_budget(resource).remaining for token in available_tokens }
+            return max(available_tokens, key=lambda token: float("inf") if remaining[token] is None else remaining[token])
+
+
+    def create_connection_class(self) -> type[HTTPSRequestsConnectionClass]:
+        """
+        Returns a PyGithub connection class that sends every request with a token from this pool
+        """
+
+        return type("TokenPoolHTTPSRequestsConnection", (TokenPoolHTTPSRequestsConnection,), { "token_pool": self })
+
+
+def is_rate_limited(response: RequestsResponse) -> bool:
+    return response.status in (403, 429) and (
+        response.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in response.headers
+    )
+
+
+class TokenPoolHTTPSRequestsConnection(HTTPSRequestsConnectionClass):
+    """PyGithub's HTTPS connection, sending each request with a token chosen by a TokenPool."""
+
+    token_pool: TokenPool = None
+
+    def getresponse(self) -> RequestsResponse:
+        resource = get_rate_limit_resource(self.url)
+        tried_tokens = set()
+        rounds = 1
+        token = self.token_pool.choose_token(resource=resource)
+
+        while True:
+            throttle = self.token_pool.throttles[token]
+            throttle.wait(resource)
+
+            # PyGithub's request() only stores the request, it's sent here with the chosen token
+            self.headers = { **self.headers, "Authorization": f"token {token}" }
+            response = super().getresponse()
+            throttle.update(response.headers, resource)
+
+            if not is_rate_limited(response):
+                return response
+
+            # Rate limited requests fail over to the next token
+            tried_tokens.add(token)
+            token = self.token_pool.choose_token(tried_tokens, resource)
+
+            # Once they've all been tried, they're tried again starting with the one available soonest,
+            # whose throttle waits until it resets (or for as long as GitHub asked)
+            if token is None:
+                if rounds == self.token_pool.max_rate_limited_rounds:
+                    return response
+
+                rounds += 1
+                tried_tokens = set()
+                token = self.token_pool.choose_token(resource=resource)
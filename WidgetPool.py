@@ -0,0 +1,57 @@
+from typing import Callable, Hashable
+
+
+class WidgetPool:
+    """
+    Manages the lifetime of widgets that are shown and hidden over and over (Ex: the rows of the results pane).
+    Hidden widgets are kept to be reused for the same kind of widget instead of creating new ones,
+    and are destroyed once there are more kept than can be shown at a time, or they can't be reused anymore.
+    Counts the widgets alive, so it can be checked that refreshing doesn't keep adding to them.
+    """
+
+    def __init__(self, create_widget: Callable[[Hashable], any], max_free_widgets: int) -> None:
+        self.create_widget = create_widget
+        self.max_free_widgets = max_free_widgets
+        self.free_widgets = dict() # kind : widgets not in use
+        self.live_widget_count = 0
+
+
+    def acquire(self, kind: Hashable) -> any:
+        """
+        Returns a hidden widget of the kind, only creating one if there's none to reuse
+        """
+
+        free_widgets = self.free_widgets.get(kind)
+        if free_widgets:
+            return free_widgets.pop()
+
+        self.live_widget_count += 1
+        return self.create_widget(kind)
+
+
+    def release(self, kind: Hashable, widget: any) -> None:
+        """
+        Hides the widget and keeps it to be reused, or destroys it if enough are kept already
+        """
+
+        widget.pack_forget()
+
+        free_widgets = self.free_widgets.setdefault(kind, [])
+        if len(free_widgets) < self.max_free_widgets:
+            free_widgets.append(widget)
+        else:
+            self.destroy_widget(widget)
+
+
+    def destroy_free_widgets(self, kind: Hashable) -> None:
+        """
+        Destroys the kept widgets of the kind, for when they can't be reused anymore
+        """
+
+        for widget in self.free_widgets.pop(kind, []):
+            self.destroy_widget(widget)
+
+
+    def destroy_widget(self, widget: any) -> None:
+        widget.destroy()
+        self.live_widget_count -= 1
@@ -1,14 +1,19 @@
 import asyncio
+import bisect
 import customtkinter
 import json
 import math
+import queue
 import threading
 import tkinter
 
 from CommitDetailVisibility import CommitDetailVisibility
 from CommitInfo import CommitInfo
+from dataclasses import astuple
 from datetime import datetime
 from GitTheCommits import GitTheCommits
+from typing import Callable
+from WidgetPool import WidgetPool
 
 
 class AppRoot(customtkinter.CTk):
@@ -128,12 +133,20 @@ class TabView(customtkinter.CTkTabview):
 
 
 class OutputFrame(customtkinter.CTkFrame):
+    # Commits found during a fetch are shown a batch at a time, so the window stays responsive
+    COMMITS_PER_RENDER = 20
+    RENDER_INTERVAL_MS = 100
+
     def __init__(self, master: customtkinter.CTkFrame, tab_view: TabView, **kwargs) -> None:
         super().__init__(master, **kwargs)
         self.tab_view = tab_view
         self.fetch_commits_thread = None
         self.is_fetching_commits = False
 
+        # The fetch thread never touches the widgets, it puts status texts and found commits here, then None once it's done
+        self.commit_queue = queue.Queue()
+        self.fetched_commits = None
+
         self.grid_columnconfigure((0, 1, 2, 3, 4, 5, 6, 7), weight=1)
         self.grid_rowconfigure(0, weight=1)
 
@@ -172,14 +185,30 @@ class OutputFrame(customtkinter.CTkFrame):
 
             self.save_item_numbers()
 
+            settings_error = self.tab_view.app_root.git_the_commits.validate_settings()
+            if settings_error:
+                self.results_frame.commits_frame.clear_displayed_commits()
+                self.results_frame.commits_frame.add_status_label(settings_error)
+                return
+
             self.fetch_commits_button.configure(text="Exit Program to Cancel", state="disabled")
             self.add_item_number_button.configure(state="disabled")
             self.save_item_numbers_button.configure(state="disabled")
             self.is_fetching_commits = True
 
             self.results_frame.start_progress_bar()
+            self.item_numbers_frame.disable_all_entries()
+            self.results_frame.commits_frame.clear_displayed_commits()
+            self.results_frame.commits_frame.add_status_label("Connecting to GitHub")
+
+            git_the_commits = self.tab_view.app_root.git_the_commits
+            git_the_commits.item_numbers = git_the_commits.normalize_item_numbers(self.item_numbers_frame.get_item_numbers())
+
+            self.commit_queue = queue.Queue()
+            self.fetched_commits = None
             self.fetch_commits_thread = threading.Thread(target=self.fetch_commits, daemon=True)
             self.fetch_commits_thread.start() 
+            self.after(self.RENDER_INTERVAL_MS, self.render_found_commits)
 
 
     def save_item_numbers(self) -> None:
@@ -189,40 +218,63 @@ class OutputFrame(customtkinter.CTkFrame):
     def fetch_commits(self) -> None:
         git_the_commits = self.tab_view.app_root.git_the_commits
 
-        self.item_numbers_frame.disable_all_entries()
+        # The queue always ends with None, even when connecting or fetching fails, so the GUI stops waiting on it
+        try:
+            github_error = git_the_commits.get_github_objects()
 
-        item_numbers = self.item_numbers_frame.get_item_numbers()
-        if git_the_commits.strip_characters_from_item_numbers:
-            item_numbers = git_the_commits.strip_non_digit_characters_from_list_of_strings(item_numbers)
-        git_the_commits.item_numbers = item_numbers
+            if github_error:
+                self.commit_queue.put(github_error)
+                return
 
-        self.results_frame.commits_frame.clear_displayed_commits()
-        self.results_frame.commits_frame.add_status_label("Connecting to GitHub")
-        github_error = git_the_commits.get_github_objects()
+            self.commit_queue.put("Fetching Commits")
+
+            git_the_commits.commit_queue = self.commit_queue
+            asyncio.run(git_the_commits.fetch_commits())
+            self.fetched_commits = git_the_commits.output_commits()
+        except Exception as exception:
+            self.fetched_commits = None
+            self.commit_queue.put(f"Fetching commits failed: {exception}")
+            raise
+        finally:
+            git_the_commits.commit_queue = None
+            self.commit_queue.put(None)
+
+
+    def render_found_commits(self) -> None:
+        """
+        Shows what the fetch thread has put on the commit queue so far, then checks again later until the fetch is done
+        """
+
+        for _ in range(self.COMMITS_PER_RENDER):
+            try:
+                queued_item = self.commit_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if queued_item is None:
+                self.finish_fetching_commits()
+                return
 
-        if github_error:
-            self.results_frame.commits_frame.clear_displayed_commits()
-            self.results_frame.commits_frame.add_status_label(github_error)
-            self.results_frame.stop_progress_bar()
-            self.is_fetching_commits = False
-            self.fetch_commits_button.configure(text="Fetch Commits", state="normal")
-            self.add_item_number_button.configure(state="normal")
-            self.save_item_numbers_button.configure(state="normal")
-            return
+            if isinstance(queued_item, str):
+                self.results_frame.commits_frame.clear_displayed_commits()
+                self.results_frame.commits_frame.add_status_label(queued_item)
+            else:
+                self.results_frame.commits_frame.add_commit_entry(queued_item)
 
-        self.results_frame.commits_frame.clear_displayed_commits()
-        self.results_frame.commits_frame.add_status_label("Fetching Commits")
-        asyncio.run(git_the_commits.fetch_commits())
+        self.after(self.RENDER_INTERVAL_MS, self.render_found_commits)
 
-        self.results_frame.commits_frame.clear_displayed_commits()
-        commits = git_the_commits.output_commits()
+
+    def finish_fetching_commits(self) -> None:
         self.is_fetching_commits = False
 
-        if len(commits) == 0:
-            self.results_frame.commits_frame.add_status_label("No commits found")
-        else:
-            self.results_frame.commits_frame.update_commit_entries(commits)
+        # The commits shown as they were found are replaced with the sorted (and grouped) results
+        if self.fetched_commits is not None:
+            self.results_frame.commits_frame.clear_displayed_commits()
 
+            if len(self.fetched_commits) == 0:
+                self.results_frame.commits_frame.add_status_label("No commits found")
+            else:
+                self.results_frame.commits_frame.update_commit_entries(self.fetched_commits)
 
         self.item_numbers_frame.enable_all_entries()
         self.results_frame.stop_progress_bar()
@@ -260,44 +312,241 @@ class ResultsFrame(customtkinter.CTkFrame):
 
 
 class CommitsFrame(customtkinter.CTkScrollableFrame):
+    # Private class enums
+    HEADER = 1
+    STATUS = 2
+    COMMIT = 3
+    CHERRY_PICK = 4
+
+    # Only a window of the rows gets widgets, which are reused for other rows as the window moves while scrolling
+    ROWS_PER_WINDOW = 60
+    ROWS_PER_SHIFT = 20
+    SHIFT_SCROLL_THRESHOLD = 0.05
+
     def __init__(self, results_frame: ResultsFrame, **kwargs) -> None:
         super().__init__(results_frame, **kwargs)
         self.results_frame = results_frame
 
-        self.displayed_elements = []
+        self.rows = [] # (row type, value)
+        self.first_row_index = 0
+        self.is_shifting_rows = False
+        self.canvas_view = (0.0, 1.0) # (first, last) fractions of the window of rows in view
+
+        self.displayed_elements = [] # (row type, widget)
         self.cached_commits = []
+
+        # Kept for the cached commits, so redrawing them after a settings change doesn't redo the work
+        self.cached_commits_order = None
+        self.item_numbers_by_commit = None # id(commit) : item numbers it belongs to
+
+        # Widgets are reused across scrolling and refreshes, so there are never more than a window's worth of each type
+        self.widget_pool = WidgetPool(self.create_row_widget, self.ROWS_PER_WINDOW)
+        self.commit_entry_layout = None
+
+        # Watches the scroll position to move the window of rows when nearing either end,
+        # and has the scrollbar stand for all the rows instead of only the window
+        self._parent_canvas.configure(yscrollcommand=self.canvas_scrolled)
+        self._scrollbar.configure(command=self.scrollbar_moved)
         
         self.update_commit_entries(self.cached_commits)
 
 
     def add_results_header(self, text: str) -> None:
-        header_label = customtkinter.CTkLabel(self, text=text, font=customtkinter.CTkFont(size=20, weight="bold"))
-        self.displayed_elements.append(header_label)
-        header_label.pack(anchor='w', fill='x')
+        self.add_row(self.HEADER, text)
 
 
     def add_status_label(self, text: str) -> None:
-        status_label = customtkinter.CTkLabel(self, text=text, font=customtkinter.CTkFont(size=16))
-        self.displayed_elements.append(status_label)
-        status_label.pack(anchor='w', fill='x', pady=5)
+        self.add_row(self.STATUS, text)
 
 
     def add_commit_entry(self, commit: CommitInfo) -> None:
-        new_entry = CommitEntryFrame(self, commit, fg_color=self.cget('bg_color'))
-        self.displayed_elements.append(new_entry)
-        new_entry.pack(anchor='w', pady=5, fill='x')
+        self.add_row(self.COMMIT, commit)
 
     
     def add_cherry_pick_command(self, label_text: str, cherry_pick_text: str) -> None:
-        message_lines = math.ceil(len(cherry_pick_text) / 80) + 1 # +1 for the label
-        cherry_pick_textbox = customtkinter.CTkTextbox(
-            self, height=(18 * message_lines) + 10, border_width=0, fg_color=self.cget('bg_color'), 
-            wrap='word', activate_scrollbars=False)
-        
-        self.displayed_elements.append(cherry_pick_textbox)
-        cherry_pick_textbox.insert("0.0", label_text + '\n' + cherry_pick_text)
-        cherry_pick_textbox.configure(state="disabled")
-        cherry_pick_textbox.pack(anchor='w', pady=5, fill='x')
+        self.add_row(self.CHERRY_PICK, label_text + '\n' + cherry_pick_text)
+
+
+    def add_row(self, row_type: int, value: any) -> None:
+        self.rows.append((row_type, value))
+
+        if len(self.rows) <= self.first_row_index + self.ROWS_PER_WINDOW:
+            self.display_row(row_type, value)
+        else:
+            self.update_scrollbar()
+
+
+    def display_row(self, row_type: int, value: any) -> None:
+        """
+        Shows a row with a widget of its type from the widget pool
+        """
+
+        widget = self.widget_pool.acquire(row_type)
+
+        if row_type == self.HEADER or row_type == self.STATUS:
+            widget.configure(text=value)
+        elif row_type == self.COMMIT:
+            widget.show_commit(value)
+        elif row_type == self.CHERRY_PICK:
+            message_lines = math.ceil(len(value) / 80) + 1 # +1 for the label
+            widget.configure(state="normal", height=(18 * message_lines) + 10)
+            widget.delete("0.0", "end")
+            widget.insert("0.0", value)
+            widget.configure(state="disabled")
+
+        if row_type == self.HEADER:
+            widget.pack(anchor='w', fill='x')
+        else:
+            widget.pack(anchor='w', pady=5, fill='x')
+
+        self.displayed_elements.append((row_type, widget))
+
+
+    def create_row_widget(self, row_type: int) -> customtkinter.CTkBaseClass:
+        if row_type == self.HEADER:
+            return customtkinter.CTkLabel(self, font=customtkinter.CTkFont(size=20, weight="bold"))
+        if row_type == self.STATUS:
+            return customtkinter.CTkLabel(self, font=customtkinter.CTkFont(size=16))
+        if row_type == self.COMMIT:
+            return CommitEntryFrame(self, fg_color=self.cget('bg_color'))
+
+        return customtkinter.CTkTextbox(self, border_width=0, fg_color=self.cget('bg_color'), 
+                                        wrap='word', activate_scrollbars=False)
+
+
+    def display_rows(self) -> None:
+        """
+        Shows the rows in the current window, reusing the widgets already created
+        """
+
+        self.release_displayed_elements()
+
+        for row_type, value in self.rows[self.first_row_index:self.first_row_index + self.ROWS_PER_WINDOW]:
+            self.display_row(row_type, value)
+
+
+    def canvas_scrolled(self, first: str, last: str) -> None:
+        self.canvas_view = (float(first), float(last))
+        self.update_scrollbar()
+
+        if self.is_shifting_rows:
+            return
+
+        first, last = self.canvas_view
+
+        # When the whole window fits in view, shifting would leave it in view all the same and shift again right away
+        if first <= self.SHIFT_SCROLL_THRESHOLD and last >= 1 - self.SHIFT_SCROLL_THRESHOLD:
+            return
+
+        if last >= 1 - self.SHIFT_SCROLL_THRESHOLD and self.first_row_index + self.ROWS_PER_WINDOW < len(self.rows):
+            self.is_shifting_rows = True
+            self.after_idle(self.shift_rows, self.ROWS_PER_SHIFT)
+        elif first <= self.SHIFT_SCROLL_THRESHOLD and self.first_row_index > 0:
+            self.is_shifting_rows = True
+            self.after_idle(self.shift_rows, -self.ROWS_PER_SHIFT)
+
+
+    def update_scrollbar(self) -> None:
+        """
+        Sizes the scrollbar for all the rows, placing the part in view among them by row count
+        (rows outside the window have no height to go by) and within the displayed rows by their heights
+        """
+
+        if len(self.displayed_elements) == 0:
+            self._scrollbar.set(*self.canvas_view)
+            return
+
+        row_tops = self.get_row_tops()
+        first, last = self.canvas_view
+        self._scrollbar.set((self.first_row_index + self.get_row_position(row_tops, first * row_tops[-1])) / len(self.rows),
+                            (self.first_row_index + self.get_row_position(row_tops, last * row_tops[-1])) / len(self.rows))
+
+
+    def scrollbar_moved(self, action: str, *args) -> None:
+        """
+        Scrolls to where the scrollbar was dragged among all the rows, moving the window of rows there if it's outside of it
+        """
+
+        if action != "moveto" or len(self.displayed_elements) == 0:
+            self._parent_canvas.yview(action, *args)
+            return
+
+        row_position = float(args[0]) * len(self.rows)
+
+        if not self.first_row_index <= row_position < self.first_row_index + len(self.displayed_elements):
+            self.is_shifting_rows = True
+            self.first_row_index = min(max(int(row_position) - self.ROWS_PER_SHIFT, 0), max(len(self.rows) - self.ROWS_PER_WINDOW, 0))
+            self.display_rows()
+            self.update_idletasks()
+            self.is_shifting_rows = False
+
+        self.scroll_to_y(self.get_row_y(self.get_row_tops(), row_position - self.first_row_index))
+
+
+    def shift_rows(self, row_offset: int) -> None:
+        """
+        Moves the window of displayed rows, keeping the rows that were in view at the same spot on screen
+        """
+
+        first_row_index = min(max(self.first_row_index + row_offset, 0), max(len(self.rows) - self.ROWS_PER_WINDOW, 0))
+        rows_moved = first_row_index - self.first_row_index
+
+        if rows_moved != 0:
+            # The view moves by the height of the rows released from or added above the ones in view
+            top_y = self._parent_canvas.canvasy(0)
+            if rows_moved > 0:
+                top_y -= self.get_row_tops()[rows_moved]
+
+            self.first_row_index = first_row_index
+            self.display_rows()
+            self.update_idletasks()
+
+            if rows_moved < 0:
+                top_y += self.get_row_tops()[-rows_moved]
+
+            self.scroll_to_y(top_y)
+
+        self.is_shifting_rows = False
+
+
+    def get_row_tops(self) -> list[int]:
+        """
+        Returns the y (in pixels) each displayed row starts at, followed by the height of all of them.
+        A row's padding is counted as part of the row above it
+        """
+
+        return [0] + [widget.winfo_y() for _, widget in self.displayed_elements[1:]] + [self.winfo_reqheight()]
+
+
+    @staticmethod
+    def get_row_position(row_tops: list[int], y: float) -> float:
+        """
+        Returns which displayed row is at the y, plus how far through it (Ex: 2.5 is halfway through the third row)
+        """
+
+        row = min(max(bisect.bisect_right(row_tops, y) - 1, 0), len(row_tops) - 2)
+        row_height = row_tops[row + 1] - row_tops[row]
+        if row_height <= 0:
+            return row
+
+        return row + min(max((y - row_tops[row]) / row_height, 0), 1)
+
+
+    @staticmethod
+    def get_row_y(row_tops: list[int], row_position: float) -> float:
+        """
+        Returns the y of a position among the displayed rows, the reverse of get_row_position
+        """
+
+        row = min(max(int(row_position), 0), len(row_tops) - 2)
+        return row_tops[row] + (row_position - row) * (row_tops[row + 1] - row_tops[row])
+
+
+    def scroll_to_y(self, y: float) -> None:
+        # The scroll region only catches up with the rows on the frame's next <Configure> event, so it's updated right away
+        scroll_region = self._parent_canvas.bbox("all")
+        self._parent_canvas.configure(scrollregion=scroll_region)
+        self._parent_canvas.yview_moveto((y - scroll_region[1]) / max(scroll_region[3] - scroll_region[1], 1))
 
 
     def update_commit_entries(self, commits: list[CommitInfo] = None) -> None:
@@ -306,6 +555,8 @@ class CommitsFrame(customtkinter.CTkScrollableFrame):
 
         if commits is not None:
             self.cached_commits = commits
+            self.cached_commits_order = None
+            self.item_numbers_by_commit = None
         else:
             commits = self.cached_commits
 
@@ -316,14 +567,24 @@ class CommitsFrame(customtkinter.CTkScrollableFrame):
 
         git_the_commits = self.results_frame.output_frame.tab_view.app_root.git_the_commits
         order_commits_by_date_descend = git_the_commits.order_commits_by_date_descend
-        commits.sort(key=lambda x: x.date, reverse=order_commits_by_date_descend)
+        if self.cached_commits_order != order_commits_by_date_descend:
+            commits.sort(key=lambda x: x.date, reverse=order_commits_by_date_descend)
+            self.cached_commits_order = order_commits_by_date_descend
 
         self.clear_displayed_commits()
         if git_the_commits.group_commits_by_item:
             sorted_item_numbers = git_the_commits.sort_item_numbers_by_commit_dates()
 
+            # Every item's commits are gathered in one pass over the sorted commits, keeping their order
+            item_numbers_by_commit = self.get_item_numbers_by_commit()
+            commits_by_item_number = { item_number: [] for item_number in sorted_item_numbers }
+            for commit in commits:
+                for item_number in item_numbers_by_commit.get(id(commit), []):
+                    if item_number in commits_by_item_number:
+                        commits_by_item_number[item_number].append(commit)
+
             for item_number in sorted_item_numbers:
-                item_commits = [commit for commit in commits if commit.item_number == item_number]
+                item_commits = commits_by_item_number[item_number]
 
                 # No commits found
                 if len(item_commits) == 0:
@@ -337,7 +598,7 @@ class CommitsFrame(customtkinter.CTkScrollableFrame):
 
                 # Cherry Pick Command
                 if git_the_commits.item_cherry_pick:
-                    cherry_pick_text = f"{git_the_commits.cherry_pick_command} {' '.join([commit.sha for commit in commits if commit.item_number == item_number])}"
+                    cherry_pick_text = f"{git_the_commits.cherry_pick_command} {' '.join([commit.sha for commit in item_commits])}"
                     self.add_cherry_pick_command("Item Cherry Pick:", cherry_pick_text)
         else:
             for commit in commits:
@@ -348,62 +609,122 @@ class CommitsFrame(customtkinter.CTkScrollableFrame):
             self.add_cherry_pick_command("All Commits Cherry Pick:", all_commits_cherry_pick_text)
 
 
+    def get_item_numbers_by_commit(self) -> dict[int, list[str]]:
+        """
+        Returns the item numbers each cached commit belongs to, built from the item_commit_dictionary once per result set.
+        A commit can belong to several items, so they're looked up by index rather than by their item_number
+        """
+
+        if self.item_numbers_by_commit is None:
+            git_the_commits = self.results_frame.output_frame.tab_view.app_root.git_the_commits
+
+            self.item_numbers_by_commit = dict()
+            for item_number, indexes in git_the_commits.item_commit_dictionary.items():
+                for index in indexes:
+                    self.item_numbers_by_commit.setdefault(id(git_the_commits.commit_list[index]), []).append(item_number)
+
+        return self.item_numbers_by_commit
+
+
     def clear_displayed_commits(self) -> None:
-        for entry in self.displayed_elements:
-            entry.pack_forget()
+        self.release_displayed_elements()
+
+        self.rows = []
+        self.first_row_index = 0
+        self.canvas_view = (0.0, 1.0)
+        self._parent_canvas.yview_moveto(0)
+
+        # Commit entries are laid out for the commit details that were visible when they were created
+        git_the_commits = self.results_frame.output_frame.tab_view.app_root.git_the_commits
+        commit_entry_layout = (astuple(git_the_commits.commit_detail_visibilty), git_the_commits.strip_characters_from_item_numbers)
+        if commit_entry_layout != self.commit_entry_layout:
+            self.widget_pool.destroy_free_widgets(self.COMMIT)
+            self.commit_entry_layout = commit_entry_layout
+
+
+    def release_displayed_elements(self) -> None:
+        for row_type, widget in self.displayed_elements:
+            self.widget_pool.release(row_type, widget)
         self.displayed_elements = []
 
 
+    @property
+    def live_widget_count(self) -> int:
+        return self.widget_pool.live_widget_count
+
+
 class CommitEntryFrame(customtkinter.CTkFrame):
-    def __init__(self, commits_frame: CommitsFrame, commit: CommitInfo, **kwargs) -> None:
+    def __init__(self, commits_frame: CommitsFrame, commit: CommitInfo = None, **kwargs) -> None:
         super().__init__(commits_frame, **kwargs)
         self.grid_columnconfigure(0, weight=1)
         self.commits_frame = commits_frame
 
         git_the_commits = self.commits_frame.results_frame.output_frame.tab_view.app_root.git_the_commits
 
+        self.commit_message_label = None
+        self.commit_detail_labels = [] # (label, label text, value getter)
+
         if git_the_commits.commit_detail_visibilty.message:
-            message_lines = sum((math.ceil(len(line) / 60) for line in commit.message.splitlines()))
             self.commit_message_label = customtkinter.CTkTextbox(
-                self, height=(20 * message_lines) + 10, border_width=0, fg_color=self.cget('fg_color'), 
+                self, border_width=0, fg_color=self.cget('fg_color'), 
                 font=customtkinter.CTkFont(size=12, weight="bold"), wrap='word', activate_scrollbars=False)
-            
-            self.commit_message_label.insert("0.0", commit.message)
-            self.commit_message_label.configure(state="disabled")
             self.commit_message_label.pack(anchor='w', padx=5, fill='x')
 
         if git_the_commits.commit_detail_visibilty.item_number: 
-            self.add_commit_detail_label(f"\nItem{' Number' if git_the_commits.strip_characters_from_item_numbers else ''}", commit.item_number)
+            self.add_commit_detail_label(f"\nItem{' Number' if git_the_commits.strip_characters_from_item_numbers else ''}", 
+                                         lambda commit: commit.item_number)
 
         if git_the_commits.commit_detail_visibilty.author: 
-            self.add_commit_detail_label("Author", commit.author)
+            self.add_commit_detail_label("Author", lambda commit: commit.author)
 
         if git_the_commits.commit_detail_visibilty.date: 
-            self.add_commit_detail_label("Date", commit.date)
+            self.add_commit_detail_label("Date", lambda commit: commit.date)
 
         if git_the_commits.commit_detail_visibilty.commit_url: 
-            self.add_commit_detail_label("Commit URL", commit.commit_url)
+            self.add_commit_detail_label("Commit URL", lambda commit: commit.commit_url)
 
         if git_the_commits.commit_detail_visibilty.pull_request_url: 
-            self.add_commit_detail_label("Pull Request URL", commit.pr_url)
+            self.add_commit_detail_label("Pull Request URL", lambda commit: commit.pr_url)
 
         if git_the_commits.commit_detail_visibilty.sha: 
-            self.add_commit_detail_label("SHA", commit.sha)
+            self.add_commit_detail_label("SHA", lambda commit: commit.sha)
 
         if git_the_commits.commit_detail_visibilty.is_merge_commit: 
-            self.add_commit_detail_label("Is Merge Commit", commit.is_merge)
+            self.add_commit_detail_label("Is Merge Commit", lambda commit: commit.is_merge)
 
         if git_the_commits.commit_detail_visibilty.cherry_pick_command: 
-            self.add_commit_detail_label("Cherry-Pick Command", f"{git_the_commits.cherry_pick_command} {commit.sha}")
+            self.add_commit_detail_label("Cherry-Pick Command", lambda commit: f"{git_the_commits.cherry_pick_command} {commit.sha}")
+
+        if commit is not None:
+            self.show_commit(commit)
 
 
-    def add_commit_detail_label(self, label_text: str, value: str) -> None:
+    def add_commit_detail_label(self, label_text: str, get_value: Callable[[CommitInfo], any]) -> None:
         # I know the function says "label", but label text can't be selected and copied.
         # An entry can be copied, so we dress up an entry to look like a label ;)
         label = customtkinter.CTkEntry(self, border_width=0, fg_color=self.cget('fg_color'), height=20)
-        label.insert(0, f"{label_text}: {value}")
         label.configure(state="readonly")
         label.pack(anchor='w', padx=5, fill='x')
+        self.commit_detail_labels.append((label, label_text, get_value))
+
+
+    def show_commit(self, commit: CommitInfo) -> None:
+        """
+        Fills in the commit's details, replacing the ones of the commit shown before
+        """
+
+        if self.commit_message_label is not None:
+            message_lines = sum((math.ceil(len(line) / 60) for line in commit.message.splitlines()))
+            self.commit_message_label.configure(state="normal", height=(20 * message_lines) + 10)
+            self.commit_message_label.delete("0.0", "end")
+            self.commit_message_label.insert("0.0", commit.message)
+            self.commit_message_label.configure(state="disabled")
+
+        for label, label_text, get_value in self.commit_detail_labels:
+            label.configure(state="normal")
+            label.delete(0, "end")
+            label.insert(0, f"{label_text}: {get_value(commit)}")
+            label.configure(state="readonly")
 
 
 class ItemNumbersListFrame(customtkinter.CTkScrollableFrame):
@@ -634,7 +955,8 @@ class SettingsFrame(customtkinter.CTkFrame):
     def load_settings(self, settings_dict: dict[str, any]) -> None:
         if settings_dict["GitHubToken"] is not None and settings_dict["GitHubToken"] != "":
             self.github_token.delete(0, 'end')
-            self.github_token.insert(0, settings_dict["GitHubToken"])
+            github_token = settings_dict["GitHubToken"]
+            self.github_token.insert(0, ", ".join(github_token) if isinstance(github_token, list) else github_token)
             self.tab_view.app_root.github_token_valid = True
         else:
             self.tab_view.app_root.github_token_valid = False
@@ -706,15 +1028,21 @@ class SettingsFrame(customtkinter.CTkFrame):
     def save_settings(self, item_numbers: list[str] = None) -> None:
         self.tab_view.app_root.update_original_settings()
 
+        # Multiple tokens are separated by commas
+        parsed_github_token = [token.strip() for token in self.github_token.get().split(',') if token.strip() != ""]
+        parsed_github_token = None if len(parsed_github_token) == 0 else (
+            parsed_github_token[0] if len(parsed_github_token) == 1 else parsed_github_token
+        )
         parsed_search_limit_months = None if not self.search_limit_months.get().isnumeric() else int(self.search_limit_months.get())
         parsed_seconds_between_github_requests = None if not self.seconds_between_github_requests.get().replace('.', '', 1).isnumeric() else float(self.seconds_between_github_requests.get())
 
         settings_dict = {
-            "GitHubToken": None if self.github_token.get() == "" else self.github_token.get(),
+            "GitHubToken": parsed_github_token,
             "TargetRepository": None if self.target_repository.get() == "" else self.target_repository.get(),
             "TargetBranch": None if self.target_branch.get() == "" else self.target_branch.get(),
             "StripCharactersFromItemNumbers": True if self.strip_characters.get() else False,
             "ItemNumbers": item_numbers if item_numbers is not None else self.tab_view.app_root.original_settings["ItemNumbers"],
+            "ItemNumberPatterns": self.tab_view.app_root.original_settings.get("ItemNumberPatterns"),
             "CommitDetailsToShow": {
                 "Message": True if self.commit_details_to_show_frame.commit_message_detail.get() else False,
                 "ItemNumber": True if self.commit_details_to_show_frame.commit_item_number_detail.get() else False,
@@ -731,6 +1059,9 @@ class SettingsFrame(customtkinter.CTkFrame):
             "ShowCommitsInDateDescendingOrder": True if self.show_commits_in_date_descending_order.get() else False,
             "UseCommitHistory": False if self.radio_var.get() else True,
             "UsePullRequests": True if self.radio_var.get() else False,
+            "UsePullRequestSearch": self.tab_view.app_root.original_settings.get("UsePullRequestSearch", False),
+            "UseGraphQL": self.tab_view.app_root.original_settings.get("UseGraphQL", False),
+            "LocalRepositoryPath": self.tab_view.app_root.original_settings.get("LocalRepositoryPath"),
             "OutputToTerminal": self.tab_view.app_root.original_settings["OutputToTerminal"],
             "OutputToTxtFile": True if self.output_to_txt_file.get() else False,
             "OutputToExcelFile": True if self.output_to_excel_file.get() else False,
@@ -740,7 +1071,11 @@ class SettingsFrame(customtkinter.CTkFrame):
             "GitCherryPickArguments": None if self.cherry_pick.get() == "" else self.cherry_pick.get(),
             "SearchLimitMonths": None if self.search_limit_months.get() == "" else parsed_search_limit_months,
             "UseConcurrentCommitFetching": True if self.use_concurrent_commit_fetching.get() else False,
-            "SecondsBetweenGithubRequests": None if self.seconds_between_github_requests.get() == "" else parsed_seconds_between_github_requests
+            "SecondsBetweenGithubRequests": None if self.seconds_between_github_requests.get() == "" else parsed_seconds_between_github_requests,
+            "MaxConcurrentRequests": self.tab_view.app_root.original_settings.get("MaxConcurrentRequests"),
+            "UseAdaptiveThrottling": self.tab_view.app_root.original_settings.get("UseAdaptiveThrottling", False),
+            "CacheFilename": self.tab_view.app_root.original_settings.get("CacheFilename"),
+            "ReportLazyCompletions": self.tab_view.app_root.original_settings.get("ReportLazyCompletions", False)
         }
 
         with open(self.tab_view.app_root.settings_filename, 'w') as settings_file:
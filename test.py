@@ -1,18 +1,47 @@
+from BoundedScheduler import BoundedScheduler
+from CommitAccumulator import CommitAccumulator
+from CommitCache import CommitCache
 from CommitDetailVisibility import CommitDetailVisibility
 from CommitInfo import CommitInfo
+from CommitRecord import CommitRecord
+from ConditionalRequestCache import ConditionalRequestCache, is_pull_request_listing_url
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
+from ExcelColumn import ExcelColumn
 from github import Auth, BadCredentialsException, GithubException
 from github.GitCommit import GitCommit
+from github.GithubObject import CompletableGithubObject
 from github.Requester import Requester
 from GitTheCommits import GitTheCommits
+from gui import CommitsFrame, OutputFrame
+from GraphQLFetcher import GraphQLFetcher
+from ItemNumberIndex import ItemNumberIndex
+from ItemNumberMatcher import ItemNumberMatcher, extract_item_numbers
+from LazyCompletionCounter import LazyCompletionCounter
+from LocalGitRepository import LocalGitRepository
+from PullRequestRecord import PullRequestRecord
+from RateLimitThrottle import RateLimitThrottle, get_rate_limit_resource
 from random import randint
-from unittest.mock import Mock, patch, call, MagicMock, mock_open
-
+from requests.structures import CaseInsensitiveDict
+from SyncState import SyncState
+from TextOutputWriter import TextOutputWriter
+from TokenPool import TokenPool
+from unittest.mock import Mock, patch, call, MagicMock, mock_open, PropertyMock
+from WidgetPool import WidgetPool
+
+import asyncio
 import json
+import os
+import queue
+import re
+import subprocess
+import tempfile
+import time
 import unittest
 import uuid
+import zipfile
 
 
 class TestGroupRelevantCommitInfo(unittest.TestCase):
@@ -197,6 +226,26 @@ class TestSaveCommitInfo(unittest.TestCase):
         self.assertEqual(1, len(target.commit_list))
 
 
+    def test_groups_already_saved_commit_under_each_item_number(self):
+        # Arrange
+        git_commit = generate_git_commit_object(
+            GitCommitDetails("This is a test", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", 
+                             "0987654321098765432109876543210987654321", "www.google2.com", 1, True)
+        )
+
+        target = GitTheCommits(False)
+
+        # Act
+        target.save_commit_info(git_commit, "1234")
+        target.save_commit_info(git_commit, "5678")
+        target.save_commit_info(git_commit, "1234")
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual({ "1234": [0], "5678": [0] }, target.item_commit_dictionary)
+        self.assertEqual("1234, 5678", target.commit_list[0].item_number)
+
+
     def test_with_merge_commit_and_ignore_merge_commits_off(self):
         # Arrange
         git_commit = generate_git_commit_object(
@@ -399,6 +448,66 @@ class TestSaveCommitInfo(unittest.TestCase):
         self.assertEqual("www.google.pullrequest.com/5", result_commit.pr_url)
 
 
+    def test_indexes_saved_commits_by_sha(self):
+        # Arrange
+        git_commit_1 = generate_git_commit_object(
+            GitCommitDetails("This is a test", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", 
+                             "0987654321098765432109876543210987654321", "www.google2.com", 1, True)
+        )
+        git_commit_2 = generate_git_commit_object(
+            GitCommitDetails("This is a test", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", 
+                             "1234567890123456789012345678901234567890", "www.google2.com", 1, True)
+        )
+
+        target = GitTheCommits(False)
+
+        # Act
+        target.save_commit_info(git_commit_1, "1234", pr_url="www.google.pullrequest.com/10")
+        target.save_commit_info(git_commit_2, "1234", pr_url="www.google.pullrequest.com/10")
+        target.save_commit_info(git_commit_1, "1234", pr_url="www.google.pullrequest.com/5")
+
+        # Assert
+        self.assertEqual(2, len(target.commit_list))
+        self.assertEqual({ "0987654321098765432109876543210987654321": 0, "1234567890123456789012345678901234567890": 1 }, 
+                         target.commit_sha_dictionary)
+        self.assertEqual("www.google.pullrequest.com/5", target.commit_list[0].pr_url)
+
+
+    def test_reindexes_when_commit_list_is_replaced(self):
+        # Arrange
+        target = GitTheCommits(False)
+        saved_commit = CommitInfo("This is a test", "Uni <uni@test.py>", datetime(2024, 1, 12, 8, 30, 2).replace(tzinfo=timezone.utc),
+                                  "0987654321098765432109876543210987654321", "www.google2.com", "None", "1234", False)
+
+        # Act
+        target.commit_list = [saved_commit]
+
+        # Assert
+        self.assertEqual({ "0987654321098765432109876543210987654321": 0 }, target.commit_sha_dictionary)
+
+
+    def test_saves_each_commit_once_when_saved_concurrently(self):
+        # Arrange
+        git_commits = [
+            generate_git_commit_object(
+                GitCommitDetails("This is a test", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", 
+                                 str(1000000000000000000000000000000000000000 + index % 50), "www.google2.com", 1, True)
+            )
+            for index in range(500)
+        ]
+
+        target = GitTheCommits(False)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda git_commit: target.save_commit_info(git_commit, "1234"), git_commits))
+
+        # Assert
+        self.assertEqual(50, len(target.commit_list))
+        self.assertEqual(50, len(target.commit_sha_dictionary))
+        self.assertEqual(list(range(50)), sorted(target.item_commit_dictionary["1234"]))
+
+
 class TestStripNonDigitCharactersFromListOfStrings(unittest.TestCase):
     def test_only_digits(self):
         # Arrange
@@ -1719,6 +1828,53 @@ class TestSetSettingsViaDictionary(unittest.TestCase):
         self.assertEqual(target.cherry_pick_command, "git cherry-pick -test -m 1")
 
 
+    def test_extracts_item_numbers_with_item_number_patterns(self):
+        # Arrange
+        settings_dictionary = {
+            "GitHubToken": "DefinitelyValidToken",
+            "TargetRepository": "joeasley-clgx/GitTheCommits",
+            "TargetBranch": "test-branch",
+            "StripCharactersFromItemNumbers": False,
+            "ItemNumbers": ["PROJ-1234", "OPS-5678", 9012, "OTHER-3456"],
+            "ItemNumberPatterns": ["(?:PROJ|OPS)-(\\d+)"],
+            "CommitDetailsToShow": {
+                "Message": True,
+                "ItemNumber": True,
+                "Author": True,
+                "Date": True,
+                "CommitUrl": True,
+                "PullRequestUrl": True,
+                "Sha": True,
+                "IsMergeCommit": True,
+                "CherryPickCommand": True
+            },
+            "GroupCommitsByItem": True,
+            "ItemCherryPick": True,
+            "ShowCommitsInDateDescendingOrder": True,
+            "UseCommitHistory": True,
+            "UsePullRequests": True,
+            "OutputToTerminal": True,
+            "OutputToTxtFile": True,
+            "OutputToExcelFile": True,
+            "AllCommitsCherryPickCommand": True,
+            "IgnoreMergeCommits": True,
+            "UseShortCommitHash": True,
+            "GitCherryPickArguments": "-test",
+            "SearchLimitMonths": 1,
+            "UseConcurrentCommitFetching": True,
+            "SecondsBetweenGithubRequests": 1
+        }
+
+        target = GitTheCommits(False)
+
+        # Act
+        target.set_settings_via_dictionary(settings_dictionary)
+
+        # Assert
+        self.assertEqual(["(?:PROJ|OPS)-(\\d+)"], [item_number_pattern.pattern for item_number_pattern in target.item_number_patterns])
+        self.assertEqual(["1234", "5678", "9012", "OTHER-3456"], target.item_numbers)
+
+
 class TestSetSettings(unittest.TestCase):
     def test_throws_exception_for_non_json_file(self):
         # Arrange
@@ -1761,6 +1917,101 @@ class TestSetSettings(unittest.TestCase):
         self.assertEqual("Your settings.json file has a syntax error on line 1. Please fix it and try again.", result)
 
 
+    @patch('builtins.open', new_callable=mock_open, read_data='{"key": "value"}')
+    @patch('json.load')
+    @patch('GitTheCommits.GitTheCommits.set_settings_via_dictionary')
+    def test_rejects_use_graphql_with_cache_filename(self, mock_set_settings_via_dictionary: MagicMock, 
+                                                     mock_json_load: MagicMock, mock_open):
+        # Arrange
+        target = GitTheCommits(False)
+        target.use_graphql = True
+        target.cache_filename = "cache.sqlite"
+
+        # Act
+        result = target.set_settings("settings.json")
+
+        # Assert
+        self.assertEqual("UseGraphQL can't be used while CacheFilename is set. Set UseGraphQL to false or CacheFilename to null. "
+                         "Please fix your settings.json file and try again.", result)
+
+
+    @patch('builtins.open', new_callable=mock_open, read_data='{"key": "value"}')
+    @patch('json.load')
+    def test_reports_invalid_item_number_pattern(self, mock_json_load: MagicMock, mock_open):
+        # Arrange
+        mock_json_load.return_value = {
+            "GitHubToken": "DefinitelyValidToken",
+            "TargetRepository": "joeasley-clgx/GitTheCommits",
+            "TargetBranch": "test-branch",
+            "StripCharactersFromItemNumbers": False,
+            "ItemNumbers": ["PROJ-1234"],
+            "ItemNumberPatterns": ["(PROJ-(\\d+)"],
+            "CommitDetailsToShow": {
+                "Message": True,
+                "ItemNumber": True,
+                "Author": True,
+                "Date": True,
+                "CommitUrl": True,
+                "PullRequestUrl": True,
+                "Sha": True,
+                "IsMergeCommit": True,
+                "CherryPickCommand": True
+            },
+            "GroupCommitsByItem": True,
+            "ItemCherryPick": True,
+            "ShowCommitsInDateDescendingOrder": True,
+            "UseCommitHistory": True,
+            "UsePullRequests": True,
+            "OutputToTerminal": True,
+            "OutputToTxtFile": True,
+            "OutputToExcelFile": True,
+            "AllCommitsCherryPickCommand": True,
+            "IgnoreMergeCommits": True,
+            "UseShortCommitHash": True,
+            "GitCherryPickArguments": "-test",
+            "SearchLimitMonths": 1,
+            "UseConcurrentCommitFetching": True,
+            "SecondsBetweenGithubRequests": 1
+        }
+
+        target = GitTheCommits(False)
+
+        # Act
+        result = target.set_settings("settings.json")
+
+        # Assert
+        self.assertTrue(result.startswith("ItemNumberPatterns has an invalid regex '(PROJ-(\\d+)' ("))
+        self.assertTrue(result.endswith("Please fix your settings.json file and try again."))
+        self.assertEqual([], target.item_number_patterns)
+
+
+    def test_rejects_use_pull_request_search_with_cache_filename(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.use_pull_request_search = True
+        target.cache_filename = "cache.sqlite"
+
+        # Act
+        result = target.validate_settings()
+
+        # Assert
+        self.assertEqual("UsePullRequestSearch can't be used while CacheFilename is set. "
+                         "Set UsePullRequestSearch to false or CacheFilename to null.", result)
+
+
+    def test_allows_use_graphql_without_cache_filename(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.use_graphql = True
+        target.cache_filename = None
+
+        # Act
+        result = target.validate_settings()
+
+        # Assert
+        self.assertIsNone(result)
+
+
 class TestGenerateExcelFile(unittest.TestCase):
     @patch('xlsxwriter.Workbook')
     @patch('builtins.print')
@@ -1884,45 +2135,21 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Commit Message", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('B1', "Item Number", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('C1', "Author", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('D1', "Date", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('E1', "Commit Url", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('F1', "Pull Request Url(s)", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('G1', "Sha", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('H1', "Is Merge Commit", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('I1', "Cherry-Pick Command", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Commit Message", "Item Number", "Author", "Date", "Commit Url", "Pull Request Url(s)", "Sha", "Is Merge Commit", "Cherry-Pick Command"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(1, 0, "message1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 1, "123", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 2, "author1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 3, "01/01/2022, 00:00:00", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 4, "commit_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 5, "pr_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 6, "sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 7, "is_merge1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 8, "git cherry-pick sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 0, "message2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 1, "234", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 2, "author2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 3, "01/02/2022, 00:00:00", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 4, "commit_url2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 5, "pr_url2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 6, "sha2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 7, "is_merge2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 8, "git cherry-pick sha2", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(1, 0, ["message1", "123", "author1", "01/01/2022, 00:00:00", "commit_url1", "pr_url1", "sha1", "is_merge1", "git cherry-pick sha1"], mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(2, 0, ["message2", "234", "author2", "01/02/2022, 00:00:00", "commit_url2", "pr_url2", "sha2", "is_merge2", "git cherry-pick sha2"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
         
 
     @patch('builtins.print')
@@ -1977,22 +2204,14 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Commit Message", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('B1', "Item Number", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('C1', "Author", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('D1', "Date", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('E1', "Commit Url", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('F1', "Pull Request Url(s)", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('G1', "Sha", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('H1', "Is Merge Commit", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('I1', "Cherry-Pick Command", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Commit Message", "Item Number", "Author", "Date", "Commit Url", "Pull Request Url(s)", "Sha", "Is Merge Commit", "Cherry-Pick Command"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the Item Number subheaders were written to the worksheet
         calls = [
@@ -2003,26 +2222,10 @@ class TestGenerateExcelFile(unittest.TestCase):
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(2, 0, "message1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 1, "123", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 2, "author1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 3, "01/01/2022, 00:00:00", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 4, "commit_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 5, "pr_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 6, "sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 7, "is_merge1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 8, "git cherry-pick sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 0, "message2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 1, "234", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 2, "author2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 3, "01/02/2022, 00:00:00", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 4, "commit_url2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 5, "pr_url2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 6, "sha2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 7, "is_merge2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 8, "git cherry-pick sha2", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(2, 0, ["message1", "123", "author1", "01/01/2022, 00:00:00", "commit_url1", "pr_url1", "sha1", "is_merge1", "git cherry-pick sha1"], mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(4, 0, ["message2", "234", "author2", "01/02/2022, 00:00:00", "commit_url2", "pr_url2", "sha2", "is_merge2", "git cherry-pick sha2"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
         
 
     @patch('xlsxwriter.Workbook')
@@ -2038,7 +2241,7 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the Item Number subheaders were written to the worksheet
@@ -2091,22 +2294,14 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Commit Message", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('B1', "Item Number", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('C1', "Author", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('D1', "Date", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('E1', "Commit Url", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('F1', "Pull Request Url(s)", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('G1', "Sha", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('H1', "Is Merge Commit", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('I1', "Cherry-Pick Command", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Commit Message", "Item Number", "Author", "Date", "Commit Url", "Pull Request Url(s)", "Sha", "Is Merge Commit", "Cherry-Pick Command"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the Item Number subheaders were written to the worksheet
         calls = [
@@ -2117,17 +2312,9 @@ class TestGenerateExcelFile(unittest.TestCase):
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(2, 0, "message1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 1, "123", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 2, "author1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 3, "01/01/2022, 00:00:00", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 4, "commit_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 5, "pr_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 6, "sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 7, "is_merge1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 8, "git cherry-pick sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(2, 0, ["message1", "123", "author1", "01/01/2022, 00:00:00", "commit_url1", "pr_url1", "sha1", "is_merge1", "git cherry-pick sha1"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
 
     @patch('builtins.print')
@@ -2159,30 +2346,21 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Commit Message", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('B1', "Author", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('C1', "Commit Url", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('D1', "Sha", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Commit Message", "Author", "Commit Url", "Sha"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(1, 0, "message1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 1, "author1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 2, "commit_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(1, 3, "sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 0, "message2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 1, "author2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 2, "commit_url2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 3, "sha2", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(1, 0, ["message1", "author1", "commit_url1", "sha1"], mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(2, 0, ["message2", "author2", "commit_url2", "sha2"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
 
     @patch('builtins.print')
@@ -2217,17 +2395,14 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Commit Message", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('B1', "Author", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('C1', "Commit Url", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call('D1', "Sha", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Commit Message", "Author", "Commit Url", "Sha"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the Item Number subheaders were written to the worksheet
         calls = [
@@ -2238,16 +2413,10 @@ class TestGenerateExcelFile(unittest.TestCase):
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(2, 0, "message1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 1, "author1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 2, "commit_url1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 3, "sha1", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 0, "message2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 1, "author2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 2, "commit_url2", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 3, "sha2", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(2, 0, ["message1", "author1", "commit_url1", "sha1"], mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(4, 0, ["message2", "author2", "commit_url2", "sha2"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
     
     @patch('xlsxwriter.Workbook')
@@ -2295,7 +2464,7 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the cherry pick command was written to the worksheet
@@ -2350,7 +2519,7 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the cherry pick command was written to the worksheet
@@ -2406,7 +2575,7 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the item cherry pick commands were written to the worksheet
@@ -2439,21 +2608,21 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Item", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Item"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(1, 0, "123", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(2, 0, "234", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(1, 0, ["123"], mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(2, 0, ["234"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
 
     @patch('builtins.print')
@@ -2481,14 +2650,14 @@ class TestGenerateExcelFile(unittest.TestCase):
         target.generate_excel_file()
 
         # Assert
-        mock_workbook.assert_called_once_with("output.xlsx")
+        mock_workbook.assert_called_once_with("output.xlsx", GitTheCommits.excel_workbook_options)
         mock_worksheet = mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value
 
         # Check that the correct headers were written to the worksheet
         calls = [
-            call('A1', "Item", mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+            call(0, 0, ["Item"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
 
         # Check that the Item Number subheaders were written to the worksheet
         calls = [
@@ -2499,10 +2668,130 @@ class TestGenerateExcelFile(unittest.TestCase):
 
         # Check that the correct data was written to the worksheet
         calls = [
-            call(2, 0, "123", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
-            call(4, 0, "234", mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(2, 0, ["123"], mock_workbook.return_value.__enter__.return_value.add_format.return_value),
+            call(4, 0, ["234"], mock_workbook.return_value.__enter__.return_value.add_format.return_value)
+        ]
+        mock_worksheet.write_row.assert_has_calls(calls, any_order=True)
+
+
+    @patch('os.path.isfile', return_value=False)
+    @patch('xlsxwriter.Workbook')
+    def test_writes_each_run_of_same_format_cells_together(self, mock_workbook: MagicMock, mock_isfile: MagicMock):
+        # Arrange
+        mock_worksheet = Mock()
+        mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value = mock_worksheet
+        header_format, subheader_format, data_format, data_warning_format, centered_data_format = [Mock() for _ in range(5)]
+        mock_workbook.return_value.__enter__.return_value.add_format.side_effect = [
+            header_format, subheader_format, data_format, data_warning_format, centered_data_format
+        ]
+
+        target = GitTheCommits(False)
+        target.commit_detail_visibilty.message = True
+        target.commit_detail_visibilty.author = True
+        target.commit_detail_visibilty.item_number = False
+        target.commit_detail_visibilty.date = False
+        target.commit_detail_visibilty.sha = True
+        target.commit_detail_visibilty.is_merge_commit = True
+        target.commit_detail_visibilty.cherry_pick_command = True
+        target.cherry_pick_command = "git cherry-pick"
+        target.commit_list = [
+            CommitInfo("message1", "author1", "2022-01-01", "sha1", "commit_url1", "pr_url1", "123", False)
+        ]
+
+        # Act
+        target.generate_excel_file()
+
+        # Assert
+        self.assertEqual([
+            call(0, 0, ["Commit Message", "Author", "Sha", "Is Merge Commit", "Cherry-Pick Command"], header_format),
+            call(1, 0, ["message1", "author1"], data_format),
+            call(1, 2, ["sha1", "False"], centered_data_format),
+            call(1, 4, ["git cherry-pick sha1"], data_format)
+        ], mock_worksheet.write_row.call_args_list)
+
+
+    def test_excel_columns_follow_commit_detail_visibility(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.commit_detail_visibilty = CommitDetailVisibility(message=True, date=True, sha=True, cherry_pick_command=True)
+        target.use_short_commit_hash = True
+        target.cherry_pick_command = "git cherry-pick -x"
+        commit = CommitInfo("message1", "author1", datetime(2022, 1, 2, 3, 4, 5), "sha1", "commit_url1", "pr_url1", "123", False)
+
+        # Act
+        columns = target.get_excel_columns()
+
+        # Assert
+        self.assertEqual(["Commit Message", "Date", "Sha", "Cherry-Pick Command"], [column.header for column in columns])
+        self.assertEqual([100, 20, 10, 80], [column.width for column in columns])
+        self.assertEqual([False, True, True, False], [column.centered for column in columns])
+        self.assertEqual(["message1", "01/02/2022, 03:04:05", "sha1", "git cherry-pick -x sha1"], 
+                         [column.get_value(commit) for column in columns])
+
+
+    @patch('os.path.isfile', return_value=False)
+    @patch('xlsxwriter.Workbook')
+    def test_writes_more_than_nine_columns(self, mock_workbook: MagicMock, mock_isfile: MagicMock):
+        # Arrange
+        mock_worksheet = Mock()
+        mock_workbook.return_value.__enter__.return_value.add_worksheet.return_value = mock_worksheet
+        mock_format = mock_workbook.return_value.__enter__.return_value.add_format.return_value
+
+        target = GitTheCommits(False)
+        target.all_commits_cherry_pick_command = False
+        target.commit_list = [
+            CommitInfo("message1", "author1", "2022-01-01", "sha1", "commit_url1", "pr_url1", "123", False)
         ]
-        mock_worksheet.write_string.assert_has_calls(calls, any_order=True)
+        columns = [ExcelColumn(f"Column {index}", 10, lambda commit, index=index: f"{commit.sha} {index}") for index in range(12)]
+
+        # Act
+        with patch.object(GitTheCommits, "get_excel_columns", return_value=columns):
+            target.generate_excel_file()
+
+        # Assert
+        mock_worksheet.set_column.assert_has_calls([call(index, index, 10) for index in range(12)])
+        mock_worksheet.write_row.assert_has_calls([
+            call(0, 0, [f"Column {index}" for index in range(12)], mock_format),
+            call(1, 0, [f"sha1 {index}" for index in range(12)], mock_format)
+        ])
+
+        target.commit_list = []
+        with patch.object(GitTheCommits, "get_excel_columns", return_value=columns):
+            target.generate_excel_file()
+
+        mock_worksheet.merge_range.assert_called_with('A2:L2', "No commits found", mock_format)
+
+
+    def test_streams_rows_to_file(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            target = GitTheCommits(False)
+            target.commit_detail_visibilty.message = True
+            target.commit_detail_visibilty.commit_url = True
+            target.commit_list = [
+                CommitInfo(f"=message{index}", "author", datetime(2022, 1, 1), f"sha{index}", 
+                           f"https://github.com/user/repo/commit/sha{index}", "None", "123", False)
+                for index in range(3)
+            ]
+
+            working_directory = os.getcwd()
+            os.chdir(path)
+
+            # Act
+            try:
+                target.generate_excel_file()
+            finally:
+                os.chdir(working_directory)
+
+            # Assert
+            with zipfile.ZipFile(os.path.join(path, "output.xlsx")) as workbook_file:
+                sheet = workbook_file.read("xl/worksheets/sheet1.xml").decode()
+
+            self.assertIn('<row r="4"', sheet)
+            # Written as plain strings rather than formulas and hyperlinks
+            self.assertIn("<t>=message2</t>", sheet)
+            self.assertNotIn("<f>", sheet)
+            self.assertNotIn("hyperlink", sheet)
 
 
 class TestFetchCommits(unittest.IsolatedAsyncioTestCase):
@@ -3273,6 +3562,7 @@ class TestFetchCommits(unittest.IsolatedAsyncioTestCase):
         mock_pull_request.created_at = datetime.today().replace(tzinfo=timezone.utc)
         mock_pull_request.head.ref = "ITEM-1234"
         mock_pull_request.merged = False
+        mock_pull_request.merged_at = None
         mock_pull_request.number = 1
         mock_pull_request.html_url = "www.google.com/pr"
         mock_pull_request.get_commits.return_value = [git_commit]
@@ -3359,45 +3649,478 @@ class TestFetchCommits(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("0987654321098765432109876543210987654321", result_commit_1.sha)
 
     
-    async def test_use_commit_history_returns_commits_within_search_date_limit(self):
+    async def test_use_pull_requests_checks_head_ref_before_merged_state(self):
         # Arrange
-        git_commit = Mock()
-        git_commit = generate_git_commit_object(
-            GitCommitDetails(
-                "commit for item-1234", 
-                "Uni", 
-                "uni@test.py", 
-                "2024-01-12T08:30:02.000Z", 
-                "0987654321098765432109876543210987654321", 
-                "www.google2.com", 
-                1, 
-                True,
-                "1234567890123456789012345678901234567890"
-            )
-        )
-
-        mock_pull_request = Mock()
-        mock_pull_request.created_at = datetime.today().replace(tzinfo=timezone.utc)
-        mock_pull_request.head.ref = "ITEM-1234"
-        mock_pull_request.merged = True
-        mock_pull_request.number = 1
-        mock_pull_request.html_url = "www.google.com/pr"
-        mock_pull_request.get_commits.return_value = [git_commit]
-
-        mock_commit = Mock()
-        mock_commit.sha = "ITEM-1234"
-        mock_commit.commit = git_commit
-        mock_commit.html_url = "www.google.com/commit"
-        mock_commit.get_pulls.return_value = [mock_pull_request]
+        mock_pull_request = generate_listed_pull_request(1, "ITEM-5678", [])
+        merged_at = PropertyMock(return_value=datetime.today().replace(tzinfo=timezone.utc))
+        type(mock_pull_request).merged_at = merged_at
+        merged = PropertyMock(return_value=True)
+        type(mock_pull_request).merged = merged
 
         mock_repo = Mock()
-        mock_repo.get_commits.return_value = [mock_commit]
+        mock_repo.get_pulls.return_value = [mock_pull_request]
 
-        mock_branch = Mock()
-        mock_branch.commit = generate_git_commit_object(
-            GitCommitDetails(
-                "This is a test", 
-                "Uni", 
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_pull_requests = True
+        target.github_repository = mock_repo
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(0, len(target.commit_list))
+        merged_at.assert_not_called()
+        merged.assert_not_called()
+        mock_pull_request.get_commits.assert_not_called()
+
+
+    async def test_use_pull_requests_uses_merged_at_instead_of_merged(self):
+        # Arrange
+        mock_pull_request = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        merged = PropertyMock(return_value=False)
+        type(mock_pull_request).merged = merged
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request]
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_pull_requests = True
+        target.github_repository = mock_repo
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        merged.assert_not_called()
+
+
+    @patch.object(CompletableGithubObject, "_complete")
+    async def test_counts_lazy_completions(self, mock_complete):
+        # Arrange
+        mock_commit = Mock()
+        mock_commit.commit = generate_git_commit_object(
+            GitCommitDetails("commit for item-1234", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", 
+                             "0987654321098765432109876543210987654321", "www.google2.com", 1, False)
+        )
+        # Simulates reading an attribute that wasn't part of the listing
+        mock_commit.get_pulls.side_effect = lambda: mock_commit.commit.complete() and []
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit]
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_commit_history = True
+        target.github_repository = mock_repo
+        target.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual(1, target.lazy_completion_count)
+
+
+    async def test_use_pull_request_search_fetches_commits_for_search_hits(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-12345", [generate_listed_commit("1234567890123456789012345678901234567890")])
+
+        mock_issue_1 = Mock()
+        mock_issue_1.number = 1
+        mock_issue_2 = Mock()
+        mock_issue_2.number = 2
+
+        mock_github = Mock()
+        mock_github.search_issues.return_value = [mock_issue_1, mock_issue_2, mock_issue_1]
+
+        mock_repo = Mock()
+        mock_repo.get_pull.side_effect = lambda number: { 1: mock_pull_request_1, 2: mock_pull_request_2 }[number]
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = False
+        target.item_numbers = ["ITEM-1234"]
+        target.use_pull_request_search = True
+        target.use_pull_requests = True
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.github = mock_github
+        target.github_repository = mock_repo
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual("0987654321098765432109876543210987654321", target.commit_list[0].sha)
+        mock_github.search_issues.assert_called_once_with("repo:user/repo is:pr is:merged base:develop head:ITEM-1234")
+        self.assertEqual(2, mock_repo.get_pull.call_count)
+        mock_repo.get_pulls.assert_not_called()
+
+
+    async def test_use_graphql_with_pull_requests_matches_rest_output(self):
+        # Arrange
+        rest_commit = Mock()
+        rest_commit.commit = generate_git_commit_object(
+            GitCommitDetails("This is a test", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", "0987654321098765432109876543210987654321", 
+                             "www.google.com/commit/0987654321098765432109876543210987654321", 1, True)
+        )
+        rest_pull_request = generate_listed_pull_request(1, "ITEM-1234", [rest_commit])
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [rest_pull_request]
+
+        rest_target = GitTheCommits(False)
+        rest_target.strip_characters_from_item_numbers = True
+        rest_target.item_numbers = ["1234"]
+        rest_target.use_pull_requests = True
+        rest_target.github_repository = mock_repo
+
+        requester = Mock()
+        requester.graphql_query.return_value = ({}, generate_graphql_pull_requests_page([
+            generate_graphql_pull_request_node(1, "ITEM-1234", datetime.today().replace(tzinfo=timezone.utc).isoformat(), 
+                                               [generate_graphql_commit_node("0987654321098765432109876543210987654321")]),
+            generate_graphql_pull_request_node(2, "ITEM-5678", datetime.today().replace(tzinfo=timezone.utc).isoformat(), 
+                                               [generate_graphql_commit_node("1234567890123456789012345678901234567890")])
+        ], None))
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_pull_requests = True
+        target.use_graphql = True
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.github = Mock()
+        target.github.requester = requester
+        target.github_repository = Mock()
+
+        # Act
+        await rest_target.fetch_commits()
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(rest_target.commit_list, target.commit_list)
+        target.github_repository.get_pulls.assert_not_called()
+
+
+    async def test_use_graphql_with_commit_history_uses_associated_pull_requests(self):
+        # Arrange
+        requester = Mock()
+        requester.graphql_query.return_value = ({}, { "data": { "repository": { "ref": { "target": { "history": {
+            "pageInfo": { "hasNextPage": False, "endCursor": None },
+            "nodes": [
+                { **generate_graphql_commit_node("0987654321098765432109876543210987654321", "commit for item-1234"), 
+                  "associatedPullRequests": { "nodes": [{ "url": "www.google.com/pr/1" }] } },
+                { **generate_graphql_commit_node("1234567890123456789012345678901234567890", "commit for item-5678"), 
+                  "associatedPullRequests": { "nodes": [] } }
+            ]
+        } } } } } })
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_commit_history = True
+        target.use_graphql = True
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.github = Mock()
+        target.github.requester = requester
+        target.github_repository = Mock()
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual("www.google.com/pr/1", target.commit_list[0].pr_url)
+        target.github_repository.get_commits.assert_not_called()
+
+
+    async def test_use_concurrent_commit_fetching_saves_commits_in_listing_order(self):
+        # Arrange
+        def generate_slow_commits(sha: str, delay: float):
+            def get_commits():
+                time.sleep(delay)
+                return [generate_listed_commit(sha)]
+
+            return get_commits
+
+        mock_pull_requests = []
+        for number in range(1, 6):
+            mock_pull_request = generate_listed_pull_request(number, f"ITEM-1234-{number}", [])
+            # Earlier pull requests finish last
+            mock_pull_request.get_commits.side_effect = generate_slow_commits(str(number) * 40, (6 - number) * 0.01)
+            mock_pull_requests.append(mock_pull_request)
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = mock_pull_requests
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_pull_requests = True
+        target.use_concurrent_commit_fetching = True
+        target.github_repository = mock_repo
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual([str(number) * 40 for number in range(1, 6)], [commit.sha for commit in target.commit_list])
+        self.assertEqual([0, 1, 2, 3, 4], target.item_commit_dictionary["1234"])
+
+
+    async def test_use_commit_history_with_local_repository_path_reads_local_clone(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [
+                ("commit for item-1234", "2024-01-10T08:30:02+00:00"),
+                ("commit for item-5678", "2024-01-11T08:30:02+00:00")
+            ])
+
+            target = GitTheCommits(False)
+            target.strip_characters_from_item_numbers = True
+            target.item_numbers = ["1234"]
+            target.use_commit_history = True
+            target.local_repository_path = path
+            target.repository_name = "user/repo"
+            target.target_branch_name = "develop"
+            target.github_repository = Mock()
+
+            # Act
+            await target.fetch_commits()
+
+            # Assert
+            self.assertEqual(1, len(target.commit_list))
+            self.assertEqual("commit for item-1234", target.commit_list[0].message)
+            self.assertEqual("Uni <uni@test.py>", target.commit_list[0].author)
+            self.assertEqual("None", target.commit_list[0].pr_url)
+            target.github_repository.get_commits.assert_not_called()
+
+
+    async def test_use_pull_requests_with_local_repository_path_walks_merge_commits(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [("First commit", "2024-01-10T08:30:02+00:00")])
+            merge_local_git_branch(path, 1, "ITEM-1234", [("Fix the thing", "2024-01-11T08:30:02+00:00"),
+                                                          ("Fix the other thing", "2024-01-12T08:30:02+00:00")])
+            merge_local_git_branch(path, 2, "ITEM-5678", [("Unrelated", "2024-01-13T08:30:02+00:00")])
+
+            target = GitTheCommits(False)
+            target.item_numbers = ["ITEM-1234"]
+            target.use_pull_requests = True
+            target.local_repository_path = path
+            target.repository_name = "user/repo"
+            target.target_branch_name = "develop"
+            target.github_repository = Mock()
+
+            # Act
+            await target.fetch_commits()
+
+            # Assert
+            self.assertEqual(["Fix the thing", "Fix the other thing"], [commit.message for commit in target.commit_list])
+            self.assertEqual("https://github.com/user/repo/pull/1", target.commit_list[0].pr_url)
+            self.assertEqual([0, 1], target.item_commit_dictionary["ITEM-1234"])
+            target.github_repository.get_pulls.assert_not_called()
+
+
+    async def test_use_pull_requests_with_local_repository_path_only_reads_commits_of_matching_merges(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [("First commit", "2024-01-10T08:30:02+00:00")])
+            for number in range(1, 6):
+                merge_local_git_branch(path, number, f"ITEM-{number}", [(f"Fix {number}", f"2024-01-1{number}T08:30:02+00:00")])
+
+            target = GitTheCommits(False)
+            target.item_numbers = ["ITEM-3"]
+            target.use_pull_requests = True
+            target.local_repository_path = path
+            target.repository_name = "user/repo"
+            target.target_branch_name = "develop"
+            target.github_repository = Mock()
+
+            # Act
+            with patch.object(LocalGitRepository, "get_merged_commits", autospec=True, 
+                              side_effect=LocalGitRepository.get_merged_commits) as get_merged_commits:
+                await target.fetch_commits()
+
+            # Assert
+            self.assertEqual(["Fix 3"], [commit.message for commit in target.commit_list])
+            self.assertEqual(1, get_merged_commits.call_count)
+
+
+    async def test_use_pull_requests_saves_commits_for_every_item_number_in_branch_name(self):
+        # Arrange
+        mock_pull_request = generate_listed_pull_request(1, "ITEM-12-ITEM-34-combined", 
+                                                         [generate_listed_commit("0987654321098765432109876543210987654321")])
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request]
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["12", "34", "56"]
+        target.use_pull_requests = True
+        target.github_repository = mock_repo
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual({ "12": [0], "34": [0] }, target.item_commit_dictionary)
+        self.assertEqual("12, 34", target.commit_list[0].item_number)
+
+
+    async def test_use_commit_history_matches_item_numbers_with_item_number_patterns(self):
+        # Arrange
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [
+            generate_listed_commit("0987654321098765432109876543210987654321", "PROJ-1234: Fix"),
+            generate_listed_commit("1234567890123456789012345678901234567890", "PROJ-12345: Other fix"),
+            generate_listed_commit("2345678901234567890123456789012345678901", "Fix build number 1234")
+        ]
+        for mock_commit in mock_repo.get_commits.return_value:
+            mock_commit.get_pulls.return_value = []
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_number_patterns = [re.compile(r"PROJ-(\d+)")]
+        target.item_numbers = ["1234"]
+        target.use_commit_history = True
+        target.github_repository = mock_repo
+        target.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(["0987654321098765432109876543210987654321"], [commit.sha for commit in target.commit_list])
+
+
+    async def test_puts_commits_on_commit_queue_as_they_are_found(self):
+        # Arrange
+        git_commits = [
+            generate_git_commit_object(
+                GitCommitDetails(message, "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", sha, "www.google2.com", 1, True)
+            )
+            for message, sha in [("commit for item-1234", "0987654321098765432109876543210987654321"),
+                                 ("commit for item-5678", "0987654321098765432109876543210987654322")]
+        ]
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234", "5678"]
+        target.use_commit_history = True
+        target.commit_queue = queue.Queue()
+
+        queue_sizes = []
+        def get_pulls():
+            queue_sizes.append(target.commit_queue.qsize())
+            return []
+
+        mock_commits = []
+        for git_commit in git_commits:
+            mock_commit = Mock()
+            mock_commit.commit = git_commit
+            mock_commit.get_pulls.side_effect = get_pulls
+            mock_commits.append(mock_commit)
+
+        target.github_repository = Mock()
+        target.github_repository.get_commits.return_value = mock_commits
+        target.github_target_branch = Mock()
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        # The first commit was on the queue while the second one was still being fetched
+        self.assertEqual([0, 1], queue_sizes)
+        queued_commits = [target.commit_queue.get_nowait() for _ in range(target.commit_queue.qsize())]
+        self.assertEqual(["0987654321098765432109876543210987654321", "0987654321098765432109876543210987654322"], 
+                         [commit.sha for commit in queued_commits])
+        self.assertEqual(["1234", "5678"], [commit.item_number for commit in queued_commits])
+
+
+    async def test_use_pull_requests_stops_listing_at_search_date_limit(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_1.merged = True
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-1234", [])
+        mock_pull_request_2.created_at = (datetime.today() - relativedelta(months=2)).replace(tzinfo=timezone.utc)
+
+        def list_pull_requests():
+            yield mock_pull_request_1
+            yield mock_pull_request_2
+            raise AssertionError("Pull requests past the search date limit should not be listed")
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = list_pull_requests()
+
+        target = GitTheCommits(False)
+        target.strip_characters_from_item_numbers = True
+        target.item_numbers = ["1234"]
+        target.use_pull_requests = True
+        target.use_concurrent_commit_fetching = True
+        target.search_date_limit = (datetime.today() - relativedelta(months=1)).replace(tzinfo=timezone.utc)
+        target.github_repository = mock_repo
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        mock_repo.get_pulls.assert_called_once_with(state="closed", base=target.target_branch_name, sort="created", direction="desc")
+        mock_pull_request_2.get_commits.assert_not_called()
+
+
+    async def test_use_commit_history_returns_commits_within_search_date_limit(self):
+        # Arrange
+        git_commit = Mock()
+        git_commit = generate_git_commit_object(
+            GitCommitDetails(
+                "commit for item-1234", 
+                "Uni", 
+                "uni@test.py", 
+                "2024-01-12T08:30:02.000Z", 
+                "0987654321098765432109876543210987654321", 
+                "www.google2.com", 
+                1, 
+                True,
+                "1234567890123456789012345678901234567890"
+            )
+        )
+
+        mock_pull_request = Mock()
+        mock_pull_request.created_at = datetime.today().replace(tzinfo=timezone.utc)
+        mock_pull_request.head.ref = "ITEM-1234"
+        mock_pull_request.merged = True
+        mock_pull_request.number = 1
+        mock_pull_request.html_url = "www.google.com/pr"
+        mock_pull_request.get_commits.return_value = [git_commit]
+
+        mock_commit = Mock()
+        mock_commit.sha = "ITEM-1234"
+        mock_commit.commit = git_commit
+        mock_commit.html_url = "www.google.com/commit"
+        mock_commit.get_pulls.return_value = [mock_pull_request]
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit]
+
+        mock_branch = Mock()
+        mock_branch.commit = generate_git_commit_object(
+            GitCommitDetails(
+                "This is a test", 
+                "Uni", 
                 "uni@test.py", 
                 "2024-01-12T08:30:02.000Z", 
                 "1234567890123456789012345678901234567890", 
@@ -4055,48 +4778,109 @@ class TestFetchCommits(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("0987654321098765432109876543210987654321", result_commit.sha)
 
 
-class TestOutputCommits(unittest.TestCase):
-    @patch('builtins.print')
-    @patch('builtins.input')
-    def test_prints_terminal_output_no_commits_found_when_no_commit_list_empty(self, mock_input: MagicMock, mock_print: MagicMock):
+class TestBuildPullRequestSearchQueries(unittest.TestCase):
+    def test_combines_item_numbers_into_one_query(self):
         # Arrange
         target = GitTheCommits(False)
-
-        target.commit_list = []
-        target.output_to_terminal = True
-        target.output_to_excel = False
-        target.output_to_txt = False
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.item_numbers = ["1234", "5678"]
 
         # Act
-        result = target.output_commits()
+        result = target.build_pull_request_search_queries()
 
         # Assert
-        self.assertIsNotNone(result)
-        self.assertEqual([], result)
-        mock_print.assert_called_once_with("\nNo commits found")
-        mock_input.assert_called_once_with("Press Enter to exit...")
+        self.assertEqual(["repo:user/repo is:pr is:merged base:develop head:1234 OR head:5678"], result)
 
 
-    @patch('builtins.print')
-    @patch('builtins.input')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_prints_txt_output_no_commits_found_when_no_commit_list_empty(self, mock_open: MagicMock, mock_input: MagicMock, mock_print: MagicMock):
+    def test_splits_queries_past_the_operator_limit(self):
         # Arrange
         target = GitTheCommits(False)
-
-        target.commit_list = []  # no commits
-        target.output_to_terminal = False
-        target.output_to_excel = False
-        target.output_to_txt = True
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.item_numbers = [str(item_number) for item_number in range(1, 9)]
 
         # Act
-        result = target.output_commits()
+        result = target.build_pull_request_search_queries()
 
         # Assert
-        self.assertIsNotNone(result)
-        self.assertEqual([], result)
-        mock_open.assert_called_once_with("output.txt", 'w')
-        mock_open().write.assert_called_once_with("No commits found")
+        self.assertEqual(2, len(result))
+        self.assertTrue(result[0].endswith("head:1 OR head:2 OR head:3 OR head:4 OR head:5 OR head:6"))
+        self.assertTrue(result[1].endswith("head:7 OR head:8"))
+
+
+    def test_splits_queries_past_the_length_limit(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.item_numbers = ["1" * 90, "2" * 90, "3" * 90]
+
+        # Act
+        result = target.build_pull_request_search_queries()
+
+        # Assert
+        self.assertEqual(2, len(result))
+        self.assertTrue(all(len(query) <= target.max_search_query_length for query in result))
+
+
+    def test_limits_queries_to_search_date_limit_and_skips_duplicates(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.repository_name = "user/repo"
+        target.target_branch_name = "develop"
+        target.item_numbers = ["1234", "", "1234"]
+        target.search_date_limit = datetime(2024, 1, 12, tzinfo=timezone.utc)
+
+        # Act
+        result = target.build_pull_request_search_queries()
+
+        # Assert
+        self.assertEqual(["repo:user/repo is:pr is:merged base:develop created:>=2024-01-12 head:1234"], result)
+
+
+class TestOutputCommits(unittest.TestCase):
+    @patch('builtins.print')
+    @patch('builtins.input')
+    def test_prints_terminal_output_no_commits_found_when_no_commit_list_empty(self, mock_input: MagicMock, mock_print: MagicMock):
+        # Arrange
+        target = GitTheCommits(False)
+
+        target.commit_list = []
+        target.output_to_terminal = True
+        target.output_to_excel = False
+        target.output_to_txt = False
+
+        # Act
+        result = target.output_commits()
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual([], result)
+        self.assertEqual("\nNo commits found\n", join_printed_calls(mock_print.call_args_list))
+        mock_input.assert_called_once_with("Press Enter to exit...")
+
+
+    @patch('builtins.print')
+    @patch('builtins.input')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_prints_txt_output_no_commits_found_when_no_commit_list_empty(self, mock_open: MagicMock, mock_input: MagicMock, mock_print: MagicMock):
+        # Arrange
+        target = GitTheCommits(False)
+
+        target.commit_list = []  # no commits
+        target.output_to_terminal = False
+        target.output_to_excel = False
+        target.output_to_txt = True
+
+        # Act
+        result = target.output_commits()
+
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual([], result)
+        mock_open.assert_called_once_with("output.txt", 'w')
+        self.assertEqual("No commits found", get_written_text(mock_open))
         mock_print.assert_not_called()
         mock_input.assert_not_called()
 
@@ -4145,7 +4929,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nCommit for 1 (1):\n- commit for item1\n\n---'),
             call('\nCommit for 2 (1):\n- commit for item2\n\n---'),
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
         mock_input.assert_called_once_with("Press Enter to exit...")
     
     
@@ -4204,7 +4988,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\n---'),
             call('\nCommit for 2 (1):\n- commit for item2\n\n---')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch("builtins.input", return_value='')
@@ -4242,9 +5026,48 @@ class TestOutputCommits(unittest.TestCase):
             call("\nCommit for 1 (1):\n- commit for item1\n\n---"),
             call("\nNo commits found for '2'\n\n---"),
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
 
+    @patch('builtins.input', return_value='')
+    @patch('builtins.print')
+    def test_terminal_group_by_item_lists_shared_commit_under_each_item(self, mock_print: MagicMock, mock_input: MagicMock):
+        # Arrange
+        commit = CommitInfo(
+            "commit for item1 and item2", 
+            "author1", 
+            datetime.strptime("2022-01-01", "%Y-%m-%d"), 
+            "1234567890", 
+            "www.google.com/commit1", 
+            "www.google.com/pr1", 
+            "1, 2", 
+            False
+        )
+
+        target = GitTheCommits(False)
+        target.output_to_terminal = True
+        target.group_commits_by_item = True
+        target.order_commits_by_date_descend = False
+        target.all_commits_cherry_pick_command = False
+        target.commit_detail_visibilty.message = True
+
+        target.commit_list = [commit]
+        target.item_numbers = ["1", "2"]
+        target.item_commit_dictionary = {"1": [0], "2": [0]}
+
+        # Act
+        result = target.output_commits()
+
+        # Assert
+        expected_calls = [
+            call('\nFound 1 related commit'),
+            call('\nCommit for 1 (1):\n- commit for item1 and item2\n\n---'),
+            call('\nCommit for 2 (1):\n- commit for item1 and item2\n\n---'),
+        ]
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
+        self.assertEqual([commit], result)
+
+
     @patch('builtins.input', return_value='')
     @patch('builtins.print')
     def test_terminal_group_by_item_sorts_commits_date_asc(self, mock_print: MagicMock, mock_input: MagicMock):
@@ -4289,7 +5112,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 2 related commits'),
             call('\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\n---')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch('builtins.input', return_value='')
@@ -4336,7 +5159,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 2 related commits'),
             call('\nCommits for 1 (2):\n- commit2 for item1\n\n- commit1 for item1\n\n---')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
 
 
     @patch('builtins.input', return_value='')
@@ -4386,7 +5209,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nCommit for 2 (1):\n- commit for item2\n\n---'),
             call('\ngit cherry-pick 1234567890 0987654321')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
 
 
     @patch('builtins.input', return_value='')
@@ -4445,7 +5268,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\ngit cherry-pick 1234567890 0987654321\n---'),
             call('\nCommit for 2 (1):\n- commit for item2\n\ngit cherry-pick 2345678901\n---')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -4486,7 +5309,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\n\nCommit for 1 (1):\n- commit for item1\n\n---\n\nCommit for 2 (1):\n- commit for item2\n\n---')
+        self.assertEqual('Found 2 related commits\n\nCommit for 1 (1):\n- commit for item1\n\n---\n\nCommit for 2 (1):\n- commit for item2\n\n---', get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -4538,7 +5361,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 3 related commits\n\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\n---\n\nCommit for 2 (1):\n- commit for item2\n\n---')
+        self.assertEqual('Found 3 related commits\n\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\n---\n\nCommit for 2 (1):\n- commit for item2\n\n---', get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -4570,7 +5393,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with("Found 1 related commit\n\nCommit for 1 (1):\n- commit for item1\n\n---\n\nNo commits found for '2'\n\n---")
+        self.assertEqual("Found 1 related commit\n\nCommit for 1 (1):\n- commit for item1\n\n---\n\nNo commits found for '2'\n\n---", get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -4612,7 +5435,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\n\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\n---')
+        self.assertEqual('Found 2 related commits\n\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\n---', get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -4654,7 +5477,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\n\nCommits for 1 (2):\n- commit2 for item1\n\n- commit1 for item1\n\n---')
+        self.assertEqual('Found 2 related commits\n\nCommits for 1 (2):\n- commit2 for item1\n\n- commit1 for item1\n\n---', get_written_text(mock_open))
 
 
     @patch('builtins.open', new_callable=mock_open)
@@ -4697,7 +5520,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\n\nCommit for 1 (1):\n- commit for item1\n\n---\n\nCommit for 2 (1):\n- commit for item2\n\n---\n\ngit cherry-pick 1234567890 0987654321')
+        self.assertEqual('Found 2 related commits\n\nCommit for 1 (1):\n- commit for item1\n\n---\n\nCommit for 2 (1):\n- commit for item2\n\n---\n\ngit cherry-pick 1234567890 0987654321', get_written_text(mock_open))
 
     
     @patch('builtins.open', new_callable=mock_open)
@@ -4751,7 +5574,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 3 related commits\n\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\ngit cherry-pick 1234567890 0987654321\n---\n\nCommit for 2 (1):\n- commit for item2\n\ngit cherry-pick 2345678901\n---')
+        self.assertEqual('Found 3 related commits\n\nCommits for 1 (2):\n- commit1 for item1\n\n- commit2 for item1\n\ngit cherry-pick 1234567890 0987654321\n---\n\nCommit for 2 (1):\n- commit for item2\n\ngit cherry-pick 2345678901\n---', get_written_text(mock_open))
     
     
     @patch('GitTheCommits.GitTheCommits.generate_excel_file')
@@ -5060,7 +5883,7 @@ class TestOutputCommits(unittest.TestCase):
             call("\nFound 2 related commits"),
             call("Here are all commits for your items in acsending order:\n\n- commit for item1\n\n- commit for item2\n")
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch('builtins.input', return_value='')
@@ -5117,7 +5940,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 3 related commits'),
             call('Here are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n\n- commit for item2\n')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch('builtins.input', return_value='')
@@ -5164,7 +5987,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 2 related commits'),
             call('Here are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch('builtins.input', return_value='')
@@ -5211,7 +6034,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 2 related commits'),
             call('Here are all commits for your items in descending order:\n\n- commit2 for item1\n\n- commit1 for item1\n')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
 
 
     @patch('builtins.input', return_value='')
@@ -5259,7 +6082,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 2 related commits'),
             call('Here are all commits for your items in acsending order:\n\n- commit for item1\n\n- commit for item2\n\ngit cherry-pick 1234567890 0987654321')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
 
     
     @patch('builtins.input', return_value='')
@@ -5317,7 +6140,7 @@ class TestOutputCommits(unittest.TestCase):
             call('\nFound 3 related commits'),
             call('Here are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n\n- commit for item2\n')
         ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(join_printed_calls(expected_calls), join_printed_calls(mock_print.call_args_list))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -5358,7 +6181,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\nHere are all commits for your items in acsending order:\n\n- commit for item1\n\n- commit for item2\n')
+        self.assertEqual('Found 2 related commits\nHere are all commits for your items in acsending order:\n\n- commit for item1\n\n- commit for item2\n', get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -5410,7 +6233,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 3 related commits\nHere are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n\n- commit for item2\n')
+        self.assertEqual('Found 3 related commits\nHere are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n\n- commit for item2\n', get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -5452,7 +6275,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\nHere are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n')
+        self.assertEqual('Found 2 related commits\nHere are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n', get_written_text(mock_open))
     
     
     @patch('builtins.open', new_callable=mock_open)
@@ -5494,7 +6317,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\nHere are all commits for your items in descending order:\n\n- commit2 for item1\n\n- commit1 for item1\n')
+        self.assertEqual('Found 2 related commits\nHere are all commits for your items in descending order:\n\n- commit2 for item1\n\n- commit1 for item1\n', get_written_text(mock_open))
 
 
     @patch('builtins.open', new_callable=mock_open)
@@ -5537,7 +6360,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 2 related commits\nHere are all commits for your items in acsending order:\n\n- commit for item1\n\n- commit for item2\n\ngit cherry-pick 1234567890 0987654321')
+        self.assertEqual('Found 2 related commits\nHere are all commits for your items in acsending order:\n\n- commit for item1\n\n- commit for item2\n\ngit cherry-pick 1234567890 0987654321', get_written_text(mock_open))
 
     
     @patch('builtins.open', new_callable=mock_open)
@@ -5590,7 +6413,7 @@ class TestOutputCommits(unittest.TestCase):
         target.output_commits()
 
         # Assert
-        mock_open().write.assert_called_once_with('Found 3 related commits\nHere are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n\n- commit for item2\n')
+        self.assertEqual('Found 3 related commits\nHere are all commits for your items in acsending order:\n\n- commit1 for item1\n\n- commit2 for item1\n\n- commit for item2\n', get_written_text(mock_open))
     
     
     @patch('GitTheCommits.GitTheCommits.generate_excel_file')
@@ -5839,6 +6662,135 @@ class TestGetGithubObjects(unittest.TestCase):
         self.assertEqual(target.github_target_branch, mock_branch)
 
 
+    def test_adaptive_throttling_throttles_the_github_connection(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.github_token = 'mock_token'
+        target.repository_name = 'mock_repo'
+        target.target_branch_name = 'mock_branch'
+        target.use_adaptive_throttling = True
+
+        response = Mock()
+        response.status_code = 200
+        response.headers = { "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "1700000000" }
+        response.text = json.dumps({ "full_name": "user/mock_repo", "url": "https://api.github.com/repos/user/mock_repo" })
+
+        # Act
+        with patch("requests.Session.get", return_value=response) as mock_get:
+            target.get_github_objects()
+
+        # Assert
+        self.assertEqual(4999, target.rate_limit_throttle.get_budget("core").remaining)
+        self.assertEqual(2, mock_get.call_count)
+
+
+    def test_multiple_tokens_fail_over_when_one_is_rate_limited(self):
+        # Arrange
+        target = GitTheCommits(False)
+        target.github_token = ['token_1', 'token_2']
+        target.repository_name = 'mock_repo'
+        target.target_branch_name = 'mock_branch'
+
+        sent_tokens = []
+
+        def get(url, headers, **kwargs):
+            sent_tokens.append(headers["Authorization"])
+            response = Mock()
+            if headers["Authorization"] == "token token_1":
+                response.status_code = 403
+                response.headers = CaseInsensitiveDict({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999" })
+                response.text = json.dumps({ "message": "API rate limit exceeded" })
+            else:
+                response.status_code = 200
+                response.headers = CaseInsensitiveDict({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "9999999999" })
+                response.text = json.dumps({ "full_name": "user/mock_repo", "url": "https://api.github.com/repos/user/mock_repo" })
+            return response
+
+        # Act
+        with patch("requests.Session.get", side_effect=get):
+            result = target.get_github_objects()
+
+        # Assert
+        self.assertIsNone(result)
+        self.assertEqual(["token token_1", "token token_2", "token token_2"], sent_tokens)
+
+
+    def test_cache_makes_requests_conditional_and_reuses_unchanged_responses(self):
+        # Arrange
+        commit_cache = CommitCache(":memory:")
+        sent_headers = []
+
+        def get(url, headers, **kwargs):
+            sent_headers.append(headers)
+            response = Mock()
+            if headers.get("If-None-Match") == '"etag-1"':
+                response.status_code = 304
+                response.headers = CaseInsensitiveDict({ "ETag": '"etag-1"', "X-RateLimit-Remaining": "4999" })
+                response.text = ""
+            else:
+                response.status_code = 200
+                response.headers = CaseInsensitiveDict({ "ETag": '"etag-1"', "X-RateLimit-Remaining": "4998" })
+                response.text = json.dumps([{ "number": 1 }])
+            return response
+
+        def run():
+            connection = ConditionalRequestCache(commit_cache).create_connection_class()("api.github.com", 443)
+            connection.request("GET", "/repos/user/mock_repo/pulls?state=closed", None, {})
+            return connection.getresponse()
+
+        # Act
+        with patch("requests.Session.get", side_effect=get):
+            run()
+            result = run()
+
+        # Assert
+        self.assertEqual(200, result.status)
+        self.assertEqual([{ "number": 1 }], json.loads(result.read()))
+        self.assertEqual("4999", result.headers["X-RateLimit-Remaining"])
+        self.assertEqual(["If-None-Match" in headers for headers in sent_headers], [False, True])
+
+
+    def test_cache_only_stores_pull_request_listings(self):
+        # Arrange
+        commit_cache = CommitCache(":memory:")
+        sent_headers = []
+
+        def get(url, headers, **kwargs):
+            sent_headers.append(headers)
+            response = Mock()
+            response.status_code = 200
+            response.headers = CaseInsensitiveDict({ "ETag": '"etag-1"', "X-RateLimit-Remaining": "4998" })
+            response.text = json.dumps({ "full_name": "user/mock_repo" })
+            return response
+
+        def run(url):
+            connection = ConditionalRequestCache(commit_cache).create_connection_class()("api.github.com", 443)
+            connection.request("GET", url, None, {})
+            return connection.getresponse()
+
+        # Act
+        with patch("requests.Session.get", side_effect=get):
+            for url in ["/repos/user/mock_repo", "/repos/user/mock_repo/commits?sha=abc&since=2024-01-12T08:30:02Z",
+                        "/repos/user/mock_repo/pulls/12/commits"]:
+                run(url)
+                run(url)
+
+        # Assert
+        self.assertEqual(6, len(sent_headers))
+        self.assertFalse(any("If-None-Match" in headers for headers in sent_headers))
+        self.assertIsNone(commit_cache.get_http_response("/repos/user/mock_repo "))
+
+
+    def test_recognizes_pull_request_listing_urls(self):
+        # Act / Assert
+        self.assertTrue(is_pull_request_listing_url("/repos/user/repo/pulls?state=closed&page=2"))
+        self.assertTrue(is_pull_request_listing_url("/api/v3/repos/user/repo/pulls?state=closed"))
+        self.assertFalse(is_pull_request_listing_url("/repos/user/repo/pulls/12/commits"))
+        self.assertFalse(is_pull_request_listing_url("/repos/user/repo/commits?sha=abc&since=2024-01-12T08:30:02Z"))
+        self.assertFalse(is_pull_request_listing_url("/repos/user/repo/pulls/12"))
+        self.assertFalse(is_pull_request_listing_url("/search/issues?q=repo:user/repo"))
+
+
     @patch('GitTheCommits.Github')
     def test_bad_credentials(self, mock_github: MagicMock):
         # Arrange
@@ -5942,61 +6894,1670 @@ class TestGetGithubObjects(unittest.TestCase):
         self.assertTrue('Internal Server Error' in str(context.exception))
 
 
-# Helper Section
-@dataclass
-class GitCommitDetails(object):
-    """A DTO used to generate fake GitCommits"""
-    
-    message: str
-    name: str
-    email: str
-    date: str
-    sha: str
-    html_url: str
-    num_parents: int
-    completed: bool
-    first_parent_sha: str = ""
+class TestLazyCompletionCounter(unittest.TestCase):
+    @patch.object(CompletableGithubObject, "_complete")
+    def test_counts_completions_while_active(self, mock_complete):
+        # Arrange
+        git_commit = generate_git_commit_object(
+            GitCommitDetails("This is a test", "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", 
+                             "0987654321098765432109876543210987654321", "www.google2.com", 1, False)
+        )
 
+        # Act
+        with LazyCompletionCounter() as target:
+            git_commit.complete()
+            git_commit.complete()
 
-def get_random_sha():
-    return str(randint(1000000000000000000000000000000000000000, 9999999999999999999999999999999999999999))
+        git_commit.complete()
 
+        # Assert
+        self.assertEqual(2, target.count)
+        self.assertEqual(3, mock_complete.call_count)
+        self.assertIs(mock_complete, CompletableGithubObject._complete)
+
+
+class TestGraphQLFetcher(unittest.TestCase):
+    def test_lists_merged_pull_requests_across_pages_until_since(self):
+        # Arrange
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        pages = [
+            generate_graphql_pull_requests_page([
+                generate_graphql_pull_request_node(3, "ITEM-3", "2024-01-13T00:00:00Z", [generate_graphql_commit_node("sha3")])
+            ], "cursor1"),
+            generate_graphql_pull_requests_page([
+                generate_graphql_pull_request_node(2, "ITEM-2", "2024-01-12T00:00:00Z", [generate_graphql_commit_node("sha2")]),
+                generate_graphql_pull_request_node(1, "ITEM-1", "2023-12-31T00:00:00Z", [generate_graphql_commit_node("sha1")])
+            ], "cursor2")
+        ]
 
-def generate_git_commit_object(details: GitCommitDetails):
-    requester = Requester(Auth.Token("FakeToken"), "https://www.github.com", 123, "user_agent", 10, True, 3, 256)
-    headers = {
-        "IsTest": True
-    }
+        requester = Mock()
+        requester.graphql_query.side_effect = [({}, page) for page in pages]
 
-    parent_commits = []
-    for iteration in range(details.num_parents):
-        parent_sha = details.first_parent_sha if len(details.first_parent_sha) > 0 and iteration == details.num_parents else get_random_sha()
+        target = GraphQLFetcher(requester, "user/repo")
 
-        parent_commit = generate_git_commit_object(
-            GitCommitDetails(
-                f"parent_{uuid.uuid4()}", 
-                "Parent", 
-                "parentcommit@test.py", 
-                datetime.today().replace(tzinfo=timezone.utc).isoformat(), 
-                parent_sha,
-                "www.google.com/parent",
-                0,
-                True
-            )
-        )
-        
-        parent_commits.append(parent_commit.__dict__)
+        # Act
+        result = list(target.get_merged_pull_requests("develop", since))
 
-    attributes = {
-        "message": details.message,
-        "author": {
-            "name": details.name,
-            "email": details.email,
-            "date": details.date,
-        },
-        "sha": details.sha,
-        "html_url": details.html_url,
-        "parents": parent_commits
-    }
+        # Assert
+        self.assertEqual([3, 2], [pull_request.number for pull_request, _ in result])
+        self.assertEqual(["sha2"], [commit.sha for commit in result[1][1]()])
+        self.assertEqual(2, requester.graphql_query.call_count)
+        variables = requester.graphql_query.call_args_list[1][0][1]
+        self.assertEqual({ "owner": "user", "name": "repo", "base": "develop", "after": "cursor1" }, variables)
 
-    return GitCommit(requester, headers, attributes, details.completed)
+
+    def test_fetches_pull_request_commits_past_the_first_page(self):
+        # Arrange
+        node = generate_graphql_pull_request_node(1, "ITEM-1", "2024-01-12T00:00:00Z", [generate_graphql_commit_node("sha1")])
+        node["commits"]["pageInfo"] = { "hasNextPage": True, "endCursor": "commits1" }
+
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            ({}, generate_graphql_pull_requests_page([node], None)),
+            ({}, { "data": { "repository": { "pullRequest": { "commits": {
+                "pageInfo": { "hasNextPage": False, "endCursor": None },
+                "nodes": [{ "commit": generate_graphql_commit_node("sha2") }]
+            } } } } })
+        ]
+
+        target = GraphQLFetcher(requester, "user/repo")
+
+        # Act
+        result = list(target.get_merged_pull_requests("develop"))
+
+        # Assert
+        self.assertEqual(["sha1", "sha2"], [commit.sha for commit in result[0][1]()])
+
+
+    def test_only_fetches_pull_request_commits_past_the_first_page_when_asked(self):
+        # Arrange
+        node = generate_graphql_pull_request_node(1, "ITEM-1", "2024-01-12T00:00:00Z", [generate_graphql_commit_node("sha1")])
+        node["commits"]["pageInfo"] = { "hasNextPage": True, "endCursor": "commits1" }
+
+        requester = Mock()
+        requester.graphql_query.side_effect = [({}, generate_graphql_pull_requests_page([node], None))]
+
+        target = GraphQLFetcher(requester, "user/repo")
+
+        # Act
+        result = list(target.get_merged_pull_requests("develop"))
+
+        # Assert
+        self.assertEqual([1], [pull_request.number for pull_request, _ in result])
+        self.assertEqual(1, requester.graphql_query.call_count)
+
+
+    def test_converts_commit_dates_to_utc(self):
+        # Arrange
+        commit_node = generate_graphql_commit_node("sha1")
+        commit_node["author"]["date"] = "2024-01-12T03:30:02-05:00"
+
+        requester = Mock()
+        requester.graphql_query.return_value = ({}, { "data": { "repository": { "ref": { "target": { "history": {
+            "pageInfo": { "hasNextPage": False, "endCursor": None },
+            "nodes": [{ **commit_node, "associatedPullRequests": { "nodes": [{ "url": "www.google.com/pr/1" }] } }]
+        } } } } } })
+
+        target = GraphQLFetcher(requester, "user/repo")
+
+        # Act
+        result = list(target.get_branch_commits("develop"))
+
+        # Assert
+        commit, pr_urls = result[0]
+        self.assertEqual(datetime(2024, 1, 12, 8, 30, 2, tzinfo=timezone.utc), commit.date)
+        self.assertEqual(["www.google.com/pr/1"], pr_urls)
+
+
+class TestBoundedScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_runs_worker_for_every_item_with_its_order(self):
+        # Arrange
+        target = BoundedScheduler(3)
+        results = []
+
+        async def worker(order: int, item: str):
+            results.append((order, item))
+
+        # Act
+        await target.run(iter(["a", "b", "c", "d", "e"]), worker)
+
+        # Assert
+        self.assertEqual([(0, "a"), (1, "b"), (2, "c"), (3, "d"), (4, "e")], sorted(results))
+
+
+    async def test_limits_workers_in_flight_and_items_listed_ahead(self):
+        # Arrange
+        target = BoundedScheduler(2)
+        listed = []
+        in_flight = 0
+        max_in_flight = 0
+        max_listed_ahead = 0
+        processed = 0
+
+        def list_items():
+            for item in range(20):
+                listed.append(item)
+                yield item
+
+        async def worker(order: int, item: int):
+            nonlocal in_flight, max_in_flight, max_listed_ahead, processed
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            max_listed_ahead = max(max_listed_ahead, len(listed) - processed)
+            processed += 1
+            in_flight -= 1
+
+        # Act
+        await target.run(list_items(), worker)
+
+        # Assert
+        self.assertEqual(20, processed)
+        self.assertEqual(2, max_in_flight)
+        # The two items in flight, two waiting in the queue, and the one waiting to be queued
+        self.assertLessEqual(max_listed_ahead, 5)
+
+
+    async def test_raises_worker_error_after_stopping_listing(self):
+        # Arrange
+        target = BoundedScheduler(2)
+        listed = []
+
+        def list_items():
+            for item in range(1000):
+                listed.append(item)
+                yield item
+
+        async def worker(order: int, item: int):
+            if item == 3:
+                raise ValueError("Failed")
+            await asyncio.sleep(0)
+
+        # Act
+        with self.assertRaises(ValueError):
+            await target.run(list_items(), worker)
+
+        # Assert
+        self.assertLess(len(listed), 1000)
+
+
+    async def test_raises_listing_error(self):
+        # Arrange
+        target = BoundedScheduler(2)
+
+        def list_items():
+            yield 1
+            raise GithubException(500, { "message": "Server Error" })
+
+        async def worker(order: int, item: int):
+            pass
+
+        # Act / Assert
+        with self.assertRaises(GithubException):
+            await target.run(list_items(), worker)
+
+
+class TestCommitAccumulator(unittest.TestCase):
+    def test_drains_commits_in_listing_order(self):
+        # Arrange
+        target = CommitAccumulator()
+        commit_1 = generate_commit_record("sha1")
+        commit_2 = generate_commit_record("sha2")
+        commit_3 = generate_commit_record("sha3")
+
+        target.add((1, 0, 1), commit_3, ["1234"], pr_url="www.google.com/pr/1")
+        target.add((0, 5), commit_2, ["1234"], pr_urls=(url for url in ["www.google.com/pr/2"]))
+        target.add((0, 1), commit_1, ["5678"])
+
+        # Act
+        result = target.drain()
+
+        # Assert
+        self.assertEqual(["sha1", "sha2", "sha3"], [commit.sha for _, commit, _, _, _ in result])
+        self.assertEqual(("www.google.com/pr/2",), result[1][3])
+        self.assertEqual([], target.drain())
+
+
+class TestRateLimitThrottle(unittest.TestCase):
+    def test_does_not_wait_while_budget_is_plentiful(self):
+        # Arrange
+        sleep = Mock()
+        target = RateLimitThrottle(clock=lambda: 1000, sleep=sleep)
+        target.update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600" })
+
+        # Act
+        for _ in range(10):
+            target.wait()
+
+        # Assert
+        sleep.assert_not_called()
+
+
+    def test_spaces_requests_more_as_budget_runs_low(self):
+        # Arrange
+        target = RateLimitThrottle(clock=lambda: 1000)
+
+        # Act
+        target.update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "900", "X-RateLimit-Reset": "4600" })
+        slightly_low = target.get_seconds_between_requests(1000)
+        target.update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "4600" })
+        very_low = target.get_seconds_between_requests(1000)
+
+        # Assert
+        self.assertGreater(slightly_low, 0)
+        self.assertGreater(very_low, slightly_low)
+        self.assertLessEqual(very_low, 3600 / 100)
+
+
+    def test_waits_for_reset_once_budget_is_used_up(self):
+        # Arrange
+        sleep = Mock()
+        target = RateLimitThrottle(clock=lambda: 1000, sleep=sleep)
+        target.update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "1060" })
+
+        # Act
+        target.wait()
+        target.wait()
+
+        # Assert
+        sleep.assert_called_once_with(60)
+
+
+    def test_waits_for_retry_after(self):
+        # Arrange
+        sleep = Mock()
+        target = RateLimitThrottle(clock=lambda: 1000, sleep=sleep)
+        target.update({ "Retry-After": "30" })
+
+        # Act
+        target.wait()
+
+        # Assert
+        sleep.assert_called_once_with(30)
+
+
+    def test_tracks_each_resource_budget_separately(self):
+        # Arrange
+        sleep = Mock()
+        target = RateLimitThrottle(clock=lambda: 1000, sleep=sleep)
+        target.update({ "X-RateLimit-Limit": "30", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1060", 
+                        "X-RateLimit-Resource": "search" }, "search")
+        target.update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600", 
+                        "X-RateLimit-Resource": "core" })
+
+        # Act
+        target.wait("core")
+        sleep.assert_not_called()
+        target.wait("search")
+
+        # Assert
+        sleep.assert_called_once_with(60)
+        self.assertEqual(0, target.get_seconds_between_requests(1000, "core"))
+        self.assertEqual(-1, target.get_budget("search").remaining)
+
+
+    def test_uses_resource_header_over_requested_resource(self):
+        # Arrange
+        target = RateLimitThrottle(clock=lambda: 1000)
+
+        # Act
+        target.update({ "X-RateLimit-Limit": "30", "X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1060", 
+                        "X-RateLimit-Resource": "search" })
+
+        # Assert
+        self.assertEqual(3, target.get_budget("search").remaining)
+        self.assertIsNone(target.get_budget("core").remaining)
+
+
+    def test_gets_rate_limit_resource_from_url(self):
+        # Act / Assert
+        self.assertEqual("search", get_rate_limit_resource("/search/issues?q=repo%3Auser%2Frepo"))
+        self.assertEqual("graphql", get_rate_limit_resource("/graphql"))
+        self.assertEqual("graphql", get_rate_limit_resource("/api/graphql"))
+        self.assertEqual("core", get_rate_limit_resource("/repos/user/repo/commits?sha=develop"))
+        self.assertEqual("core", get_rate_limit_resource("/repos/user/search/pulls"))
+
+
+class TestTokenPool(unittest.TestCase):
+    def test_chooses_unused_tokens_first_then_the_one_with_most_budget(self):
+        # Arrange
+        target = TokenPool(["token_1", "token_2", "token_3"], clock=lambda: 1000)
+        target.throttles["token_1"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "4600" })
+        target.throttles["token_2"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "3000", "X-RateLimit-Reset": "4600" })
+
+        # Act
+        unused = target.choose_token()
+        target.throttles["token_3"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "2000", "X-RateLimit-Reset": "4600" })
+        most_budget = target.choose_token()
+
+        # Assert
+        self.assertEqual("token_3", unused)
+        self.assertEqual("token_2", most_budget)
+
+
+    def test_chooses_the_token_available_soonest_when_all_are_used_up(self):
+        # Arrange
+        target = TokenPool(["token_1", "token_2"], clock=lambda: 1000)
+        target.throttles["token_1"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3000" })
+        target.throttles["token_2"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2000" })
+
+        # Act
+        result = target.choose_token()
+
+        # Assert
+        self.assertEqual("token_2", result)
+
+
+    def test_chooses_token_by_the_requested_resource_budget(self):
+        # Arrange
+        target = TokenPool(["token_1", "token_2"], clock=lambda: 1000)
+        target.throttles["token_1"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600" })
+        target.throttles["token_1"].update({ "X-RateLimit-Limit": "30", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1060", 
+                                             "X-RateLimit-Resource": "search" })
+        target.throttles["token_2"].update({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "4600" })
+        target.throttles["token_2"].update({ "X-RateLimit-Limit": "30", "X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "1060", 
+                                             "X-RateLimit-Resource": "search" })
+
+        # Act
+        core_token = target.choose_token()
+        search_token = target.choose_token(resource="search")
+
+        # Assert
+        self.assertEqual("token_1", core_token)
+        self.assertEqual("token_2", search_token)
+
+
+    def test_waits_and_retries_once_every_token_is_rate_limited(self):
+        # Arrange
+        sleep = Mock()
+        target = TokenPool(["token_1", "token_2"], clock=lambda: 1000, sleep=sleep)
+        sent_tokens = []
+
+        def get(url, headers, **kwargs):
+            sent_tokens.append(headers["Authorization"])
+            response = Mock()
+            if len(sent_tokens) <= 2:
+                response.status_code = 403
+                response.headers = CaseInsensitiveDict({ "Retry-After": "60" })
+            else:
+                response.status_code = 200
+                response.headers = CaseInsensitiveDict({ "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "4600" })
+            return response
+
+        connection = target.create_connection_class()("api.github.com", 443)
+        connection.request("GET", "/repos/user/repo", None, {})
+
+        # Act
+        with patch("requests.Session.get", side_effect=get):
+            result = connection.getresponse()
+
+        # Assert
+        self.assertEqual(200, result.status)
+        self.assertEqual(["token token_1", "token token_2", "token token_1"], sent_tokens)
+        sleep.assert_called_once_with(60)
+
+
+    def test_gives_up_on_a_request_that_stays_rate_limited(self):
+        # Arrange
+        target = TokenPool(["token_1", "token_2"], clock=lambda: 1000, sleep=Mock())
+        target.max_rate_limited_rounds = 3
+        sent_tokens = []
+
+        def get(url, headers, **kwargs):
+            sent_tokens.append(headers["Authorization"])
+            response = Mock()
+            response.status_code = 429
+            response.headers = CaseInsensitiveDict({ "Retry-After": "60" })
+            return response
+
+        connection = target.create_connection_class()("api.github.com", 443)
+        connection.request("GET", "/repos/user/repo", None, {})
+
+        # Act
+        with patch("requests.Session.get", side_effect=get):
+            result = connection.getresponse()
+
+        # Assert
+        self.assertEqual(429, result.status)
+        self.assertEqual(6, len(sent_tokens))
+
+
+    def test_returns_none_once_every_token_is_excluded(self):
+        # Arrange
+        target = TokenPool(["token_1", "token_2"])
+
+        # Act
+        result = target.choose_token({ "token_1", "token_2" })
+
+        # Assert
+        self.assertIsNone(result)
+
+
+class TestLocalGitRepository(unittest.TestCase):
+    def test_lists_branch_history_newest_first(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [
+                ("First commit", "2024-01-10T08:30:02-05:00"),
+                ("ITEM-1234: Second commit\n\nWith a body", "2024-01-11T08:30:02+00:00")
+            ])
+            target = LocalGitRepository(path, "user/repo")
+
+            # Act
+            result = list(target.get_branch_commits("develop"))
+
+            # Assert
+            self.assertEqual(["ITEM-1234: Second commit\n\nWith a body", "First commit"], [commit.message for commit in result])
+            self.assertEqual(datetime(2024, 1, 10, 13, 30, 2, tzinfo=timezone.utc), result[1].date)
+            self.assertEqual("Uni", result[0].author_name)
+            self.assertEqual("uni@test.py", result[0].author_email)
+            self.assertEqual(f"https://github.com/user/repo/commit/{result[0].sha}", result[0].html_url)
+            self.assertEqual([1, 0], [commit.parent_count for commit in result])
+
+
+    def test_limits_history_to_since(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [
+                ("First commit", "2024-01-10T08:30:02+00:00"),
+                ("Second commit", "2024-01-12T08:30:02+00:00")
+            ])
+            target = LocalGitRepository(path, "user/repo")
+
+            # Act
+            result = list(target.get_branch_commits("develop", datetime(2024, 1, 11, tzinfo=timezone.utc)))
+
+            # Assert
+            self.assertEqual(["Second commit"], [commit.message for commit in result])
+
+
+    def test_raises_if_branch_is_missing(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [("First commit", "2024-01-10T08:30:02+00:00")])
+            target = LocalGitRepository(path, "user/repo")
+
+            # Act / Assert
+            with self.assertRaises(Exception):
+                list(target.get_branch_commits("main"))
+
+
+    def test_lists_merged_pull_requests_with_their_commits(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [("First commit", "2024-01-10T08:30:02+00:00")])
+            merge_local_git_branch(path, 12, "ITEM-1234-fix", [("Fix the thing", "2024-01-11T08:30:02+00:00"),
+                                                               ("Fix the other thing", "2024-01-12T08:30:02+00:00")])
+            merge_local_git_branch(path, 13, "ITEM-5678", [("Unrelated", "2024-01-13T08:30:02+00:00")])
+            target = LocalGitRepository(path, "user/repo")
+
+            # Act
+            result = list(target.get_merged_pull_requests("develop"))
+
+            # Assert
+            self.assertEqual([13, 12], [pull_request.number for pull_request, _ in result])
+            pull_request, get_commits = result[1]
+            self.assertEqual("ITEM-1234-fix", pull_request.head_ref)
+            self.assertTrue(pull_request.merged)
+            self.assertEqual("https://github.com/user/repo/pull/12", pull_request.html_url)
+            self.assertEqual(datetime(2024, 1, 12, 8, 30, 2, tzinfo=timezone.utc), pull_request.merged_at)
+            self.assertEqual(["Fix the thing", "Fix the other thing"], [commit.message for commit in get_commits()])
+
+
+    def test_skips_merges_that_are_not_pull_requests(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [("First commit", "2024-01-10T08:30:02+00:00")])
+            merge_local_git_branch(path, 12, "ITEM-1234", [("Fix the thing", "2024-01-11T08:30:02+00:00")],
+                                   merge_message="Merge branch 'ITEM-1234' into develop")
+            target = LocalGitRepository(path, "user/repo")
+
+            # Act
+            result = list(target.get_merged_pull_requests("develop"))
+
+            # Assert
+            self.assertEqual([], result)
+
+
+    def test_limits_merged_pull_requests_to_since(self):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            generate_local_git_repository(path, [("First commit", "2024-01-10T08:30:02+00:00")])
+            merge_local_git_branch(path, 12, "ITEM-1234", [("Old fix", "2024-01-11T08:30:02+00:00")])
+            merge_local_git_branch(path, 13, "ITEM-1234", [("New fix", "2024-01-13T08:30:02+00:00")])
+            target = LocalGitRepository(path, "user/repo")
+
+            # Act
+            result = list(target.get_merged_pull_requests("develop", datetime(2024, 1, 12, tzinfo=timezone.utc)))
+
+            # Assert
+            self.assertEqual([13], [pull_request.number for pull_request, _ in result])
+
+
+class TestItemNumberMatcher(unittest.TestCase):
+    def test_finds_every_item_number_in_commit_message_in_item_number_order(self):
+        # Arrange
+        target = ItemNumberMatcher(["ITEM-12345", "ITEM-1", "ITEM-123", "ITEM-99"], False)
+
+        # Act
+        result = target.match_commit_message("ITEM-12345: Fix (see ITEM-123)")
+
+        # Assert
+        self.assertEqual(["ITEM-12345", "ITEM-1", "ITEM-123"], result)
+
+
+    def test_escapes_item_numbers_in_commit_message(self):
+        # Arrange
+        target = ItemNumberMatcher(["ITEM.1", "ITEM(2"], False)
+
+        # Act
+        result = target.match_commit_message("ITEMX1 and ITEM(2")
+
+        # Assert
+        self.assertEqual(["ITEM(2"], result)
+
+
+    def test_finds_item_numbers_ending_branch_name_when_keeping_characters(self):
+        # Arrange
+        target = ItemNumberMatcher(["ITEM-1234", "1234", "ITEM-123", "ITEM-12345"], False)
+
+        # Act
+        result = target.match_branch_name("feature/ITEM-1234")
+
+        # Assert
+        self.assertEqual(["ITEM-1234", "1234"], result)
+
+
+    def test_finds_whole_numbers_when_stripping_characters(self):
+        # Arrange
+        target = ItemNumberMatcher(["1234", "123", "5678"], True)
+
+        # Act / Assert
+        self.assertEqual(["1234", "5678"], target.match_commit_message("ITEM-5678: Fix ITEM-1234"))
+        self.assertEqual(["1234"], target.match_branch_name("feature/ITEM-1234-and-more"))
+        self.assertEqual([], target.match_branch_name("feature/ITEM-12345"))
+
+
+    def test_finds_whole_item_numbers_extracted_by_item_number_patterns(self):
+        # Arrange
+        target = ItemNumberMatcher(["1234", "5678", "9012"], False, [re.compile(r"(?:PROJ|OPS)-(\d+)"), re.compile(r"#(\d+)")])
+
+        # Act / Assert
+        self.assertEqual(["1234", "9012"], target.match_commit_message("PROJ-1234: Fix OTHER-5678 and #9012 (not PROJ-12345)"))
+        self.assertEqual(["5678"], target.match_branch_name("feature/OPS-5678-and-more"))
+        self.assertEqual([], target.match_branch_name("feature/PROJ-56789"))
+
+
+    def test_matches_the_same_as_checking_each_item_number(self):
+        # Arrange
+        item_numbers = ["ITEM-1", "ITEM-12", "", "2-I", "ITEM-12|", "12"]
+        texts = ["", "ITEM-12", "a/ITEM-12|b", "ITEM-1-ITEM-2-I", "no numbers", "12|"]
+
+        for strip_characters_from_item_numbers in [False, True]:
+            target = ItemNumberMatcher(item_numbers, strip_characters_from_item_numbers)
+
+            for text in texts:
+                # Act
+                branch_name_result = target.match_branch_name(text)
+                commit_message_result = target.match_commit_message(text)
+
+                # Assert
+                tokens = text
+                branch_tokens = text + '|'
+                if strip_characters_from_item_numbers:
+                    tokens = re.sub(r"\D+", '-', text).strip('-').split('-')
+                    branch_tokens = [token + '|' for token in tokens]
+
+                self.assertEqual([item_number for item_number in item_numbers if item_number + '|' in branch_tokens], branch_name_result)
+                self.assertEqual([item_number for item_number in item_numbers if item_number in tokens], commit_message_result)
+
+
+class TestExtractItemNumbers(unittest.TestCase):
+    def test_uses_first_matched_capture_group_or_whole_match(self):
+        # Arrange
+        item_number_patterns = [re.compile(r"(?:PROJ-(\d+)|OPS-(\d+))"), re.compile(r"HOTFIX-\d+")]
+
+        # Act
+        result = extract_item_numbers(item_number_patterns, "PROJ-12 OPS-34 HOTFIX-56")
+
+        # Assert
+        self.assertEqual(["12", "34", "HOTFIX-56"], result)
+
+
+class TestTextOutputWriter(unittest.TestCase):
+    @patch('builtins.print')
+    def test_writes_same_sections_to_terminal_and_txt_file(self, mock_print: MagicMock):
+        with tempfile.TemporaryDirectory() as path:
+            # Arrange
+            txt_filename = os.path.join(path, "output.txt")
+
+            # Act
+            with TextOutputWriter(True, txt_filename) as target:
+                target.write_section("Found 2 related commits")
+                target.write_section("First")
+                target.write(" section")
+                target.write_section("Second section")
+
+            # Assert
+            with open(txt_filename) as file:
+                self.assertEqual("Found 2 related commits\nFirst section\nSecond section", file.read())
+            self.assertEqual("\nFound 2 related commits\nFirst section\nSecond section\n", join_printed_calls(mock_print.call_args_list))
+
+
+    @patch('builtins.print')
+    def test_writes_nothing_when_disabled(self, mock_print: MagicMock):
+        # Act
+        with TextOutputWriter(False) as target:
+            target.write_section("Found 2 related commits")
+
+        # Assert
+        self.assertFalse(target.is_enabled)
+        mock_print.assert_not_called()
+
+
+class TestWidgetPool(unittest.TestCase):
+    def test_reuses_released_widgets_of_the_same_kind(self):
+        # Arrange
+        target = WidgetPool(lambda kind: Mock(kind=kind), 10)
+        header = target.acquire("header")
+        target.release("header", header)
+
+        # Act
+        reused_header = target.acquire("header")
+        label = target.acquire("label")
+
+        # Assert
+        self.assertIs(header, reused_header)
+        self.assertEqual("label", label.kind)
+        self.assertEqual(2, target.live_widget_count)
+        header.pack_forget.assert_called_once()
+
+
+    def test_live_widget_count_stays_flat_across_refreshes(self):
+        # Arrange
+        target = WidgetPool(lambda kind: Mock(), 50)
+        live_widget_counts = []
+
+        # Act
+        for row_count in [50, 20, 50, 35, 50]:
+            displayed_widgets = [target.acquire("commit") for _ in range(row_count)]
+            for widget in displayed_widgets:
+                target.release("commit", widget)
+
+            live_widget_counts.append(target.live_widget_count)
+
+        # Assert
+        self.assertEqual([50, 50, 50, 50, 50], live_widget_counts)
+
+
+    def test_destroys_released_widgets_past_max_free_widgets(self):
+        # Arrange
+        target = WidgetPool(lambda kind: Mock(), 2)
+        widgets = [target.acquire("commit") for _ in range(3)]
+
+        # Act
+        for widget in widgets:
+            target.release("commit", widget)
+
+        # Assert
+        self.assertEqual(2, target.live_widget_count)
+        widgets[0].destroy.assert_not_called()
+        widgets[1].destroy.assert_not_called()
+        widgets[2].destroy.assert_called_once()
+
+
+    def test_destroy_free_widgets_only_destroys_the_kind(self):
+        # Arrange
+        target = WidgetPool(lambda kind: Mock(), 10)
+        commit_entry = target.acquire("commit")
+        header = target.acquire("header")
+        target.release("commit", commit_entry)
+        target.release("header", header)
+
+        # Act
+        target.destroy_free_widgets("commit")
+
+        # Assert
+        commit_entry.destroy.assert_called_once()
+        header.destroy.assert_not_called()
+        self.assertEqual(1, target.live_widget_count)
+        self.assertIsNot(commit_entry, target.acquire("commit"))
+
+
+class TestOutputFrameFetchCommits(unittest.TestCase):
+    def test_ends_commit_queue_when_connecting_to_github_raises(self):
+        # Arrange
+        target = Mock()
+        target.commit_queue = queue.Queue()
+        target.tab_view.app_root.git_the_commits.get_github_objects.side_effect = GithubException(status=500, data="Server Error")
+
+        # Act
+        with self.assertRaises(GithubException):
+            OutputFrame.fetch_commits(target)
+
+        # Assert
+        queued_items = [target.commit_queue.get_nowait() for _ in range(target.commit_queue.qsize())]
+        self.assertEqual(2, len(queued_items))
+        self.assertTrue(queued_items[0].startswith("Fetching commits failed: "))
+        self.assertIsNone(queued_items[1])
+        self.assertIsNone(target.fetched_commits)
+
+
+class TestCommitsFrame(unittest.TestCase):
+    def test_row_position_and_y_go_by_row_heights(self):
+        # Arrange
+        row_tops = [0, 40, 100, 110]
+
+        # Act / Assert
+        self.assertEqual(1.5, CommitsFrame.get_row_position(row_tops, 70))
+        self.assertEqual(2.0, CommitsFrame.get_row_position(row_tops, 100))
+        self.assertEqual(3.0, CommitsFrame.get_row_position(row_tops, 500))
+        self.assertEqual(70, CommitsFrame.get_row_y(row_tops, 1.5))
+        self.assertEqual(110, CommitsFrame.get_row_y(row_tops, 3))
+
+
+    def test_shifting_rows_keeps_the_rows_in_view_in_place(self):
+        # Arrange
+        def generate_displayed_elements(heights: list[int]) -> list[tuple[int, Mock]]:
+            displayed_elements = []
+            y = 0
+            for height in heights:
+                widget = Mock()
+                widget.winfo_y.return_value = y
+                displayed_elements.append((CommitsFrame.COMMIT, widget))
+                y += height
+            return displayed_elements
+
+        target = Mock()
+        target.ROWS_PER_WINDOW = 3
+        target.rows = [(CommitsFrame.COMMIT, None)] * 5
+        target.first_row_index = 0
+        target.displayed_elements = generate_displayed_elements([30, 200, 50])
+        target.get_row_tops = lambda: CommitsFrame.get_row_tops(target)
+        target.winfo_reqheight.return_value = 280
+        target._parent_canvas.canvasy.return_value = 250
+
+        def display_rows():
+            target.displayed_elements = generate_displayed_elements([50, 80, 20])
+        target.display_rows.side_effect = display_rows
+
+        # Act
+        CommitsFrame.shift_rows(target, 2)
+
+        # Assert
+        self.assertEqual(2, target.first_row_index)
+        target.scroll_to_y.assert_called_once_with(20)
+        self.assertFalse(target.is_shifting_rows)
+
+
+class TestCommitCache(unittest.TestCase):
+    def test_saves_and_returns_pull_requests_newest_first(self):
+        # Arrange
+        target = CommitCache(":memory:")
+
+        # Act
+        target.save_pull_request("user/repo", "develop", generate_pull_request_record(1, "ITEM-1234"))
+        target.save_pull_request("user/repo", "develop", generate_pull_request_record(3, "ITEM-2345"))
+        target.save_pull_request("user/repo", "main", generate_pull_request_record(2, "ITEM-3456"))
+
+        # Assert
+        result = target.get_pull_requests("user/repo", "develop")
+        self.assertEqual([3, 1], [pull_request.number for pull_request in result])
+        self.assertEqual("ITEM-2345", result[0].head_ref)
+        self.assertEqual([2], [pull_request.number for pull_request in target.get_pull_requests("user/repo", "main")])
+
+
+    def test_sync_state_defaults_to_empty(self):
+        # Arrange
+        target = CommitCache(":memory:")
+
+        # Act
+        result = target.get_sync_state("user/repo", "develop")
+
+        # Assert
+        self.assertEqual(SyncState(), result)
+
+
+    def test_saves_and_returns_sync_state(self):
+        # Arrange
+        sync_state = SyncState(
+            last_pull_request_updated_at=datetime(2024, 1, 12, tzinfo=timezone.utc), 
+            last_pull_request_number=5, 
+            pull_request_history_since=datetime(2023, 6, 1, tzinfo=timezone.utc), 
+            last_commit_sha="sha1", 
+            commit_history_since=datetime(2023, 1, 1, tzinfo=timezone.utc)
+        )
+
+        target = CommitCache(":memory:")
+
+        # Act
+        target.save_sync_state("user/repo", "develop", sync_state)
+
+        # Assert
+        self.assertEqual(sync_state, target.get_sync_state("user/repo", "develop"))
+        self.assertEqual(SyncState(), target.get_sync_state("user/repo", "main"))
+
+
+    def test_pull_request_commits_are_none_until_saved(self):
+        # Arrange
+        target = CommitCache(":memory:")
+        target.save_pull_request("user/repo", "develop", generate_pull_request_record(1, "ITEM-1234"))
+
+        # Act
+        result = target.get_pull_request_commits("user/repo", "develop", 1)
+
+        # Assert
+        self.assertIsNone(result)
+
+
+    def test_saves_and_returns_pull_request_commits_in_order(self):
+        # Arrange
+        commit_1 = CommitRecord("sha1", "first", "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), "www.google.com/1", 1)
+        commit_2 = CommitRecord("sha2", "second", "Uni", "uni@test.py", datetime(2024, 1, 13, tzinfo=timezone.utc), "www.google.com/2", 2)
+
+        target = CommitCache(":memory:")
+        target.save_pull_request("user/repo", "develop", generate_pull_request_record(1, "ITEM-1234"))
+
+        # Act
+        target.save_pull_request_commits("user/repo", "develop", 1, [commit_1, commit_2])
+
+        # Assert
+        self.assertEqual([commit_1, commit_2], target.get_pull_request_commits("user/repo", "develop", 1))
+
+
+    def test_updating_pull_request_keeps_saved_commits(self):
+        # Arrange
+        commit = CommitRecord("sha1", "first", "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), "www.google.com/1", 1)
+
+        target = CommitCache(":memory:")
+        target.save_pull_request("user/repo", "develop", generate_pull_request_record(1, "ITEM-1234"))
+        target.save_pull_request_commits("user/repo", "develop", 1, [commit])
+
+        # Act
+        target.save_pull_request("user/repo", "develop", generate_pull_request_record(1, "ITEM-1234-renamed"))
+
+        # Assert
+        self.assertEqual("ITEM-1234-renamed", target.get_pull_requests("user/repo", "develop")[0].head_ref)
+        self.assertEqual([commit], target.get_pull_request_commits("user/repo", "develop", 1))
+
+
+    def test_branch_commits_are_returned_newest_first_across_syncs(self):
+        # Arrange
+        commit_1 = CommitRecord("sha1", "first", "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), "www.google.com/1", 1)
+        commit_2 = CommitRecord("sha2", "second", "Uni", "uni@test.py", datetime(2024, 1, 13, tzinfo=timezone.utc), "www.google.com/2", 1)
+        commit_3 = CommitRecord("sha3", "third", "Uni", "uni@test.py", datetime(2024, 1, 14, tzinfo=timezone.utc), "www.google.com/3", 1)
+
+        target = CommitCache(":memory:")
+        target.save_branch_commits("user/repo", "develop", [commit_2, commit_1])
+
+        # Act
+        target.save_branch_commits("user/repo", "develop", [commit_3])
+
+        # Assert
+        self.assertEqual([commit_3, commit_2, commit_1], target.get_branch_commits("user/repo", "develop"))
+        self.assertEqual([commit_3, commit_2], target.get_branch_commits("user/repo", "develop", since=datetime(2024, 1, 13, tzinfo=timezone.utc)))
+
+
+    def test_replacing_branch_commits_drops_stored_history(self):
+        # Arrange
+        commit_1 = CommitRecord("sha1", "first", "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), "www.google.com/1", 1)
+        commit_2 = CommitRecord("sha2", "second", "Uni", "uni@test.py", datetime(2024, 1, 13, tzinfo=timezone.utc), "www.google.com/2", 1)
+
+        target = CommitCache(":memory:")
+        target.save_branch_commits("user/repo", "develop", [commit_1])
+
+        # Act
+        target.save_branch_commits("user/repo", "develop", [commit_2], replace=True)
+
+        # Assert
+        self.assertEqual([commit_2], target.get_branch_commits("user/repo", "develop"))
+
+
+    def test_branch_commit_pull_request_urls_are_none_until_saved(self):
+        # Arrange
+        commit = CommitRecord("sha1", "first", "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), "www.google.com/1", 1)
+
+        target = CommitCache(":memory:")
+        target.save_branch_commits("user/repo", "develop", [commit])
+
+        # Act & Assert
+        self.assertIsNone(target.get_branch_commit_pull_request_urls("user/repo", "develop", "sha1"))
+        target.save_branch_commit_pull_request_urls("user/repo", "develop", "sha1", ["www.google.com/pr/1"])
+        self.assertEqual(["www.google.com/pr/1"], target.get_branch_commit_pull_request_urls("user/repo", "develop", "sha1"))
+
+
+    def test_saves_and_returns_http_response(self):
+        # Arrange
+        target = CommitCache(":memory:")
+
+        # Act
+        target.save_http_response("/repos/user/repo/pulls application/json", '"etag"', None, { "Link": "<next>" }, "[]")
+        result = target.get_http_response("/repos/user/repo/pulls application/json")
+
+        # Assert
+        self.assertEqual(('"etag"', None, { "Link": "<next>" }, "[]"), result)
+        self.assertIsNone(target.get_http_response("/repos/user/repo/commits application/json"))
+
+
+class TestItemNumberIndex(unittest.TestCase):
+    def test_finds_pull_requests_by_whole_number_when_stripping_characters(self):
+        # Arrange
+        target = ItemNumberIndex(True)
+        target.add_pull_request(generate_pull_request_record(1, "ITEM-1234"))
+        target.add_pull_request(generate_pull_request_record(2, "ITEM-12345"))
+        target.add_pull_request(generate_pull_request_record(3, "feature/ITEM-1234-and-more"))
+
+        # Act
+        result = target.get_pull_requests("1234")
+
+        # Assert
+        self.assertEqual([3, 1], [pull_request.number for pull_request in result])
+        self.assertEqual([], target.get_pull_requests("123"))
+
+
+    def test_finds_pull_requests_ending_with_item_number_when_keeping_characters(self):
+        # Arrange
+        target = ItemNumberIndex(False)
+        target.add_pull_request(generate_pull_request_record(1, "ITEM-1234"))
+        target.add_pull_request(generate_pull_request_record(2, "ITEM-12345"))
+        target.add_pull_request(generate_pull_request_record(3, "feature/ITEM-1234"))
+
+        # Act
+        result = target.get_pull_requests("ITEM-1234")
+
+        # Assert
+        self.assertEqual([3, 1], [pull_request.number for pull_request in result])
+
+        # Pull requests added after a lookup are indexed too
+        target.add_pull_request(generate_pull_request_record(4, "bugfix/ITEM-1234"))
+        self.assertEqual([4, 3, 1], [pull_request.number for pull_request in target.get_pull_requests("ITEM-1234")])
+
+
+    def test_re_adding_pull_request_replaces_old_tokens(self):
+        # Arrange
+        target = ItemNumberIndex(True)
+        target.add_pull_request(generate_pull_request_record(1, "ITEM-1234"))
+
+        # Act
+        target.add_pull_request(generate_pull_request_record(1, "ITEM-2345"))
+
+        # Assert
+        self.assertEqual([], target.get_pull_requests("1234"))
+        self.assertEqual([1], [pull_request.number for pull_request in target.get_pull_requests("2345")])
+
+
+    def test_finds_commits_newest_first(self):
+        # Arrange
+        commit_1 = CommitRecord("sha1", "ITEM-1234 first", "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), "www.google.com/1", 1)
+        commit_2 = CommitRecord("sha2", "ITEM-12345", "Uni", "uni@test.py", datetime(2024, 1, 13, tzinfo=timezone.utc), "www.google.com/2", 1)
+        commit_3 = CommitRecord("sha3", "ITEM-1234 second", "Uni", "uni@test.py", datetime(2024, 1, 14, tzinfo=timezone.utc), "www.google.com/3", 1)
+
+        target = ItemNumberIndex(True)
+        target.add_commits([commit_2, commit_1])
+
+        # Act
+        target.add_commits([commit_3])
+
+        # Assert
+        self.assertEqual([commit_3, commit_1], target.get_commits("1234"))
+
+
+    def test_tokenizes_the_same_as_item_number_matcher(self):
+        # Arrange
+        item_number_patterns = [re.compile(r"(?:PROJ|OPS)-(\d+)")]
+        texts = ["feature/PROJ-123-OPS-45", "ITEM-1234: fix 2 bugs", "no digits here"]
+
+        # Act / Assert
+        for patterns in ([], item_number_patterns):
+            target = ItemNumberIndex(True, patterns)
+            item_number_matcher = ItemNumberMatcher([], True, patterns)
+            for text in texts:
+                self.assertEqual(item_number_matcher.get_tokens(text), target.tokenize(text))
+
+
+class TestFetchCommitsWithCache(unittest.IsolatedAsyncioTestCase):
+    async def test_first_run_caches_pull_requests_and_matching_commits(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(2, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_2 = generate_listed_pull_request(1, "ITEM-9999", [generate_listed_commit("1234567890123456789012345678901234567890")])
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request_1, mock_pull_request_2]
+
+        target = generate_cached_target(mock_repo)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(["0987654321098765432109876543210987654321"], [commit.sha for commit in target.commit_list])
+        self.assertEqual("1234", target.commit_list[0].item_number)
+        self.assertEqual("www.google.com/pr/2", target.commit_list[0].pr_url)
+        self.assertEqual([2, 1], [pull_request.number for pull_request in target.commit_cache.get_pull_requests("user/repo", "develop")])
+        self.assertIsNotNone(target.commit_cache.get_pull_request_commits("user/repo", "develop", 2))
+        self.assertIsNone(target.commit_cache.get_pull_request_commits("user/repo", "develop", 1))
+        mock_pull_request_2.get_commits.assert_not_called()
+
+
+    async def test_repeat_run_only_fetches_pull_requests_updated_since_last_sync(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_1.updated_at = datetime(2024, 1, 12, tzinfo=timezone.utc)
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-1234", [generate_listed_commit("1234567890123456789012345678901234567890")])
+        mock_pull_request_2.updated_at = datetime(2024, 1, 13, tzinfo=timezone.utc)
+        mock_pull_request_0 = generate_listed_pull_request(0, "ITEM-1234", [])
+        mock_pull_request_0.updated_at = datetime(2024, 1, 11, tzinfo=timezone.utc)
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request_1]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        await first_run.fetch_commits()
+
+        mock_repo.get_pulls.return_value = [mock_pull_request_2, mock_pull_request_1, mock_pull_request_0]
+        mock_pull_request_1.get_commits.reset_mock()
+        target = generate_cached_target(mock_repo, commit_cache)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(2, len(target.commit_list))
+        mock_pull_request_1.get_commits.assert_not_called()
+        mock_pull_request_2.get_commits.assert_called_once()
+        mock_repo.get_pull.assert_not_called()
+        mock_repo.get_pulls.assert_called_with(state="closed", base="develop", sort="updated", direction="desc")
+        self.assertEqual([2, 1], [pull_request.number for pull_request in commit_cache.get_pull_requests("user/repo", "develop")])
+        self.assertEqual(datetime(2024, 1, 13, tzinfo=timezone.utc), commit_cache.get_sync_state("user/repo", "develop").last_pull_request_updated_at)
+        self.assertEqual(2, commit_cache.get_sync_state("user/repo", "develop").last_pull_request_number)
+
+
+    async def test_fetches_commits_for_cached_pull_request_matching_new_item_number(self):
+        # Arrange
+        mock_pull_request = generate_listed_pull_request(1, "ITEM-2345", [generate_listed_commit("0987654321098765432109876543210987654321")])
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request]
+        mock_repo.get_pull.return_value = mock_pull_request
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        await first_run.fetch_commits()
+
+        mock_repo.get_pulls.return_value = []
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.item_numbers = ["2345"]
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual("2345", target.commit_list[0].item_number)
+        mock_repo.get_pull.assert_called_once_with(1)
+
+
+    async def test_pull_request_closed_after_last_sync_is_picked_up(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_1.updated_at = datetime(2024, 1, 12, tzinfo=timezone.utc)
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-1234", [generate_listed_commit("1234567890123456789012345678901234567890")])
+        mock_pull_request_2.updated_at = datetime(2024, 1, 13, tzinfo=timezone.utc)
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request_2]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        await first_run.fetch_commits()
+
+        # Pull request 1 was still open during the first run
+        mock_pull_request_1.updated_at = datetime(2024, 1, 14, tzinfo=timezone.utc)
+        mock_repo.get_pulls.return_value = [mock_pull_request_1, mock_pull_request_2]
+        target = generate_cached_target(mock_repo, commit_cache)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(2, len(target.commit_list))
+        mock_pull_request_1.get_commits.assert_called_once()
+
+
+    async def test_requery_with_different_item_numbers_reuses_index(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-2345", [generate_listed_commit("1234567890123456789012345678901234567890")])
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request_2, mock_pull_request_1]
+
+        target = generate_cached_target(mock_repo)
+        await target.fetch_commits()
+        item_number_index = target.item_number_index
+
+        mock_repo.get_pulls.return_value = []
+        mock_repo.get_pull.return_value = mock_pull_request_2
+        target.commit_list = []
+        target.item_commit_dictionary = dict()
+        target.item_numbers = ["2345"]
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertIs(item_number_index, target.item_number_index)
+        self.assertEqual(["1234567890123456789012345678901234567890"], [commit.sha for commit in target.commit_list])
+        self.assertEqual("2345", target.commit_list[0].item_number)
+        mock_repo.get_pull.assert_called_once_with(2)
+
+
+    async def test_sync_stops_listing_at_search_date_limit(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-1234", [])
+        mock_pull_request_2.updated_at = (datetime.today() - relativedelta(months=2)).replace(tzinfo=timezone.utc)
+
+        def list_pull_requests():
+            yield mock_pull_request_1
+            yield mock_pull_request_2
+            raise AssertionError("Pull requests past the search date limit should not be listed")
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = list_pull_requests()
+
+        target = generate_cached_target(mock_repo)
+        target.search_date_limit = (datetime.today() - relativedelta(months=1)).replace(tzinfo=timezone.utc)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        self.assertEqual([1], [pull_request.number for pull_request in target.commit_cache.get_pull_requests("user/repo", "develop")])
+        self.assertEqual(target.search_date_limit, target.commit_cache.get_sync_state("user/repo", "develop").pull_request_history_since)
+
+
+    async def test_sync_resyncs_when_search_date_limit_widens(self):
+        # Arrange
+        mock_pull_request_1 = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request_2 = generate_listed_pull_request(2, "ITEM-1234", [generate_listed_commit("1234567890123456789012345678901234567890")])
+        mock_pull_request_2.created_at = (datetime.today() - relativedelta(months=2)).replace(tzinfo=timezone.utc)
+        mock_pull_request_2.updated_at = (datetime.today() - relativedelta(months=2)).replace(tzinfo=timezone.utc)
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request_1, mock_pull_request_2]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.search_date_limit = (datetime.today() - relativedelta(months=1)).replace(tzinfo=timezone.utc)
+        await first_run.fetch_commits()
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.search_date_limit = (datetime.today() - relativedelta(months=3)).replace(tzinfo=timezone.utc)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(2, len(target.commit_list))
+        self.assertEqual(target.search_date_limit, commit_cache.get_sync_state("user/repo", "develop").pull_request_history_since)
+
+
+    async def test_skips_unmerged_cached_pull_requests(self):
+        # Arrange
+        mock_pull_request = generate_listed_pull_request(1, "ITEM-1234", [generate_listed_commit("0987654321098765432109876543210987654321")])
+        mock_pull_request.merged_at = None
+
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = [mock_pull_request]
+
+        target = generate_cached_target(mock_repo)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(0, len(target.commit_list))
+        mock_pull_request.get_commits.assert_not_called()
+
+
+    async def test_commit_history_first_run_caches_branch_history(self):
+        # Arrange
+        mock_commit_1 = generate_listed_commit("0987654321098765432109876543210987654321", "commit for ITEM-1234")
+        mock_commit_1.get_pulls.return_value = [generate_listed_pull_request(1, "ITEM-1234", [])]
+        mock_commit_2 = generate_listed_commit("1234567890123456789012345678901234567890", "unrelated commit")
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit_1, mock_commit_2]
+
+        target = generate_cached_target(mock_repo)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(["0987654321098765432109876543210987654321"], [commit.sha for commit in target.commit_list])
+        self.assertEqual("www.google.com/pr/1", target.commit_list[0].pr_url)
+        self.assertEqual(2, len(target.commit_cache.get_branch_commits("user/repo", "develop")))
+        self.assertEqual("0987654321098765432109876543210987654321", target.commit_cache.get_sync_state("user/repo", "develop").last_commit_sha)
+        mock_commit_2.get_pulls.assert_not_called()
+
+
+    async def test_commit_history_repeat_run_only_fetches_commits_since_last_sync(self):
+        # Arrange
+        mock_commit_1 = generate_listed_commit("0987654321098765432109876543210987654321", "commit for ITEM-1234")
+        mock_commit_1.get_pulls.return_value = [generate_listed_pull_request(1, "ITEM-1234", [])]
+        mock_commit_2 = generate_listed_commit("1234567890123456789012345678901234567890", "second commit for ITEM-1234")
+        mock_commit_2.get_pulls.return_value = [generate_listed_pull_request(2, "ITEM-1234", [])]
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit_1]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.use_pull_requests = False
+        first_run.use_commit_history = True
+        first_run.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+        await first_run.fetch_commits()
+
+        mock_repo.get_commits.reset_mock()
+        mock_repo.compare.return_value = generate_comparison("ahead", [mock_commit_2])
+        mock_commit_1.get_pulls.reset_mock()
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.github_target_branch = generate_branch("1234567890123456789012345678901234567890")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(2, len(target.commit_list))
+        self.assertEqual(["1234567890123456789012345678901234567890", "0987654321098765432109876543210987654321"], 
+                         [commit.sha for commit in commit_cache.get_branch_commits("user/repo", "develop")])
+        mock_commit_1.get_pulls.assert_not_called()
+        mock_repo.get_commit.assert_not_called()
+        mock_repo.get_commits.assert_not_called()
+        mock_repo.compare.assert_called_once_with("0987654321098765432109876543210987654321", "1234567890123456789012345678901234567890")
+
+
+    async def test_commit_history_repeat_run_without_new_commits_skips_listing(self):
+        # Arrange
+        mock_commit = generate_listed_commit("0987654321098765432109876543210987654321", "commit for ITEM-1234")
+        mock_commit.get_pulls.return_value = []
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.use_pull_requests = False
+        first_run.use_commit_history = True
+        first_run.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+        await first_run.fetch_commits()
+        mock_repo.get_commits.reset_mock()
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(1, len(target.commit_list))
+        mock_repo.get_commits.assert_not_called()
+
+
+    async def test_commit_history_resyncs_when_last_synced_commit_is_gone(self):
+        # Arrange
+        mock_commit_1 = generate_listed_commit("0987654321098765432109876543210987654321", "commit for ITEM-1234")
+        mock_commit_1.get_pulls.return_value = []
+        mock_commit_2 = generate_listed_commit("1234567890123456789012345678901234567890", "rewritten commit for ITEM-1234")
+        mock_commit_2.get_pulls.return_value = []
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit_1]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.use_pull_requests = False
+        first_run.use_commit_history = True
+        first_run.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+        await first_run.fetch_commits()
+
+        mock_repo.get_commits.return_value = [mock_commit_2]
+        mock_repo.compare.return_value = generate_comparison("diverged", [mock_commit_2])
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.github_target_branch = generate_branch("1234567890123456789012345678901234567890")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(["1234567890123456789012345678901234567890"], [commit.sha for commit in target.commit_list])
+        self.assertEqual(["1234567890123456789012345678901234567890"], 
+                         [commit.sha for commit in commit_cache.get_branch_commits("user/repo", "develop")])
+
+
+    async def test_commit_history_resync_after_force_push_is_limited_to_search_date_limit(self):
+        # Arrange
+        search_date_limit = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        mock_commit_1 = generate_listed_commit("0987654321098765432109876543210987654321", "commit for ITEM-1234")
+        mock_commit_1.get_pulls.return_value = []
+        mock_commit_2 = generate_listed_commit("1234567890123456789012345678901234567890", "rewritten commit for ITEM-1234")
+        mock_commit_2.get_pulls.return_value = []
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit_1]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.use_pull_requests = False
+        first_run.use_commit_history = True
+        first_run.search_date_limit = search_date_limit
+        first_run.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+        await first_run.fetch_commits()
+
+        mock_repo.get_commits.reset_mock()
+        mock_repo.get_commits.return_value = [mock_commit_2]
+        mock_repo.compare.side_effect = GithubException(404, "Not Found")
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.search_date_limit = search_date_limit
+        target.github_target_branch = generate_branch("1234567890123456789012345678901234567890")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        mock_repo.get_commits.assert_called_once_with(sha="1234567890123456789012345678901234567890", since=search_date_limit)
+        self.assertEqual(["1234567890123456789012345678901234567890"], [commit.sha for commit in target.commit_list])
+        self.assertEqual(search_date_limit, commit_cache.get_sync_state("user/repo", "develop").commit_history_since)
+
+
+    async def test_commit_history_repeat_run_finds_older_commits_brought_in_by_merge(self):
+        # Arrange
+        # A feature commit F dated before the last synced commit B, merged into the branch by M afterwards.
+        # Listed newest first the branch reads M, B, F, A, so walking it until B would never reach F
+        mock_commit_a = generate_listed_commit("a" * 40, "initial commit")
+        mock_commit_b = generate_listed_commit("b" * 40, "main commit")
+        mock_commit_f = generate_listed_commit("f" * 40, "ITEM-1234 feature commit")
+        mock_commit_f.get_pulls.return_value = []
+        mock_commit_m = generate_listed_commit("c" * 40, "Merge branch 'feature'")
+        mock_commit_m.parents = [Mock(), Mock()]
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit_b, mock_commit_a]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.use_pull_requests = False
+        first_run.use_commit_history = True
+        first_run.github_target_branch = generate_branch("b" * 40)
+        await first_run.fetch_commits()
+
+        mock_repo.compare.return_value = generate_comparison("ahead", [mock_commit_f, mock_commit_m])
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.github_target_branch = generate_branch("c" * 40)
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(["f" * 40], [commit.sha for commit in target.commit_list])
+        self.assertEqual(["c" * 40, "f" * 40, "b" * 40, "a" * 40], 
+                         [commit.sha for commit in commit_cache.get_branch_commits("user/repo", "develop")])
+
+
+    async def test_commit_history_resyncs_when_comparison_is_truncated(self):
+        # Arrange
+        mock_commit_1 = generate_listed_commit("0987654321098765432109876543210987654321", "commit for ITEM-1234")
+        mock_commit_1.get_pulls.return_value = []
+        mock_commit_2 = generate_listed_commit("1234567890123456789012345678901234567890", "second commit for ITEM-1234")
+        mock_commit_2.get_pulls.return_value = []
+
+        mock_repo = Mock()
+        mock_repo.get_commits.return_value = [mock_commit_1]
+
+        commit_cache = CommitCache(":memory:")
+        first_run = generate_cached_target(mock_repo, commit_cache)
+        first_run.use_pull_requests = False
+        first_run.use_commit_history = True
+        first_run.github_target_branch = generate_branch("0987654321098765432109876543210987654321")
+        await first_run.fetch_commits()
+
+        mock_repo.get_commits.return_value = [mock_commit_2, mock_commit_1]
+        mock_repo.compare.return_value = generate_comparison("ahead", [mock_commit_2], ahead_by=10001)
+
+        target = generate_cached_target(mock_repo, commit_cache)
+        target.use_pull_requests = False
+        target.use_commit_history = True
+        target.github_target_branch = generate_branch("1234567890123456789012345678901234567890")
+
+        # Act
+        await target.fetch_commits()
+
+        # Assert
+        self.assertEqual(2, len(target.commit_list))
+        self.assertEqual(["1234567890123456789012345678901234567890", "0987654321098765432109876543210987654321"], 
+                         [commit.sha for commit in commit_cache.get_branch_commits("user/repo", "develop")])
+
+
+# Helper Section
+@dataclass
+class GitCommitDetails(object):
+    """A DTO used to generate fake GitCommits"""
+    
+    message: str
+    name: str
+    email: str
+    date: str
+    sha: str
+    html_url: str
+    num_parents: int
+    completed: bool
+    first_parent_sha: str = ""
+
+
+def get_random_sha():
+    return str(randint(1000000000000000000000000000000000000000, 9999999999999999999999999999999999999999))
+
+
+def generate_git_commit_object(details: GitCommitDetails):
+    requester = Requester(Auth.Token("FakeToken"), "https://www.github.com", 123, "user_agent", 10, True, 3, 256)
+    headers = {
+        "IsTest": True
+    }
+
+    parent_commits = []
+    for iteration in range(details.num_parents):
+        parent_sha = details.first_parent_sha if len(details.first_parent_sha) > 0 and iteration == details.num_parents else get_random_sha()
+
+        parent_commit = generate_git_commit_object(
+            GitCommitDetails(
+                f"parent_{uuid.uuid4()}", 
+                "Parent", 
+                "parentcommit@test.py", 
+                datetime.today().replace(tzinfo=timezone.utc).isoformat(), 
+                parent_sha,
+                "www.google.com/parent",
+                0,
+                True
+            )
+        )
+        
+        parent_commits.append(parent_commit.__dict__)
+
+    attributes = {
+        "message": details.message,
+        "author": {
+            "name": details.name,
+            "email": details.email,
+            "date": details.date,
+        },
+        "sha": details.sha,
+        "html_url": details.html_url,
+        "parents": parent_commits
+    }
+
+    return GitCommit(requester, headers, attributes, details.completed)
+
+
+def generate_pull_request_record(number: int, head_ref: str):
+    return PullRequestRecord(
+        number, 
+        head_ref, 
+        True, 
+        datetime(2024, 1, 12, tzinfo=timezone.utc), 
+        datetime(2024, 1, 13, tzinfo=timezone.utc), 
+        datetime(2024, 1, 13, tzinfo=timezone.utc), 
+        f"www.google.com/pr/{number}"
+    )
+
+
+def generate_listed_commit(sha: str, message: str = "This is a test"):
+    git_commit = generate_git_commit_object(
+        GitCommitDetails(message, "Uni", "uni@test.py", "2024-01-12T08:30:02.000Z", sha, "www.google2.com", 1, True)
+    )
+
+    commit_object = Mock()
+    commit_object.sha = sha
+    commit_object.html_url = f"www.google.com/commit/{sha}"
+    commit_object.parents = [Mock()]
+    commit_object.commit = git_commit
+    return commit_object
+
+
+def generate_listed_pull_request(number: int, head_ref: str, commits: list):
+    pull_request = Mock()
+    pull_request.number = number
+    pull_request.head.ref = head_ref
+    pull_request.created_at = datetime.today().replace(tzinfo=timezone.utc)
+    pull_request.updated_at = datetime.today().replace(tzinfo=timezone.utc)
+    pull_request.merged_at = datetime.today().replace(tzinfo=timezone.utc)
+    pull_request.html_url = f"www.google.com/pr/{number}"
+    pull_request.get_commits.return_value = commits
+    return pull_request
+
+
+def generate_branch(head_sha: str):
+    branch = Mock()
+    branch.commit.sha = head_sha
+    return branch
+
+
+def generate_comparison(status: str, commits: list, ahead_by: int = None):
+    comparison = Mock()
+    comparison.status = status
+    comparison.commits = commits
+    comparison.ahead_by = ahead_by if ahead_by is not None else len(commits)
+    return comparison
+
+
+def generate_cached_target(mock_repo, commit_cache: CommitCache = None):
+    target = GitTheCommits(False)
+    target.strip_characters_from_item_numbers = True
+    target.item_numbers = ["1234"]
+    target.use_pull_requests = True
+    target.repository_name = "user/repo"
+    target.target_branch_name = "develop"
+    target.commit_cache = commit_cache if commit_cache is not None else CommitCache(":memory:")
+
+    target.github_repository = mock_repo
+    return target
+
+
+def generate_graphql_commit_node(sha: str, message: str = "This is a test"):
+    return {
+        "oid": sha,
+        "message": message,
+        "url": f"www.google.com/commit/{sha}",
+        "author": { "name": "Uni", "email": "uni@test.py", "date": "2024-01-12T08:30:02Z" },
+        "parents": { "totalCount": 1 }
+    }
+
+
+def generate_graphql_pull_request_node(number: int, head_ref: str, created_at: str, commit_nodes: list):
+    return {
+        "number": number,
+        "headRefName": head_ref,
+        "merged": True,
+        "createdAt": created_at,
+        "updatedAt": created_at,
+        "mergedAt": created_at,
+        "url": f"www.google.com/pr/{number}",
+        "commits": {
+            "pageInfo": { "hasNextPage": False, "endCursor": None },
+            "nodes": [{ "commit": commit_node } for commit_node in commit_nodes]
+        }
+    }
+
+
+def generate_graphql_pull_requests_page(pull_request_nodes: list, end_cursor: str | None):
+    return { "data": { "repository": { "pullRequests": {
+        "pageInfo": { "hasNextPage": end_cursor is not None, "endCursor": end_cursor },
+        "nodes": pull_request_nodes
+    } } } }
+
+
+def generate_commit_record(sha: str, message: str = "This is a test"):
+    return CommitRecord(sha, message, "Uni", "uni@test.py", datetime(2024, 1, 12, tzinfo=timezone.utc), f"www.google.com/commit/{sha}", 1)
+
+
+def generate_local_git_repository(path: str, commits: list[tuple[str, str]]):
+    """Creates a git repository with a develop branch holding the (message, date) commits, oldest first"""
+
+    def git(*arguments, env: dict = None):
+        subprocess.run(["git", "-C", path, "-c", "user.name=Uni", "-c", "user.email=uni@test.py", *arguments], 
+                       check=True, capture_output=True, env={ **os.environ, **(env or {}) })
+
+    git("init", "--initial-branch=develop")
+    for message, date in commits:
+        git("commit", "--allow-empty", "-m", message, env={ "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date })
+
+
+def merge_local_git_branch(path: str, number: int, branch: str, commits: list[tuple[str, str]], merge_message: str = None):
+    """Commits the (message, date) commits on a branch off develop, then merges it into develop the way GitHub merges a pull request"""
+
+    def git(*arguments, env: dict = None):
+        subprocess.run(["git", "-C", path, "-c", "user.name=Uni", "-c", "user.email=uni@test.py", *arguments], 
+                       check=True, capture_output=True, env={ **os.environ, **(env or {}) })
+
+    git("checkout", "-B", branch, "develop")
+    for message, date in commits:
+        git("commit", "--allow-empty", "-m", message, env={ "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date })
+
+    # Merged right after the branch's last commit
+    date = commits[-1][1]
+    git("checkout", "develop")
+    git("merge", "--no-ff", "-m", merge_message or f"Merge pull request #{number} from user/{branch}", branch,
+        env={ "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date })
+
+
+def join_printed_calls(print_calls: list) -> str:
+    """Joins print calls into the text they'd show in the terminal"""
+
+    return "".join(' '.join(str(argument) for argument in print_call.args) + print_call.kwargs.get("end", '\n') 
+                   for print_call in print_calls)
+
+
+def get_written_text(mock_open: MagicMock) -> str:
+    """Joins everything written to a file opened with a patched open"""
+
+    return "".join(write_call.args[0] for write_call in mock_open().write.call_args_list)